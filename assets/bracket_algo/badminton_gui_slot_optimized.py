@@ -3,10 +3,12 @@ import tkinter as tk
 from tkinter import messagebox
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
 import random
 from itertools import combinations
 from collections import defaultdict
+from bracket_core.heatmap import overlap_frame
+from bracket_core.stats import count_meeting_overlap
+from bracket_core.slots import pack_slots
 
 # ===== 알고리즘 (타임슬롯 최적화) =====
 
@@ -64,48 +66,11 @@ def generate_slot_optimized_schedule(num_players):
 
     return schedule, players
 
-def count_meeting_overlap(schedule):
-    meeting_count = defaultdict(lambda: defaultdict(int))
-    for team1, team2 in schedule:
-        group = list(team1 + team2)
-        for i in range(len(group)):
-            for j in range(i + 1, len(group)):
-                a, b = group[i], group[j]
-                meeting_count[a][b] += 1
-                meeting_count[b][a] += 1
-    all_pairs = set()
-    overlap_values = []
-    for a in meeting_count:
-        for b in meeting_count[a]:
-            if (b, a) not in all_pairs:
-                all_pairs.add((a, b))
-                overlap_values.append(meeting_count[a][b])
-    return {
-        "max": max(overlap_values),
-        "avg": round(sum(overlap_values) / len(overlap_values), 2),
-        "total_pairs": len(overlap_values)
-    }
-
 def show_heatmap():
     if not schedule:
         messagebox.showinfo("알림", "먼저 대진표를 생성해주세요.")
         return
-    meeting_count = defaultdict(lambda: defaultdict(int))
-    all_players = set()
-    for team1, team2 in schedule:
-        group = list(team1 + team2)
-        all_players.update(group)
-        for i in range(len(group)):
-            for j in range(i + 1, len(group)):
-                a, b = group[i], group[j]
-                meeting_count[a][b] += 1
-                meeting_count[b][a] += 1
-    sorted_players = sorted(all_players)
-    matrix = pd.DataFrame(0, index=sorted_players, columns=sorted_players)
-    for a in sorted_players:
-        for b in sorted_players:
-            if a != b:
-                matrix.loc[a, b] = meeting_count[a][b]
+    matrix = overlap_frame(schedule)
     plt.figure(figsize=(8, 6))
     sns.heatmap(matrix, annot=True, cmap="YlGnBu", fmt="d", cbar=True)
     plt.title("플레이어 간 중복 매칭 히트맵")
@@ -141,22 +106,9 @@ def display_schedule():
     current_slot_index = 0
 
     max_parallel = num_players // 4
-    used = set()
-    slot = []
-    for game in schedule:
-        game_players = set(game[0] + game[1])
-        if any(p in used for p in game_players):
-            time_slots.append(slot)
-            slot = []
-            used.clear()
-        slot.append(game)
-        used.update(game_players)
-        if len(slot) == max_parallel:
-            time_slots.append(slot)
-            slot = []
-            used.clear()
-    if slot:
-        time_slots.append(slot)
+    # 선수가 겹치는 경기끼리 간선인 그래프를 색칠해 슬롯 수를 최소로
+    time_slots.extend(pack_slots(schedule, max_parallel))
+    schedule = [g for s in time_slots for g in s]   # 목록 · 번호도 슬롯 진행 순서로
 
     text_area.delete("1.0", tk.END)
     for idx, (team1, team2) in enumerate(schedule, start=1):
@@ -3,14 +3,18 @@ import tkinter as tk
 from tkinter import messagebox
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
 import random
 from itertools import combinations
 from collections import defaultdict
+from bracket_core.overlap_index import OverlapIndex
+from bracket_core.local_search import improve
+from bracket_core.slots import pack_slots
+from bracket_core.heatmap import overlap_frame
+from bracket_core.stats import count_meeting_overlap
 
 # ===== 안정적인 중복 최소화 알고리즘 =====
 
-def generate_stable_low_overlap_schedule(num_players, max_pair_overlap=2, max_attempts=1):
+def generate_stable_low_overlap_schedule(num_players, max_pair_overlap=2, max_attempts=1, improve_seconds=0.0):
     players = [f"P{i+1}" for i in range(num_players)]
     required_games_per_player = 4
     total_participations_needed = num_players * required_games_per_player
@@ -24,23 +28,24 @@ def generate_stable_low_overlap_schedule(num_players, max_pair_overlap=2, max_at
         player_game_count = defaultdict(int)
         played_with = defaultdict(lambda: defaultdict(int))
         scheduled_games = []
-
-        def calculate_overlap_score(group):
-            return sum((played_with[a][b] ** 2) for i, a in enumerate(group) for b in group[i+1:])
+        index = OverlapIndex(all_combinations, square=True)   # 제곱 점수 증분 색인
 
         def add_game(group):
             for i in range(4):
                 for j in range(i + 1, 4):
                     played_with[group[i]][group[j]] += 1
                     played_with[group[j]][group[i]] += 1
+            index.bump(group)
             for p in group:
                 player_game_count[p] += 1
+                if player_game_count[p] >= required_games_per_player:
+                    index.kill_player(p)
             scheduled_games.append(group)
 
         while sum(player_game_count.values()) < total_participations_needed:
             slot_games = []
             used_players = set()
-            sorted_groups = sorted(all_combinations, key=calculate_overlap_score)
+            sorted_groups = index.ordered()
             for group in sorted_groups:
                 if len(slot_games) >= max_parallel_games:
                     break
@@ -57,7 +62,7 @@ def generate_stable_low_overlap_schedule(num_players, max_pair_overlap=2, max_at
         while any(player_game_count[p] < required_games_per_player for p in players):
             for p in players:
                 if player_game_count[p] < required_games_per_player:
-                    for group in sorted(all_combinations, key=calculate_overlap_score):
+                    for group in index.ordered():
                         if p in group and all(player_game_count[x] < required_games_per_player for x in group):
                             add_game(group)
                             break
@@ -75,50 +80,17 @@ def generate_stable_low_overlap_schedule(num_players, max_pair_overlap=2, max_at
             best_schedule = list(scheduled_games)
 
     final_result = [(group[:2], group[2:]) for group in best_schedule]
+    if improve_seconds:
+        # 재생성을 더 하는 대신 남은 시간은 최선 대진을 선수/팀 맞바꾸기로 직접 개선
+        slots, _ = improve(pack_slots(final_result, max_parallel_games), improve_seconds)
+        final_result = [g for s in slots for g in s]
     return final_result, players
 
-def count_meeting_overlap(schedule):
-    meeting_count = defaultdict(lambda: defaultdict(int))
-    for team1, team2 in schedule:
-        group = list(team1 + team2)
-        for i in range(len(group)):
-            for j in range(i + 1, len(group)):
-                a, b = group[i], group[j]
-                meeting_count[a][b] += 1
-                meeting_count[b][a] += 1
-    all_pairs = set()
-    overlap_values = []
-    for a in meeting_count:
-        for b in meeting_count[a]:
-            if (b, a) not in all_pairs:
-                all_pairs.add((a, b))
-                overlap_values.append(meeting_count[a][b])
-    return {
-        "max": max(overlap_values),
-        "avg": round(sum(overlap_values) / len(overlap_values), 2),
-        "total_pairs": len(overlap_values)
-    }
-
 def show_heatmap():
     if not schedule:
         messagebox.showinfo("알림", "먼저 대진표를 생성해주세요.")
         return
-    meeting_count = defaultdict(lambda: defaultdict(int))
-    all_players = set()
-    for team1, team2 in schedule:
-        group = list(team1 + team2)
-        all_players.update(group)
-        for i in range(len(group)):
-            for j in range(i + 1, len(group)):
-                a, b = group[i], group[j]
-                meeting_count[a][b] += 1
-                meeting_count[b][a] += 1
-    sorted_players = sorted(all_players)
-    matrix = pd.DataFrame(0, index=sorted_players, columns=sorted_players)
-    for a in sorted_players:
-        for b in sorted_players:
-            if a != b:
-                matrix.loc[a, b] = meeting_count[a][b]
+    matrix = overlap_frame(schedule)
     plt.figure(figsize=(8, 6))
     sns.heatmap(matrix, annot=True, cmap="YlGnBu", fmt="d", cbar=True)
     plt.title("플레이어 간 중복 매칭 히트맵")
@@ -147,29 +119,16 @@ def display_schedule():
         messagebox.showerror("입력 오류", "인원 수는 4 이상 32 이하만 가능합니다.")
         return
 
-    schedule, players = generate_stable_low_overlap_schedule(num_players)
+    schedule, players = generate_stable_low_overlap_schedule(num_players, improve_seconds=0.5)
     wait_list = players.copy()
     playing_list.clear()
     time_slots.clear()
     current_slot_index = 0
 
     max_parallel = num_players // 4
-    used = set()
-    slot = []
-    for game in schedule:
-        game_players = set(game[0] + game[1])
-        if any(p in used for p in game_players):
-            time_slots.append(slot)
-            slot = []
-            used.clear()
-        slot.append(game)
-        used.update(game_players)
-        if len(slot) == max_parallel:
-            time_slots.append(slot)
-            slot = []
-            used.clear()
-    if slot:
-        time_slots.append(slot)
+    # 선수가 겹치는 경기끼리 간선인 그래프를 색칠해 슬롯 수를 최소로
+    time_slots.extend(pack_slots(schedule, max_parallel))
+    schedule = [g for s in time_slots for g in s]   # 목록 · 번호도 슬롯 진행 순서로
 
     text_area.delete("1.0", tk.END)
     for idx, (team1, team2) in enumerate(schedule, start=1):
@@ -1,7 +1,6 @@
 
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
 
 
 import tkinter as tk
@@ -9,6 +8,10 @@ from tkinter import messagebox
 import random
 from itertools import combinations
 from collections import defaultdict
+from bracket_core.overlap_index import OverlapIndex
+from bracket_core.heatmap import overlap_frame
+from bracket_core.stats import count_meeting_overlap
+from bracket_core.slots import pack_slots
 
 def generate_optimized_parallel_schedule(num_players):
     if num_players < 4 or num_players > 32:
@@ -23,16 +26,10 @@ def generate_optimized_parallel_schedule(num_players):
     player_game_count = defaultdict(int)
     played_with = defaultdict(lambda: defaultdict(int))
     scheduled_games = []
-
-    def calculate_overlap_score(group):
-        score = 0
-        for i in range(4):
-            for j in range(i + 1, 4):
-                score += played_with[group[i]][group[j]]
-        return score
+    index = OverlapIndex(all_combinations)   # 슬롯마다 전체 재정렬 대신 증분 갱신
 
     def get_sorted_combinations():
-        return sorted(all_combinations, key=lambda group: calculate_overlap_score(group))
+        return index.ordered()
 
     def can_schedule(group):
         return all(player_game_count[p] < required_games_per_player for p in group)
@@ -42,8 +39,11 @@ def generate_optimized_parallel_schedule(num_players):
             for j in range(i + 1, 4):
                 played_with[group[i]][group[j]] += 1
                 played_with[group[j]][group[i]] += 1
+        index.bump(group)
         for p in group:
             player_game_count[p] += 1
+            if player_game_count[p] >= required_games_per_player:
+                index.kill_player(p)
 
     while len(scheduled_games) < total_games_needed:
         slot_games = []
@@ -80,34 +80,6 @@ def generate_optimized_parallel_schedule(num_players):
 
     return result, players
 
-def count_meeting_overlap(schedule):
-    meeting_count = defaultdict(lambda: defaultdict(int))
-
-    for team1, team2 in schedule:
-        group = list(team1 + team2)
-        for i in range(len(group)):
-            for j in range(i + 1, len(group)):
-                a, b = group[i], group[j]
-                meeting_count[a][b] += 1
-                meeting_count[b][a] += 1
-
-    all_pairs = set()
-    overlap_values = []
-    for a in meeting_count:
-        for b in meeting_count[a]:
-            if (b, a) not in all_pairs:
-                all_pairs.add((a, b))
-                overlap_values.append(meeting_count[a][b])
-
-    if not overlap_values:
-        return {"max": 0, "avg": 0.0, "total_pairs": 0}
-
-    return {
-        "max": max(overlap_values),
-        "avg": round(sum(overlap_values) / len(overlap_values), 2),
-        "total_pairs": len(overlap_values)
-    }
-
 # 상태 변수
 schedule = []
 players = []
@@ -138,22 +110,9 @@ def display_schedule():
 
     max_parallel = num_players // 4
     time_slots.clear()
-    used = set()
-    slot = []
-    for game in schedule:
-        game_players = set(game[0] + game[1])
-        if any(p in used for p in game_players):
-            time_slots.append(slot)
-            slot = []
-            used.clear()
-        slot.append(game)
-        used.update(game_players)
-        if len(slot) == max_parallel:
-            time_slots.append(slot)
-            slot = []
-            used.clear()
-    if slot:
-        time_slots.append(slot)
+    # 선수가 겹치는 경기끼리 간선인 그래프를 색칠해 슬롯 수를 최소로
+    time_slots.extend(pack_slots(schedule, max_parallel))
+    schedule = [g for s in time_slots for g in s]   # 목록 · 번호도 슬롯 진행 순서로
 
     text_area.delete("1.0", tk.END)
     for idx, (team1, team2) in enumerate(schedule, start=1):
@@ -244,25 +203,7 @@ def show_heatmap():
         messagebox.showinfo("알림", "먼저 대진표를 생성해주세요.")
         return
 
-    meeting_count = defaultdict(lambda: defaultdict(int))
-    all_players = set()
-
-    for team1, team2 in schedule:
-        group = list(team1 + team2)
-        all_players.update(group)
-        for i in range(len(group)):
-            for j in range(i + 1, len(group)):
-                a, b = group[i], group[j]
-                meeting_count[a][b] += 1
-                meeting_count[b][a] += 1
-
-    sorted_players = sorted(all_players)
-    matrix = pd.DataFrame(0, index=sorted_players, columns=sorted_players)
-
-    for a in sorted_players:
-        for b in sorted_players:
-            if a != b:
-                matrix.loc[a, b] = meeting_count[a][b]
+    matrix = overlap_frame(schedule)
 
     plt.figure(figsize=(8, 6))
     sns.heatmap(matrix, annot=True, cmap="YlGnBu", fmt="d", cbar=True)
@@ -4,6 +4,8 @@ from tkinter import messagebox
 import random
 from itertools import combinations
 from collections import defaultdict
+from bracket_core.overlap_index import OverlapIndex
+from bracket_core.slots import pack_slots
 
 def generate_optimized_parallel_schedule(num_players):
     if num_players < 4 or num_players > 32:
@@ -18,16 +20,10 @@ def generate_optimized_parallel_schedule(num_players):
     player_game_count = defaultdict(int)
     played_with = defaultdict(lambda: defaultdict(int))
     scheduled_games = []
-
-    def calculate_overlap_score(group):
-        score = 0
-        for i in range(4):
-            for j in range(i + 1, 4):
-                score += played_with[group[i]][group[j]]
-        return score
+    index = OverlapIndex(all_combinations)   # 슬롯마다 전체 재정렬 대신 증분 갱신
 
     def get_sorted_combinations():
-        return sorted(all_combinations, key=lambda group: calculate_overlap_score(group))
+        return index.ordered()
 
     def can_schedule(group):
         return all(player_game_count[p] < required_games_per_player for p in group)
@@ -37,8 +33,11 @@ def generate_optimized_parallel_schedule(num_players):
             for j in range(i + 1, 4):
                 played_with[group[i]][group[j]] += 1
                 played_with[group[j]][group[i]] += 1
+        index.bump(group)
         for p in group:
             player_game_count[p] += 1
+            if player_game_count[p] >= required_games_per_player:
+                index.kill_player(p)
 
     while len(scheduled_games) < total_games_needed:
         slot_games = []
@@ -106,22 +105,9 @@ def display_schedule():
     # 게임을 slot 단위로 그룹화
     max_parallel = num_players // 4
     time_slots.clear()
-    used = set()
-    slot = []
-    for game in schedule:
-        game_players = set(game[0] + game[1])
-        if any(p in used for p in game_players):
-            time_slots.append(slot)
-            slot = []
-            used.clear()
-        slot.append(game)
-        used.update(game_players)
-        if len(slot) == max_parallel:
-            time_slots.append(slot)
-            slot = []
-            used.clear()
-    if slot:
-        time_slots.append(slot)
+    # 선수가 겹치는 경기끼리 간선인 그래프를 색칠해 슬롯 수를 최소로
+    time_slots.extend(pack_slots(schedule, max_parallel))
+    schedule = [g for s in time_slots for g in s]   # 목록 · 번호도 슬롯 진행 순서로
 
     text_area.delete("1.0", tk.END)
     for idx, (team1, team2) in enumerate(schedule, start=1):
@@ -2,9 +2,10 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
-from itertools import combinations
 from collections import defaultdict
 import time
+from bracket_core.dispatch import Dispatcher
+from bracket_core.quads import LiveQuads, QuadSpace
 
 def generate_fully_guaranteed_schedule(num_players):
     if num_players < 4 or num_players > 32:
@@ -17,42 +18,40 @@ def generate_fully_guaranteed_schedule(num_players):
 
     games = []
     used_groups = set()
-    possible_groups = list(combinations(players, 4))
-    random.shuffle(possible_groups)
+    space = QuadSpace(players)              # 목록을 만들지 않는 4명 조합 공간
+    live = LiveQuads(space, random)         # 4경기를 채운 선수는 빠진다
 
     def register_game(group, ignore_limits=False):
         if not ignore_limits:
             for p in group:
                 game_count[p] += 1
                 played_with[p].update(set(group) - {p})
+                if game_count[p] >= 4:
+                    live.drop(p)
         team1 = group[:2]
         team2 = group[2:]
         games.append((team1, team2))
 
-    for group in possible_groups:
+    for group in live:
         if len(games) >= total_games_needed:
             break
         if frozenset(group) in used_groups:
             continue
-        if any(game_count[p] >= 4 for p in group):
-            continue
         overlap = sum(1 for i in range(4) for j in range(i+1, 4) if group[j] in played_with[group[i]])
         if overlap <= 2:
             used_groups.add(frozenset(group))
             register_game(group)
 
-    for group in possible_groups:
+    for group in live:
         if len(games) >= total_games_needed:
             break
         if frozenset(group) in used_groups:
             continue
-        if any(game_count[p] >= 4 for p in group):
-            continue
         used_groups.add(frozenset(group))
         register_game(group)
 
     while len(games) < total_games_needed:
-        for group in possible_groups:
+        for group in space.shuffled(random):
             register_game(group, ignore_limits=True)
             if len(games) >= total_games_needed:
                 break
@@ -65,11 +64,11 @@ players = []
 wait_list = []
 playing_list = []
 finished_games = set()
-game_index_pool = []
+dispatcher = None
 max_parallel_games = 1
 
 def display_schedule():
-    global schedule, players, wait_list, game_index_pool, max_parallel_games
+    global schedule, players, wait_list, dispatcher, max_parallel_games
     try:
         num_players = int(entry.get())
     except ValueError:
@@ -83,11 +82,10 @@ def display_schedule():
 
     wait_list.clear()
     wait_list.extend(players)
-    game_index_pool.clear()
-    game_index_pool.extend(range(len(schedule)))
     finished_games.clear()
     playing_list.clear()
     max_parallel_games = len(players) // 4
+    dispatcher = Dispatcher(schedule, max_parallel_games)
 
     text_area.delete("1.0", tk.END)
     for idx, (team1, team2) in enumerate(schedule, start=1):
@@ -95,40 +93,26 @@ def display_schedule():
         text_area.insert(tk.END, game_text)
 
 def simulate_next_batch():
-    global wait_list, playing_list, finished_games, game_index_pool
-
-    in_game_now = []
-    used_players = set()
-
-    for idx in game_index_pool:
-        if len(in_game_now) >= max_parallel_games:
-            break
-        team1, team2 = schedule[idx]
-        game_players = list(team1 + team2)
-
-        if all(p in wait_list for p in game_players) and not any(p in used_players for p in game_players):
-            in_game_now.append((idx, game_players))
-            used_players.update(game_players)
-
-    for idx, game_players in in_game_now:
+    """빈 코트마다 네 명이 모두 쉬고 있는 다음 경기를 바로 올린다 (묶음 대기 없음)"""
+    for court, idx in dispatcher.start():
+        game_players = list(dispatcher.games[idx])
         for p in game_players:
             wait_list.remove(p)
             playing_list.append(p)
         finished_games.add(idx)
-        status_text.insert(tk.END, f"▶ Game {idx + 1} 진행 중: {', '.join(game_players)}\n")
+        status_text.insert(tk.END, f"▶ Game {idx + 1} 진행 중 (코트 {court + 1}): {', '.join(game_players)}\n")
         status_text.insert(tk.END, f"   대기 인원: {', '.join(wait_list)}\n\n")
         status_text.see(tk.END)
 
-    # 제거된 게임 인덱스 처리
-    game_index_pool = [i for i in game_index_pool if i not in finished_games]
-
-    # 5초 후 종료
-    root.after(5000, lambda: finish_games(in_game_now))
+        # 경기마다 4~5초 뒤 따로 종료
+        root.after(random.randint(4000, 5000),
+                   lambda i=idx, gp=game_players: finish_games([(i, gp)]))
 
 def finish_games(games_to_finish):
     global wait_list, playing_list
 
     for idx, game_players in games_to_finish:
+        dispatcher.finish(idx)
         for p in game_players:
             if p in playing_list:
                 playing_list.remove(p)
@@ -138,10 +122,10 @@ def finish_games(games_to_finish):
         status_text.insert(tk.END, f"   현재 대기 인원: {', '.join(wait_list)}\n\n")
         status_text.see(tk.END)
 
-    if game_index_pool:
-        root.after(500, simulate_next_batch)
-    else:
+    if dispatcher.done:
         status_text.insert(tk.END, "🏁 모든 게임이 완료되었습니다.\n")
+    else:
+        root.after(500, simulate_next_batch)
 
 def start_simulation():
     status_text.delete("1.0", tk.END)
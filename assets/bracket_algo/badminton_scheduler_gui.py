@@ -2,8 +2,8 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
-from itertools import combinations
 from collections import defaultdict
+from bracket_core.quads import LiveQuads, QuadSpace
 
 def generate_fully_guaranteed_schedule(num_players):
     if num_players < 4 or num_players > 32:
@@ -16,45 +16,43 @@ def generate_fully_guaranteed_schedule(num_players):
 
     games = []
     used_groups = set()
-    possible_groups = list(combinations(players, 4))
-    random.shuffle(possible_groups)
+    space = QuadSpace(players)              # 목록을 만들지 않는 4명 조합 공간
+    live = LiveQuads(space, random)         # 4경기를 채운 선수는 빠진다
 
     def register_game(group, ignore_limits=False):
         if not ignore_limits:
             for p in group:
                 game_count[p] += 1
                 played_with[p].update(set(group) - {p})
+                if game_count[p] >= 4:
+                    live.drop(p)
         team1 = group[:2]
         team2 = group[2:]
         games.append((team1, team2))
 
     # 1단계: 이상적 조합 우선
-    for group in possible_groups:
+    for group in live:
         if len(games) >= total_games_needed:
             break
         if frozenset(group) in used_groups:
             continue
-        if any(game_count[p] >= 4 for p in group):
-            continue
         overlap = sum(1 for i in range(4) for j in range(i+1, 4) if group[j] in played_with[group[i]])
         if overlap <= 2:
             used_groups.add(frozenset(group))
             register_game(group)
 
     # 2단계: 조건 완화
-    for group in possible_groups:
+    for group in live:
         if len(games) >= total_games_needed:
             break
         if frozenset(group) in used_groups:
             continue
-        if any(game_count[p] >= 4 for p in group):
-            continue
         used_groups.add(frozenset(group))
         register_game(group)
 
     # 3단계: 무조건 추가
     while len(games) < total_games_needed:
-        for group in possible_groups:
+        for group in space.shuffled(random):
             register_game(group, ignore_limits=True)
             if len(games) >= total_games_needed:
                 break
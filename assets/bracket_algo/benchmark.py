@@ -0,0 +1,389 @@
+# benchmark.py
+# 모든 스케줄러 변형을 같은 조건으로 돌려 비교하는 벤치마크
+# ───────────────────────────────────────────────────────────
+#   python benchmark.py                         # 4‑32명, 시드 0‑2, 결과 → bench_results.json
+#   python benchmark.py --n 8 12 16 --courts 2 3 --variants o3_9 core
+#   python benchmark.py --baseline bench_baseline.json   # 회귀 검사 (있으면 exit 1)
+#   python benchmark.py --save-baseline bench_baseline.json
+#   python benchmark.py --simulate 1000             # 예상 모임 길이 · 코트 사용률 · 대기 시간도
+#   python benchmark.py --variants core core_fast core_faster   # 후보 예산 속도 ↔ 중복 곡선
+#
+# GUI 스크립트는 import 하면 창이 뜨므로, 소스를 ast 로 읽어 함수·상수·가벼운
+# import 만 실행한다. 각 경우는 별도 프로세스에서 돌려 무한 루프·과도한 시간은
+# --timeout 으로 끊는다. 전역 random / random.Random() 은 시드에서 파생된
+# 난수로 바꿔 끼워 변형 간·실행 간 결과가 재현되게 한다.
+# ok 는 1인 4경기 · 최대 만남 ≤ limit_by_n(n) · (돌려준) 슬롯의 선수 겹침 없음 을 모두 지킨 것,
+# 아니면 invalid 와 이유(games / limit / slots).
+import argparse, ast, json, os, platform, random, sys, time, tracemalloc, types
+import multiprocessing as mp
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from bracket_core import greedy_slots, count_meeting_overlap, limit_by_n   # noqa: E402
+from bracket_core.simulate import monte_carlo                  # noqa: E402
+
+_HEAVY = {"tkinter", "pandas", "matplotlib", "seaborn", "random"}
+
+# 이름: (파일, 생성 함수, 코트 수 지원 여부, 재시도 1회 함수)
+VARIANTS = {
+    "o3":        ("o3.py",   "generate_slot_first_schedule", False, None),
+    "o3_2":      ("o3_2.py", "generate_slot_first_schedule", False, None),
+    "o3_3":      ("o3_3.py", "generate_complete_schedule",   False, None),
+    "o3_4":      ("o3_4.py", "generate_schedule_strict",     False, "_try_make_schedule"),
+    "o3_5":      ("o3_5.py", "make_schedule",                False, "_try_schedule"),
+    "o3_6":      ("o3_6.py", "generate_schedule",            False, "_build_once"),
+    "o3_7":      ("o3_7.py", "generate_schedule",            False, "_build_once"),
+    "o3_9":      ("o3_9.py", "generate_schedule",            True,  "_build_once"),
+    "core":      (None,      "generate_schedule",            True,  "build_once"),
+    "core_fast":   (None,    "generate_schedule",            True,  "build_once"),
+    "core_faster": (None,    "generate_schedule",            True,  "build_once"),
+    "4games_guaranteed":     ("badminton_gui_4games_guaranteed.py",
+                              "generate_final_4games_schedule", False, None),
+    "low_overlap":           ("badminton_gui_low_overlap.py",
+                              "generate_low_overlap_schedule", False, None),
+    "low_overlap_simulation": ("badminton_gui_low_overlap_simulation.py",
+                              "generate_low_overlap_schedule", False, None),
+    "slot_optimized":        ("badminton_gui_slot_optimized.py",
+                              "generate_slot_optimized_schedule", False, None),
+    "stable_low_overlap":    ("badminton_gui_stable_low_overlap.py",
+                              "generate_stable_low_overlap_schedule", False, None),
+    "with_heatmap":          ("badminton_gui_with_heatmap.py",
+                              "generate_optimized_parallel_schedule", False, None),
+    "with_heatmap_fixed":    ("badminton_gui_with_heatmap_fixed.py",
+                              "generate_optimized_parallel_schedule", False, None),
+    "optimized_gui":         ("badminton_optimized_gui.py",
+                              "generate_optimized_parallel_schedule", False, None),
+    "optimized_gui_with_stats": ("badminton_optimized_gui_with_stats.py",
+                              "generate_optimized_parallel_schedule", False, None),
+    "parallel_simulator":    ("badminton_parallel_simulator.py",
+                              "generate_fully_guaranteed_schedule", False, None),
+    "scheduler_gui":         ("badminton_scheduler_gui.py",
+                              "generate_fully_guaranteed_schedule", False, None),
+    "simulator_safe_gui":    ("badminton_simulator_safe_gui.py",
+                              "generate_fully_guaranteed_schedule", False, None),
+}
+
+
+# ── 변형 불러오기 ───────────────────────────────────────────
+def _seeded_random(seed: int):
+    """시드 고정 random 모듈 대용품. random.Random() 도 시드에서 파생"""
+    master = random.Random(seed)
+    mod = types.ModuleType("random")
+    for name in ("random", "randrange", "randint", "choice", "choices",
+                 "shuffle", "sample", "uniform", "getrandbits"):
+        setattr(mod, name, getattr(master, name))
+    mod.Random = lambda x=None: random.Random(
+        master.randrange(1 << 62) if x is None else x)
+    return mod
+
+
+def _light_source(path: str):
+    """GUI 코드를 뺀 함수·상수·import 만 남긴 모듈 AST"""
+    tree = ast.parse(open(path, encoding="utf-8").read(), path)
+    body = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            node.names = [a for a in node.names
+                          if a.name.split(".")[0] not in _HEAVY]
+            if node.names:
+                body.append(node)
+        elif isinstance(node, ast.ImportFrom):
+            if (node.module or "").split(".")[0] not in _HEAVY:
+                body.append(node)
+        elif isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            body.append(node)
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant):
+            body.append(node)
+    tree.body = body
+    return tree
+
+
+_loaded = {}
+
+
+def load_variant(name: str):
+    if name not in _loaded:
+        fname = VARIANTS[name][0]
+        if fname is None:
+            import bracket_core.search as ns
+            _loaded[name] = ns.__dict__
+        else:
+            path = os.path.join(HERE, fname)
+            ns = {"__name__": f"bench_{name}", "__file__": path,
+                  "random": random}   # 타입 힌트용, 실행 때는 _seeded_random
+            exec(compile(_light_source(path), path, "exec"), ns)
+            _loaded[name] = ns
+    return _loaded[name]
+
+
+# ── 한 경우 실행 ────────────────────────────────────────────
+def _games(res):
+    """변형마다 다른 반환 모양 → [(team1, team2), ...]"""
+    games = res[0] if isinstance(res, tuple) else res
+    return [(tuple(t1), tuple(t2)) for t1, t2 in games]
+
+
+def _slots(res):
+    """변형이 슬롯도 돌려주면 [[(team1, team2), ..], ..], 아니면 None"""
+    if isinstance(res, tuple) and len(res) > 1 and res[1] and isinstance(res[1][0], list):
+        return [[(tuple(t1), tuple(t2)) for t1, t2 in s] for s in res[1]]
+    return None
+
+
+def invalid_reasons(games, slots, n: int, courts: int):
+    """유효하지 않은 이유 목록 (비면 유효)
+    - games : 경기마다 서로 다른 4명, 선수 n명 모두 4경기
+    - limit : 최대 만남(count_meeting_overlap) ≤ limit_by_n(n)
+    - slots : 슬롯마다 경기 ≤ courts, 선수 겹침 없음 (greedy_slots 규칙), 경기 목록과 같은 경기"""
+    why = []
+    cnt = {}
+    for t1, t2 in games:
+        for p in t1 + t2:
+            cnt[p] = cnt.get(p, 0) + 1
+    if not games or len(cnt) != n or set(cnt.values()) != {4} or \
+            any(len(set(t1 + t2)) != 4 for t1, t2 in games):
+        why.append("games")
+    if games and count_meeting_overlap(games)["max"] > limit_by_n(n):
+        why.append("limit")
+    if slots is not None:
+        for s in slots:
+            ps = [p for t1, t2 in s for p in t1 + t2]
+            if len(s) > courts or len(ps) != len(set(ps)):
+                why.append("slots"); break
+        else:
+            if sorted(g for s in slots for g in s) != sorted(games):
+                why.append("slots")
+    return why
+
+
+def _call(name: str, n: int, courts: int, seed: int):
+    ns = load_variant(name)
+    fn = ns[VARIANTS[name][1]]
+    if name.startswith("core"):           # core_<CAND 이름> → 후보 예산
+        return fn(n, courts, seed=seed, cand=name[5:] or None)
+    ns["random"] = _seeded_random(seed)
+    return fn(n, courts) if VARIANTS[name][2] else fn(n)
+
+
+def run_case(name: str, n: int, courts: int, seed: int, memory: bool = True,
+             sim_runs: int = 0):
+    ns = load_variant(name)
+    tries = VARIANTS[name][3]
+    counter = [0]
+    if tries:
+        orig = ns[tries]
+
+        def counted(*a, **k):
+            counter[0] += 1
+            return orig(*a, **k)
+        ns[tries] = counted
+
+    rec = {"variant": name, "n": n, "courts": courts, "seed": seed}
+    try:
+        t0 = time.perf_counter()
+        res = _call(name, n, courts, seed)
+        rec["wall"] = round(time.perf_counter() - t0, 4)
+        rec["restarts"] = counter[0] if tries else None
+        if memory:                        # 같은 시드로 한 번 더, 메모리만 측정
+            tracemalloc.start()
+            _call(name, n, courts, seed)
+            rec["peak_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+            tracemalloc.stop()
+    except (ValueError, RuntimeError) as e:     # 변형이 스스로 포기
+        rec.update(status="fail", error=str(e).splitlines()[0],
+                   wall=round(time.perf_counter() - t0, 4))
+        return rec
+    except Exception as e:                      # 변형 코드 자체의 오류
+        rec.update(status="error", error=f"{type(e).__name__}: {e}",
+                   wall=round(time.perf_counter() - t0, 4))
+        return rec
+    finally:
+        if tries:
+            ns[tries] = orig
+
+    games = _games(res)
+    why = invalid_reasons(games, _slots(res), n, courts)
+    rec["status"] = "invalid" if why else "ok"
+    if why:
+        rec["invalid"] = why
+    rec["games"] = len(games)
+    if games:
+        st = count_meeting_overlap(games)
+        rec["max"], rec["avg"] = st["max"], st["avg"]
+        slots = greedy_slots(games, courts)
+        rec["slots"] = len(slots)
+        if sim_runs:                      # 같은 경기 시간 분포로 실제 모임을 재생
+            mc = monte_carlo(slots, courts, sim_runs, seed=seed)
+            rec["session"] = mc["length"]["mean"]
+            rec["court_util"], rec["wait_mean"] = mc["utilisation"], mc["wait_mean"]
+    return rec
+
+
+def _child(conn, args):
+    conn.send(run_case(*args))
+    conn.close()
+
+
+def run_isolated(args, timeout: float, ctx):
+    """별도 프로세스에서 run_case. 시간 초과면 강제 종료"""
+    recv, send = ctx.Pipe(duplex=False)
+    p = ctx.Process(target=_child, args=(send, args), daemon=True)
+    p.start(); send.close()
+    name, n, courts, seed = args[:4]
+    rec = {"variant": name, "n": n, "courts": courts, "seed": seed,
+           "status": "timeout", "wall": timeout}
+    try:
+        if recv.poll(timeout):
+            rec = recv.recv()
+        else:
+            p.kill()
+    except EOFError:                    # 자식이 결과 없이 죽음
+        rec.update(status="error", error="worker died")
+    p.join()
+    return rec
+
+
+# ── 요약 · 회귀 비교 ────────────────────────────────────────
+def summarize(records):
+    by = {}
+    for r in records:
+        by.setdefault((r["variant"], r["n"], r["courts"]), []).append(r)
+    rows = []
+    for (v, n, c), rs in sorted(by.items(), key=lambda kv: (kv[0][1], kv[0][2], kv[0][0])):
+        ok = [r for r in rs if r["status"] == "ok"]
+        rows.append({
+            "variant": v, "n": n, "courts": c, "runs": len(rs),
+            "failures": len(rs) - len(ok),
+            "wall_mean": round(sum(r["wall"] for r in rs) / len(rs), 4),
+            "peak_kb": max((r.get("peak_kb") or 0) for r in rs),
+            "restarts_mean": (round(sum(r["restarts"] for r in ok) / len(ok), 1)
+                              if ok and ok[0].get("restarts") is not None else None),
+            "max": max((r["max"] for r in ok), default=None),
+            "avg": (round(sum(r["avg"] for r in ok) / len(ok), 3) if ok else None),
+            "session": (round(sum(r["session"] for r in ok) / len(ok), 2)
+                        if ok and "session" in ok[0] else None),
+        })
+    return rows
+
+
+def curve(rows):
+    """변형별 (총 시간, 평균 max, 평균 avg) – 시간 순. core / core_fast / core_faster 를
+    나란히 보면 후보 예산의 속도 ↔ 중복 곡선"""
+    by = {}
+    for r in rows:
+        if r["failures"] or r["max"] is None:
+            continue
+        by.setdefault(r["variant"], []).append(r)
+    out = [{"variant": v, "cases": len(rs),
+            "wall_total": round(sum(r["wall_mean"] for r in rs), 4),
+            "max_mean": round(sum(r["max"] for r in rs) / len(rs), 3),
+            "avg_mean": round(sum(r["avg"] for r in rs) / len(rs), 3)}
+           for v, rs in by.items()]
+    return sorted(out, key=lambda c: c["wall_total"])
+
+
+def best_by_n(rows):
+    """인원별: 실패 없이 가장 낮은 max 를 낸 변형 중 가장 빠른 것"""
+    best = {}
+    for r in rows:
+        if r["failures"]:
+            continue
+        key = (r["max"], r["wall_mean"])
+        cur = best.get(r["n"])
+        if cur is None or key < (cur["max"], cur["wall_mean"]):
+            best[r["n"]] = r
+    return {n: {"variant": r["variant"], "courts": r["courts"],
+                "max": r["max"], "wall_mean": r["wall_mean"]}
+            for n, r in sorted(best.items())}
+
+
+def regressions(records, baseline, tol: float, min_delta: float):
+    base = {(r["variant"], r["n"], r["courts"], r["seed"]): r
+            for r in baseline["records"]}
+    out = []
+    for r in records:
+        b = base.get((r["variant"], r["n"], r["courts"], r["seed"]))
+        if b is None:
+            continue
+        why = []
+        if b["status"] == "ok" and r["status"] != "ok":
+            why.append(f"status {b['status']} → {r['status']}")
+        if r["status"] == "ok" and b["status"] == "ok" and r["max"] > b["max"]:
+            why.append(f"max {b['max']} → {r['max']}")
+        if r["wall"] > b["wall"] * (1 + tol) and r["wall"] - b["wall"] > min_delta:
+            why.append(f"wall {b['wall']}s → {r['wall']}s")
+        if why:
+            out.append({"variant": r["variant"], "n": r["n"], "courts": r["courts"],
+                        "seed": r["seed"], "why": why})
+    return out
+
+
+# ── main ───────────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="스케줄러 변형 벤치마크")
+    ap.add_argument("--n", type=int, nargs="+", default=list(range(4, 33)))
+    ap.add_argument("--courts", type=int, nargs="*", default=[],
+                    help="코트 수 목록 (코트를 받는 변형만, 기본 ⌊n/4⌋)")
+    ap.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    ap.add_argument("--variants", nargs="+", default=list(VARIANTS),
+                    choices=list(VARIANTS), metavar="NAME")
+    ap.add_argument("--timeout", type=float, default=60.0, help="경우당 제한 시간(초)")
+    ap.add_argument("--no-memory", action="store_true", help="peak 메모리 측정 생략")
+    ap.add_argument("--simulate", type=int, default=0, metavar="RUNS",
+                    help="경우마다 몬테카를로 모임 시뮬레이션 횟수 (0 = 생략)")
+    ap.add_argument("--out", default="bench_results.json")
+    ap.add_argument("--baseline", help="비교할 기준 결과 파일")
+    ap.add_argument("--save-baseline", help="이번 결과를 기준 파일로도 저장")
+    ap.add_argument("--tol", type=float, default=0.25, help="시간 회귀 허용 비율")
+    ap.add_argument("--min-delta", type=float, default=0.05, help="시간 회귀 최소 차이(초)")
+    a = ap.parse_args(argv)
+
+    ctx = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+    records = []
+    for n in a.n:
+        for v in a.variants:
+            court_opts = ([c for c in a.courts if 1 <= c <= n // 4] or [n // 4]) \
+                if VARIANTS[v][2] else [n // 4]
+            for c in court_opts:
+                for s in a.seeds:
+                    rec = run_isolated((v, n, c, s, not a.no_memory, a.simulate),
+                                       a.timeout, ctx)
+                    records.append(rec)
+                    print(f"{v:>24} n={n:2} c={c} seed={s}: {rec['status']:7} "
+                          f"{rec['wall']:8.3f}s max={rec.get('max', '-')} "
+                          f"restarts={rec.get('restarts', '-')}"
+                          + (f" session={rec['session']}분" if "session" in rec else "")
+                          + (f" ({','.join(rec['invalid'])})" if "invalid" in rec else ""),
+                          file=sys.stderr)
+
+    rows = summarize(records)
+    result = {
+        "meta": {"python": platform.python_version(), "machine": platform.machine(),
+                 "cpus": os.cpu_count(), "seeds": a.seeds,
+                 "time": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "records": records, "summary": rows, "best_by_n": best_by_n(rows),
+        "curve": curve(rows),
+    }
+    regs = []
+    if a.baseline:
+        with open(a.baseline, encoding="utf-8") as f:
+            regs = regressions(records, json.load(f), a.tol, a.min_delta)
+        result["regressions"] = regs
+    for path in filter(None, (a.out, a.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=1)
+
+    for n, b in result["best_by_n"].items():
+        print(f"n={n:2}: {b['variant']} (max {b['max']}, {b['wall_mean']}s)")
+    for c in result["curve"]:
+        print(f"{c['variant']:>24}: {c['wall_total']:8.3f}s  max {c['max_mean']:.2f}  "
+              f"avg {c['avg_mean']:.3f}  ({c['cases']} 경우)")
+    for r in regs:
+        print(f"REGRESSION {r['variant']} n={r['n']} c={r['courts']} "
+              f"seed={r['seed']}: {', '.join(r['why'])}")
+    return 1 if regs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+# bracket_core — GUI 없이 쓰는 대진 생성 코어
+# tkinter / pandas / matplotlib / seaborn 을 import 하지 않는다
+# (numpy 는 통계·히트맵을 계산할 때, 나머지는 show_heatmap 을 부를 때만 불러옴)
+from .engine import GPP, WEIGHTS, CAND, limit_by_n, build_once, build_from, pick_group, pick_weighted, add_group, pair_stats, labels
+from .overlap_index import OverlapIndex
+from .quads import QuadSpace, LiveQuads
+from .search import generate_schedule, restart_search
+from .instrument import Probe
+from .exact import solve_exact
+from .designs import design_schedule
+from .portfolio import portfolio
+from .local_search import improve, improve_iter
+from .library import ScheduleLibrary
+from .history import PairHistory
+from .stream import stream_schedule
+from .replan import replan
+from .partner import generate_partner
+from .stats import pair_counts, count_meeting_overlap, overlap_stats
+from .slots import greedy_slots, pack_slots
+from .dispatch import Dispatcher
+from .simulate import simulate, monte_carlo
+from .heatmap import show_heatmap, overlap_frame
@@ -0,0 +1,100 @@
+# bracket_core/batch.py
+# 여러 대진을 한 번에 채점 – (대진 수 × 경기 수 × 4) 번호 배열
+# ───────────────────────────────────────────────────────────
+# 재시도 결과나 저장소 후보 수천~수십만 개를 count_meeting_overlap 으로 하나씩 돌리지 않고
+# 배열 연산 몇 번으로 끝낸다.
+#  - 만남 / 파트너 / 상대 행렬은 대진별 오프셋을 더한 한 번의 bincount
+#    (대진 수 × n² 가 커지면 chunk 단위로 나눠 메모리를 묶어 둔다)
+#  - 슬롯은 slot_ids(대진 × 경기) 로 받는다. 없으면 courts 개씩 차례로 찬 슬롯
+#    (build_once 결과를 평탄화한 순서와 같다)
+#  - 휴식 간격은 (대진, 선수, 슬롯) 출전 기록을 정렬해 이웃 차로 구한다
+import numpy as np
+
+from .matrix import index_array
+
+_I, _J = np.triu_indices(4, 1)          # 경기 안 6쌍
+_TEAM  = np.array([0, 5])               # 6쌍 중 (0,1) (2,3) = 파트너, 나머지 4쌍 = 상대
+_OPP   = np.array([1, 2, 3, 4])
+_CELLS = 1 << 22                        # chunk 당 행렬 칸 수 상한 (int64 32MB)
+
+
+def stack(schedules, players=None):
+    """같은 경기 수의 라벨 대진 목록 → ((대진 × 경기 × 4) 배열, 선수 목록)"""
+    if players is None:
+        players = sorted({p for s in schedules for t1, t2 in s for p in t1 + t2})
+    lens = {len(s) for s in schedules}
+    if len(lens) > 1:
+        raise ValueError(f"경기 수가 다른 대진은 한 배열로 쌓을 수 없습니다: {sorted(lens)}")
+    return np.stack([index_array(s, players)[0] for s in schedules]), players
+
+
+def stack_slots(slot_lists, players=None):
+    """슬롯 대진 목록 → (배열, slot_ids, 선수 목록). 슬롯 구성이 달라도 된다"""
+    flat = [[g for s in sl for g in s] for sl in slot_lists]
+    arr, players = stack(flat, players)
+    ids = np.array([[i for i, s in enumerate(sl) for _ in s] for sl in slot_lists])
+    return arr, ids, players
+
+
+def _pair_max_sq(keys, nb: int, n: int):
+    """keys(대진별 오프셋이 더해진 쌍 번호) → 대진별 (max, 만난 쌍 수, 제곱합, 반복 수)"""
+    m = np.bincount(keys.ravel(), minlength=nb * n * n).reshape(nb, n * n)
+    return (m.max(axis=1), np.count_nonzero(m, axis=1),
+            (m * m).sum(axis=1), np.maximum(m - 1, 0).sum(axis=1))
+
+
+def evaluate(arr, n: int | None = None, courts: int | None = None, slot_ids=None):
+    """(대진 × 경기 × 4) 배열을 한 번에 채점. 각 값은 길이 = 대진 수 인 배열
+    max / avg / sq / total_pairs     : 만남 (쌍 단위, avg 는 만난 쌍 기준)
+    team_repeat / opp_repeat         : 같은 파트너 · 같은 상대 재회 수 (횟수-1 의 합)
+    slots / utilisation              : 슬롯 수, 경기 수 / (슬롯 × 코트)
+    rest_max / rest_avg / back_to_back : 연속 출전 사이 쉬는 슬롯 수 (최대·평균), 연속 출전 횟수"""
+    arr = np.asarray(arr, dtype=np.intp)
+    B, G, _ = arr.shape
+    n = n or int(arr.max()) + 1
+    courts = courts or n // 4
+    if slot_ids is None:
+        slot_ids = np.broadcast_to(np.arange(G) // courts, (B, G))
+    slot_ids = np.asarray(slot_ids, dtype=np.intp)
+
+    # ① 쌍 행렬 – 항상 작은 번호가 앞에 오도록 정렬해 한쪽 삼각만 센다
+    lo = np.minimum(arr[:, :, _I], arr[:, :, _J])
+    hi = np.maximum(arr[:, :, _I], arr[:, :, _J])
+    pair = lo * n + hi                               # (B, G, 6)
+    out = {k: np.empty(B, dtype=np.int64) for k in
+           ("max", "total_pairs", "sq", "team_repeat", "opp_repeat")}
+    step = max(1, _CELLS // (n * n))
+    for s in range(0, B, step):
+        e = min(B, s + step)
+        off = (np.arange(e - s) * n * n)[:, None, None]
+        p = pair[s:e] + off
+        out["max"][s:e], out["total_pairs"][s:e], out["sq"][s:e], _ = \
+            _pair_max_sq(p, e - s, n)
+        out["team_repeat"][s:e] = _pair_max_sq(p[:, :, _TEAM], e - s, n)[3]
+        out["opp_repeat"][s:e]  = _pair_max_sq(p[:, :, _OPP], e - s, n)[3]
+    out["avg"] = np.round(6 * G / np.maximum(out["total_pairs"], 1), 2)
+
+    # ② 슬롯 사용률
+    out["slots"] = slot_ids.max(axis=1) + 1
+    out["utilisation"] = G / (out["slots"] * courts)
+
+    # ③ 휴식 간격 – (대진, 선수, 슬롯) 순 정렬 후 같은 (대진, 선수) 끼리 이웃 차
+    S   = int(out["slots"].max())
+    bp  = np.arange(B)[:, None] * n + arr.reshape(B, -1)         # (대진, 선수) 번호
+    key = np.sort((bp * S + np.repeat(slot_ids, 4, axis=1)).ravel())
+    bp, sl = key // S, key % S
+    same = bp[1:] == bp[:-1]
+    gap  = (sl[1:] - sl[:-1] - 1)[same]
+    gb   = bp[1:][same] // n
+    cnt  = np.bincount(gb, minlength=B)
+    out["rest_max"] = np.zeros(B, dtype=np.int64)
+    np.maximum.at(out["rest_max"], gb, gap)
+    out["rest_avg"] = np.round(np.bincount(gb, gap, minlength=B) / np.maximum(cnt, 1), 2)
+    out["back_to_back"] = np.bincount(gb[gap == 0], minlength=B)
+    return out
+
+
+def evaluate_slots(slot_lists, courts: int | None = None):
+    """라벨 슬롯 대진 목록 → evaluate 결과 (편의 함수)"""
+    arr, ids, players = stack_slots(slot_lists)
+    return evaluate(arr, len(players), courts, ids)
@@ -0,0 +1,236 @@
+# bracket_core/cli.py
+# 명령행 진입점 – 결과는 JSON 으로 stdout 에
+# ───────────────────────────────────────────────────────────
+#   python -m bracket_core generate -n 16 [--courts 3] [--seed 1] [--workers 0]
+#                                   [--names 철수,영희,..] [--library PATH] [--heatmap]
+#                                   [--exact SECONDS] [--improve SECONDS] [--stream]
+#                                   [--stats] [--trace trace.json] [--budget SECONDS]
+#                                   [--weights 10,1] [--no-design] [--cand fast|faster|CAP,ACCEPT]
+#                                   [--history PATH [--record]]
+#     (--history: 지난 모임 만남 기록으로 최근에 만난 쌍을 뒤로, --record: 오늘 대진을 기록에 더함.
+#      --library / --budget / --stream 과는 같이 못 씀)
+#   python -m bracket_core fill [--min 4] [--max 32] [--tries 20] [--path PATH]
+#   python -m bracket_core simulate -n 16 [--runs 2000] [--mode slot|batch|async] [--mean 12 --sd 3]
+#   python -m bracket_core replan --played played.json --roster P1,P2,..,새선수 [--courts 3]
+#     (played.json = generate 출력에서 이미 치른 슬롯만 남긴 것)
+#   python -m bracket_core partner --names A,B,.. [--fixed A:B,C:D] [--restart 8000] [--workers 0]
+#     (앱 PartnerBracketScheduler 와 같은 규칙, 경기 목록 JSON + 필요했던 재시도 수)
+import argparse, json, random, sys
+
+from .engine import CAND, labels, limit_by_n
+from .history import PairHistory
+from .instrument import Probe
+from .library import DEFAULT_PATH, ScheduleLibrary, fill
+from .local_search import improve
+from .partner import generate_partner
+from .portfolio import portfolio
+from .search import generate_schedule
+from .replan import replan
+from .simulate import CHANGEOVER, lognormal, monte_carlo
+from .stream import stream_schedule
+
+
+def _relabel(res, names):
+    schedule, slots, stats, players = res
+    m = dict(zip(players, names))
+    slots = [[(tuple(m[p] for p in t1), tuple(m[p] for p in t2)) for t1, t2 in s]
+             for s in slots]
+    return [g for s in slots for g in s], slots, stats, list(names)
+
+
+def to_json(res):
+    _, slots, stats, players = res
+    return {"players": players, "stats": stats,
+            "slots": [[[list(t1), list(t2)] for t1, t2 in s] for s in slots]}
+
+
+def cmd_generate(a):
+    names = a.names.split(",") if a.names else None
+    n = len(names) if names else a.n
+    if n is None:
+        raise SystemExit("-n 또는 --names 가 필요합니다.")
+    if names is None:
+        names = [f"P{i+1}" for i in range(n)]
+    courts = a.courts or n // 4
+    rng = random.Random(a.seed)
+
+    if a.stream:                            # 슬롯이 확정되는 대로 한 줄씩 (JSON Lines)
+        m = dict(zip(labels(n), names))
+        for i, slot in enumerate(stream_schedule(n, courts, seed=a.seed,
+                                                 restarts=a.restarts), 1):
+            games = [[[m[p] for p in t1], [m[p] for p in t2]] for t1, t2 in slot]
+            print(json.dumps({"slot": i, "games": games}, ensure_ascii=False), flush=True)
+        return
+
+    hist = PairHistory(a.history) if a.history else None
+    res = None
+    if a.library:
+        res = ScheduleLibrary(a.library).lookup(names, courts, limit_by_n(n), rng=rng)
+    if res is None and a.budget:            # 한도별 동시 경주, 마감에 최선
+        res, info = portfolio(n, courts, a.budget, a.workers, a.seed)
+        print(json.dumps(info), file=sys.stderr)
+        res = _relabel(res, names)
+    if res is None:
+        probe = None
+        if a.stats or a.trace:
+            log = (lambda p: print(json.dumps(p.summary()), file=sys.stderr)) \
+                if a.stats else None
+            probe = Probe(on_progress=log, every=500, trace=bool(a.trace))
+        res = _relabel(generate_schedule(n, courts, a.restarts, a.workers, a.seed,
+                                         exact=a.exact, probe=probe,
+                                         weights=a.weights, design=not a.no_design,
+                                         cand=a.cand,
+                                         hist=hist.table(names) if hist else None),
+                       names)
+        if a.trace:
+            probe.export(a.trace)
+    if a.improve:
+        slots, st = improve(res[1], a.improve, rng,
+                            on_improve=lambda s, st: print(st, file=sys.stderr))
+        res = ([g for s in slots for g in s], slots,
+               {**res[2], "max": st["max"], "sq": st["sq"]}, res[3])
+
+    if hist:
+        if a.record:
+            hist.record(res[0])
+        hist.close()
+
+    json.dump(to_json(res), sys.stdout, ensure_ascii=False, indent=a.indent)
+    sys.stdout.write("\n")
+    if a.heatmap:
+        from .heatmap import show_heatmap
+        show_heatmap(res[0])
+
+
+def cmd_fill(a):
+    fill(ScheduleLibrary(a.path), range(a.min, a.max + 1),
+         tries=a.tries, restarts=a.restarts, seed=a.seed,
+         log=lambda s: print(s, file=sys.stderr))
+
+
+def cmd_simulate(a):
+    courts = a.courts or a.n // 4
+    _, slots, _, _ = generate_schedule(a.n, courts, a.restarts, seed=a.seed)
+    res = monte_carlo(slots, courts, a.runs, lognormal(a.mean, a.sd), a.seed,
+                      a.mode, a.changeover)
+    json.dump(res, sys.stdout, ensure_ascii=False, indent=a.indent)
+    sys.stdout.write("\n")
+
+
+def cmd_replan(a):
+    with open(a.played, encoding="utf-8") as f:
+        played = json.load(f)["slots"]
+    played = [[(tuple(t1), tuple(t2)) for t1, t2 in s] for s in played]
+    slots, info = replan(played, a.roster.split(","), a.courts, seed=a.seed,
+                         budget=a.budget)
+    out = {"info": info, "slots": [[[list(t1), list(t2)] for t1, t2 in s] for s in slots]}
+    json.dump(out, sys.stdout, ensure_ascii=False, indent=a.indent)
+    sys.stdout.write("\n")
+
+
+def cmd_partner(a):
+    fixed = [p.split(":") for p in a.fixed.split(",")] if a.fixed else []
+    matches, info = generate_partner(a.names.split(","), fixed, not a.no_optimize,
+                                     team_weight=a.team_weight, opp_weight=a.opp_weight,
+                                     restart=a.restart, lower_bound=a.lower_bound,
+                                     seed=a.seed, workers=a.workers)
+    json.dump({"info": info, "matches": matches}, sys.stdout, ensure_ascii=False,
+              indent=a.indent)
+    sys.stdout.write("\n")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="bracket_core",
+                                 description="배드민턴 복식 대진 생성기")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    g = sub.add_parser("generate", help="대진표 생성 (JSON 출력)")
+    g.add_argument("-n", type=int, help="참가 인원 (4 이상, 32 초과는 후보 창 모드)")
+    g.add_argument("--names", help="쉼표로 구분한 선수 이름 (인원 수를 대신함)")
+    g.add_argument("--courts", type=int, help="코트 수 (기본 ⌊n/4⌋)")
+    g.add_argument("--seed", type=int)
+    g.add_argument("--workers", type=int, default=1, help="병렬 프로세스 수 (0 = CPU 수)")
+    g.add_argument("--restarts", type=int, default=3000, help="기본 재시도 횟수")
+    g.add_argument("--library", nargs="?", const=DEFAULT_PATH,
+                   help="미리 계산된 대진 저장소를 먼저 조회")
+    g.add_argument("--exact", type=float, metavar="SECONDS",
+                   help="기본 한도 재시도가 실패하면 완전 탐색으로 한 번 더 (시간 제한)")
+    g.add_argument("--improve", type=float, metavar="SECONDS",
+                   help="생성 뒤 선수/팀 맞바꾸기로 중복을 더 줄이기 (시간 예산)")
+    g.add_argument("--stream", action="store_true",
+                   help="슬롯이 확정될 때마다 한 줄씩 출력 (JSON Lines)")
+    g.add_argument("--budget", type=float, metavar="SECONDS",
+                   help="한도 2·3 탐색을 동시에 돌려 이 시간 안에 가장 엄격한 결과 (재현 안 됨)")
+    g.add_argument("--weights", type=lambda s: tuple(int(x) for x in s.split(",")),
+                   metavar="TEAM,OPP",
+                   help="같은 팀 · 상대 중복 가중치로 4명 고르기와 팀 나누기 (예: 10,1)")
+    g.add_argument("--no-design", action="store_true",
+                   help="조합 설계 카탈로그를 건너뛰고 바로 탐색")
+    g.add_argument("--cand", type=lambda s: s if s in CAND else tuple(int(x) for x in s.split(",")),
+                   metavar="NAME|CAP,ACCEPT",
+                   help="후보 예산: fast / faster 또는 CAP,ACCEPT (빨라지는 대신 두 번 만나는 쌍이 늘 수 있음)")
+    g.add_argument("--history", metavar="PATH",
+                   help="모임 간 만남 기록 파일 – 최근에 자주 만난 쌍을 덜 만나게 (--names 의 이름 기준)")
+    g.add_argument("--record", action="store_true", help="오늘 대진을 --history 기록에 더하기")
+    g.add_argument("--stats", action="store_true",
+                   help="탐색 계측(조합 · 재시도 수, 단계 시간)을 stderr 로 중간중간 출력")
+    g.add_argument("--trace", metavar="PATH", help="탐색 사건 추적을 JSON 으로 저장")
+    g.add_argument("--indent", type=int)
+    g.add_argument("--heatmap", action="store_true", help="히트맵 창 띄우기")
+    g.set_defaults(func=cmd_generate)
+
+    f = sub.add_parser("fill", help="대진 저장소 오프라인 채우기")
+    f.add_argument("--path", default=DEFAULT_PATH)
+    f.add_argument("--min", type=int, default=4)
+    f.add_argument("--max", type=int, default=32)
+    f.add_argument("--tries", type=int, default=20)
+    f.add_argument("--restarts", type=int, default=3000)
+    f.add_argument("--seed", type=int)
+    f.set_defaults(func=cmd_fill)
+
+    m = sub.add_parser("simulate", help="몬테카를로 모임 시뮬레이션 (JSON 출력)")
+    m.add_argument("-n", type=int, required=True, help="참가 인원 (4 이상, 32 초과는 후보 창 모드)")
+    m.add_argument("--courts", type=int, help="코트 수 (기본 ⌊n/4⌋)")
+    m.add_argument("--seed", type=int)
+    m.add_argument("--restarts", type=int, default=3000)
+    m.add_argument("--runs", type=int, default=2000, help="시뮬레이션 횟수")
+    m.add_argument("--mode", choices=("slot", "batch", "async"), default="slot")
+    m.add_argument("--mean", type=float, default=12.0, help="경기 시간 평균(분)")
+    m.add_argument("--sd", type=float, default=3.0, help="경기 시간 표준편차(분)")
+    m.add_argument("--changeover", type=float, default=CHANGEOVER, help="교대 시간(분)")
+    m.add_argument("--indent", type=int)
+    m.set_defaults(func=cmd_simulate)
+
+    r = sub.add_parser("replan", help="명단이 바뀐 뒤 남은 슬롯만 다시 짜기 (JSON 출력)")
+    r.add_argument("--played", required=True, help="이미 치른 슬롯 JSON (generate 출력 형식)")
+    r.add_argument("--roster", required=True, help="지금 있는 선수, 쉼표 구분 (새로 온 선수 포함)")
+    r.add_argument("--courts", type=int, help="코트 수 (기본 ⌊인원/4⌋)")
+    r.add_argument("--seed", type=int)
+    r.add_argument("--budget", type=float, default=0.5, help="시간 예산(초)")
+    r.add_argument("--indent", type=int)
+    r.set_defaults(func=cmd_replan)
+
+    q = sub.add_parser("partner", help="고정 파트너 대진 (앱과 같은 규칙, JSON 출력)")
+    q.add_argument("--names", required=True, help="쉼표로 구분한 선수 이름 (4‑32명)")
+    q.add_argument("--fixed", help="고정 파트너 쌍, 예: 철수:영희,민수:지수")
+    q.add_argument("--restart", type=int, default=8000, help="재시도 횟수")
+    q.add_argument("--lower-bound", type=int, default=2, help="조기 종료 목표 최대 중복")
+    q.add_argument("--team-weight", type=int, default=10)
+    q.add_argument("--opp-weight", type=int, default=1)
+    q.add_argument("--no-optimize", action="store_true", help="처음 성공한 대진을 바로 사용")
+    q.add_argument("--seed", type=int)
+    q.add_argument("--workers", type=int, default=1, help="병렬 프로세스 수 (0 = CPU 수)")
+    q.add_argument("--indent", type=int)
+    q.set_defaults(func=cmd_partner)
+
+    a = ap.parse_args(argv)
+    if a.func is cmd_generate:
+        if a.history and (a.library or a.budget or a.stream):
+            g.error("--history 는 --library / --budget / --stream 과 같이 쓸 수 없습니다 "
+                    "(그 경로들은 만남 기록을 보지 않음)")
+        if a.record and not a.history:
+            g.error("--record 는 --history 와 같이 써야 합니다")
+    try:
+        a.func(a)
+    except (ValueError, RuntimeError) as e:
+        raise SystemExit(str(e))
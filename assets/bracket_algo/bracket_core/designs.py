@@ -0,0 +1,136 @@
+# bracket_core/designs.py
+# 조합 설계 카탈로그 – 알려진 구성이 있는 인원은 탐색 없이 바로
+# ───────────────────────────────────────────────────────────
+#  - 순환 설계: 기본 블록 B = {0, a, b, c} 를 Z_n 에서 j 만큼 민 {j + B} (j = 0..n-1) 가 경기.
+#    선수마다 정확히 4경기, 두 선수가 만나는 횟수 = B 의 차(±) 중 그 차이가 나오는 횟수.
+#    CYCLIC 의 블록은 오프라인으로 (최대 중복, 제곱합) 최소이면서 아래 슬롯 배치가
+#    되는 것을 골라 둔 것
+#  - n ≡ 0 (mod 4), n ≥ 24 : B = {0, 1, 3, 10}. 차 ±{1,2,3,7,9,10} 이 모두 달라 중복 1,
+#    원소가 mod 4 로 모두 달라 j ≡ t (mod 4) 인 경기끼리 겹치지 않음 → 코트 n/4 로 4슬롯
+#  - n = 16 : GF(4) 위 횡단 설계 TD(4,4) (아핀 평면 AG(2,4) 의 평행류 4개로 자름).
+#    선수 (x, i), 라운드 r 의 경기 j = {(j + r·i, i)} → 모든 쌍이 많아야 한 번
+#  - n = 8 : 아핀 공간 AG(3,2) 의 평면 평행류 (법선 u, 경기 = {x : u·x 짝수 / 홀수}).
+#    두 점 (차 d) 이 같은 평면에 드는 라운드 = d 에 수직인 법선 수. 법선 4개를 Fano 평면의
+#    한 직선의 여집합 {4,5,6,7} 로 고르면 어떤 d 에도 수직인 것이 0 또는 2개 → 중복 2
+#    (24쌍 두 번, 4쌍 0번). 순환 블록으로는 8명에서 슬롯 배치까지 되는 것이 없다
+#  - 슬롯 배치(pack)는 "슬롯마다 min(코트, 남은 경기) 이상" (build_once strict 규칙) 을
+#    지키는 분할을 비트마스크 DFS 로 찾는다. 카탈로그 설계는 수백 노드 안에 끝난다
+# 설계는 라벨만 섞어(relabel) 돌려주므로 대진 모양은 인원마다 하나다.
+# 4‑32명 중 카탈로그에 없는 인원: 4, 9, 13, 21, 29, 30, 31. 9 · 13 · 21 은 순환 블록
+# {0,a,b,c} 전수 탐색에서 기본 한도와 슬롯 배치를 함께 만족하는 것이 없었고, 29‑31 은 탐색이
+# 인원당 20초 안에 끝나지 않았다 (4명은 한 경기뿐이라 탐색도 즉시). 이 인원은 탐색으로 간다.
+import random
+
+from .engine import GPP, labels, limit_by_n, pair_stats
+
+CYCLIC = {
+    5: (0, 1, 2, 3), 6: (0, 1, 2, 3), 7: (0, 1, 2, 4),
+    10: (0, 1, 2, 4), 11: (0, 1, 2, 4), 12: (0, 1, 3, 6),
+    14: (0, 1, 3, 12), 15: (0, 1, 3, 7), 17: (0, 1, 4, 5),
+    18: (0, 1, 2, 8), 19: (0, 1, 2, 8), 20: (0, 1, 3, 14),
+    22: (0, 1, 3, 20), 23: (0, 1, 2, 8), 25: (0, 1, 4, 5),
+    26: (0, 1, 2, 12), 27: (0, 1, 3, 11), 34: (0, 1, 4, 22),
+    39: (0, 1, 3, 15),
+}
+FAMILY = (0, 1, 3, 10)                  # n ≡ 0 (mod 4), n ≥ 24
+PACK_NODES = 20000
+
+_GF4_MUL = ((0, 0, 0, 0), (0, 1, 2, 3), (0, 2, 3, 1), (0, 3, 1, 2))   # 덧셈은 XOR
+
+
+def _ag8(gpp: int):
+    """AG(3,2) 평면 평행류 앞 gpp 개 (법선 4..7) → 슬롯 목록 (선수 번호 = 좌표 비트)"""
+    return [[tuple(x for x in range(8) if (bin(x & u).count("1") & 1) == side) for side in (0, 1)]
+            for u in range(4, 4 + gpp)]
+
+
+def _td16(gpp: int):
+    """TD(4,4) 의 앞 gpp 라운드 → 슬롯 목록 (선수 번호 = 4·i + x)"""
+    return [[tuple(4 * i + (j ^ _GF4_MUL[r][i]) for i in range(4)) for j in range(4)]
+            for r in range(gpp)]
+
+
+def design_games(n: int, gpp: int = GPP):
+    """카탈로그의 경기 목록 (선수 번호 4‑튜플) 또는 None. 8 · 16명은 이미 슬롯으로 나뉜 채"""
+    if n == 8 and gpp <= 4:
+        return [g for s in _ag8(gpp) for g in s]
+    if n == 16 and gpp <= 4:
+        return [g for s in _td16(gpp) for g in s]
+    if gpp != 4:
+        return None
+    blk = CYCLIC.get(n) or (FAMILY if n % 4 == 0 and n >= 24 else None)
+    if blk is None:
+        return None
+    return [tuple((j + x) % n for x in blk) for j in range(n)]
+
+
+def pack(n: int, games, courts: int, nodes: int = PACK_NODES):
+    """games 를 strict 규칙(슬롯마다 min(courts, 남은 경기) 이상, 선수 중복 없음)으로
+    슬롯에 나눈다 → [[경기 번호, ..], ..] 또는 None (nodes 초과 포함)"""
+    masks = [sum(1 << p for p in g) for g in games]
+    budget = [nodes]
+
+    def rest(left):                     # left: 남은 경기 번호 (정렬)
+        if not left:
+            return []
+        return fill(left, 0, 0, [])
+
+    def fill(left, i, used, chosen):
+        budget[0] -= 1
+        if budget[0] < 0:
+            return None
+        k, rem = len(chosen), len(left)
+        if k == courts or i == rem:
+            if k < min(courts, rem - k):
+                return None
+            tail = rest([g for g in left if g not in chosen])
+            return None if tail is None else [chosen] + tail
+        if k + rem - i < min(courts, rem - courts):     # 남은 후보로 최소치를 못 채움
+            return None
+        g = left[i]
+        if not used & masks[g]:
+            r = fill(left, i + 1, used | masks[g], chosen + [g])
+            if r is not None:
+                return r
+        return fill(left, i + 1, used, chosen)
+
+    return rest(list(range(len(games))))
+
+
+def design_schedule(n: int, courts: int | None = None, gpp: int = GPP,
+                    rng: random.Random | None = None):
+    """카탈로그에 있으면 build_once 와 같은 (schedule, slots, stats, players), 없으면 None.
+    rng 로 라벨과 팀 나누기를 섞는다. 기본 한도(limit_by_n)를 넘거나
+    주어진 코트 수로 슬롯을 못 나누면 None"""
+    courts = courts or n // 4
+    games = design_games(n, gpp)
+    if games is None:
+        return None
+    if n in (8, 16) and courts == n // 4:
+        k = n // 4
+        parts = [list(range(k * r, k * r + k)) for r in range(gpp)]
+    else:
+        parts = pack(n, games, courts)
+        if parts is None:
+            return None
+
+    rng = rng or random.Random()
+    players = labels(n)
+    perm = players[:]; rng.shuffle(perm)
+    pc = [0] * (n * n)
+    slots = []
+    for part in parts:
+        slot = []
+        for gi in part:
+            g = games[gi]
+            for x in range(4):
+                for y in range(x + 1, 4):
+                    pc[g[x] * n + g[y]] += 1; pc[g[y] * n + g[x]] += 1
+            lst = [perm[p] for p in g]; rng.shuffle(lst)
+            slot.append((tuple(lst[:2]), tuple(lst[2:])))
+        slots.append(slot)
+    limit = limit_by_n(n)
+    stats = pair_stats(pc, n, limit)
+    if stats["max"] > limit:
+        return None
+    return [g for s in slots for g in s], slots, stats, players
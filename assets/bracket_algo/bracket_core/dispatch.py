@@ -0,0 +1,91 @@
+# bracket_core/dispatch.py
+# 비동기 코트 배정 – 네 명이 모두 비는 순간 다음 경기를 바로 시작
+# ───────────────────────────────────────────────────────────
+# simulate_next_batch 는 묶음 단위로 경기를 시작하고 묶음 전체가 끝나야 다음으로 간다.
+# 실제 코트는 경기마다 끝나는 시각이 다르므로, 코트 하나가 비면 곧바로
+# "선수 네 명이 모두 대기 중인 가장 앞 경기" 를 올린다.
+#  - busy[g]  : 경기 g 의 선수 중 지금 뛰고 있는 인원
+#  - ready    : busy[g]==0 이고 아직 시작 안 한 경기 번호 힙 (지연 삭제)
+#  - 선수가 뛰기 시작/끝날 때 그 선수의 미시작 경기들만 busy 를 ±1
+#  - in_order=True 면 선수마다 대진표 순서를 지킨다: ahead[g] = g 가 아직
+#    "다음 차례" 가 아닌 선수 수. 먼저 끝난 네 명이 뒤 슬롯 경기를 당겨 쓰면
+#    그 경기 선수를 기다리던 앞 슬롯 경기들이 줄줄이 밀리기 때문 (모두가 매 슬롯
+#    뛰는 n = 4×코트 에서 특히)
+# 선수당 경기 수가 상수(4)라 갱신은 O(1), 다음 경기 꺼내기는 O(log G).
+import heapq
+
+
+class Dispatcher:
+    """games: [(team1, team2), ..] (앞 번호일수록 먼저), courts: 코트 수"""
+
+    def __init__(self, games, courts: int, in_order: bool = True):
+        self.games  = [tuple(t1) + tuple(t2) for t1, t2 in games]
+        self.courts = courts
+        self.of     = {}                        # 선수 → 미시작 경기 번호들
+        for i, g in enumerate(self.games):
+            for p in g:
+                self.of.setdefault(p, []).append(i)
+        self.busy    = [0] * len(self.games)
+        self.ahead   = [0] * len(self.games)
+        if in_order:
+            for lst in self.of.values():
+                for h in lst[1:]:
+                    self.ahead[h] += 1
+        self.started = [False] * len(self.games)
+        self.ready   = list(range(len(self.games)))       # 처음엔 모두 대기
+        self.free    = list(range(courts))                # 빈 코트 (번호 작은 순)
+        self.court_of = {}                                # 진행 중 경기 → 코트
+        self.timeline = [[] for _ in range(courts)]       # 코트별 [(시작, 끝, 경기)]
+        self.left = len(self.games)
+
+    @property
+    def done(self) -> bool:
+        return self.left == 0 and not self.court_of
+
+    def playing(self):
+        return list(self.court_of)
+
+    def _pop_ready(self):
+        while self.ready:
+            g = heapq.heappop(self.ready)
+            if not self.started[g] and not self.busy[g] and not self.ahead[g]:
+                return g
+        return None
+
+    def start(self, t: float = 0.0):
+        """빈 코트를 준비된 경기로 채운다 → [(코트, 경기 번호), ..]"""
+        out = []
+        while self.free:
+            g = self._pop_ready()
+            if g is None:
+                break
+            c = heapq.heappop(self.free)
+            self.started[g] = True; self.left -= 1
+            self.court_of[g] = c
+            self.timeline[c].append([t, None, g])
+            for p in self.games[g]:
+                lst = self.of[p]
+                lst.remove(g)
+                for h in lst:
+                    self.busy[h] += 1
+                if lst and self.ahead[lst[0]]:
+                    self.ahead[lst[0]] -= 1     # 이 선수의 다음 차례가 됨
+            out.append((c, g))
+        return out
+
+    def finish(self, g: int, t: float = 0.0, release_court: bool = True) -> int:
+        """경기 g 종료: 선수를 풀고 코트 번호를 돌려준다.
+        release_court=False 면 교대 시간 뒤 free_court 로 따로 푼다"""
+        c = self.court_of.pop(g)
+        self.timeline[c][-1][1] = t
+        for p in self.games[g]:
+            for h in self.of[p]:
+                self.busy[h] -= 1
+                if not self.busy[h] and not self.ahead[h]:
+                    heapq.heappush(self.ready, h)
+        if release_court:
+            self.free_court(c)
+        return c
+
+    def free_court(self, c: int):
+        heapq.heappush(self.free, c)
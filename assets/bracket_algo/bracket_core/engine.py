@@ -0,0 +1,385 @@
+# bracket_core/engine.py
+# 정수 인덱스 · 비트마스크 기반 슬롯‑우선 스케줄 엔진
+# ───────────────────────────────────────────────────────────
+#  - 선수 = 0..n-1 비트 위치, 라벨(P1..Pn)은 결과를 돌려줄 때만 붙인다
+#  - 쌍 카운트는 평탄화 배열 pc[a*n+b]
+#  - "이미 한도에 도달한 쌍" 은 선수별 금지 상대 비트마스크 forb[a]
+#  - 4명 조합은 중첩 비트마스크로 열거 → 금지 쌍이 생기는 순간 가지치기
+#  - window 를 주면 (32명 초과 대회용) 남은 경기가 많은 후보 window 명 안에서만 고른다.
+#    한 번 고르기가 C(window,4) 로 묶여 전체 시간이 경기 수(≈ 코트 × 슬롯)에 비례.
+#    이 안에 가능한 조합이 없을 때만 창을 두 배씩 넓히므로 한도 보장은 그대로
+#  - weights=(팀, 상대) 를 주면 같은 팀 횟수 pt 를 따로 세고 (상대 횟수 = pc − pt),
+#    4명 고르기와 팀 나누기를 "팀 × 같은팀 중복 + 상대 × 상대 중복" 최소로 한다
+#    (Dart PartnerBracketScheduler 의 teamWeight / oppWeight 와 같은 기본 10 : 1)
+#  - cand=(cap, accept) 후보 예산: 4명 조합을 cap 개까지만 보거나 중복 accept 이하면 즉시 채택.
+#    시간은 대부분 strict 실패 재시도에서 나가므로, 덜 탐욕스러운 고르기가 재시도를 줄여
+#    오히려 빨리 끝나는 경우가 많다 (CAND["faster"] : 4‑32명 벤치마크 약 10배, 최악 100배 ↓,
+#    최대 중복은 같고 두 번 만나는 쌍이 늘어남)
+# 같은 rng 로 돌리면 o3_6~o3_9 의 _build_once 와 동일한 대진을 만든다.
+import random
+
+GPP = 4                                 # 1인당 경기 수
+WEIGHTS = (10, 1)                       # (같은 팀, 상대 팀) 중복 가중치
+CAND = {"full": None, "fast": (256, 0), "faster": (4, -1)}    # 후보 예산 (cap, accept)
+
+
+def limit_by_n(n: int) -> int:          # 인원수별 기본 중복 허용
+    return 4 if n == 4 else 3 if n <= 7 else 2
+
+
+def labels(n: int):
+    return [f"P{i+1}" for i in range(n)]
+
+
+def _bits(m: int):
+    """m 의 켜진 비트 위치를 오름차순으로"""
+    while m:
+        low = m & -m
+        yield low.bit_length() - 1
+        m ^= low
+
+
+def _ok_masks(order, forb):
+    """위치 공간(order 의 인덱스)으로 옮긴 "함께 뛸 수 있는 뒤쪽 후보" 마스크"""
+    pos = {p: i for i, p in enumerate(order)}
+    full = (1 << len(order)) - 1
+    ok = []
+    for i, a in enumerate(order):
+        bad = 0
+        for q in _bits(forb[a]):
+            j = pos.get(q)
+            if j is not None:
+                bad |= 1 << j
+        ok.append(full & ~bad & ~((1 << (i + 1)) - 1))
+    return ok
+
+
+def pick_group(order, n: int, pc, forb, remain, count=None, cand=None, hist=None):
+    """order(섞인 후보 선수 목록) 의 4명 조합 중 (중복합, -잔여경기합) 최소.
+    combinations(order, 4) 순서에서 처음 만난 최솟값을 돌려준다. 없으면 None
+    count=[본 4명 조합, 중복 하한으로 잘라낸 부분 조합] 을 주면 그 자리에서 더한다
+    cand=(cap, accept) : 후보 예산 (CAND 참고). 4명 조합을 cap 개 본 뒤에는 그때까지의
+    최선, 중복합이 accept 이하인 조합을 만나면 바로 그것을 돌려준다 (None 이면 끝까지)
+    hist : n·n 지난 모임 벌점표 – (중복합, -잔여경기합) 이 같은 조합끼리 6쌍 벌점 합이
+           작은 쪽. 앞의 두 키를 건드리지 않으므로 한도 · 슬롯 채우기 성공률은 그대로"""
+    m = len(order)
+    if m < 4:
+        return None
+    ok = _ok_masks(order, forb)
+    cap, accept = cand or (0, -1)
+    cap = cap or m ** 4
+
+    # 도달 가능한 최선 키: 중복 0 + 잔여 경기가 가장 많은 4명
+    top_need = sum(sorted((remain[p] for p in order), reverse=True)[:4])
+
+    best, best_ov, best_need, best_h = None, None, 0, 0
+    seen = cut = 0
+    try:
+        for i in range(m - 3):
+            a = order[i]; ra = a * n
+            m1 = ok[i]
+            for j in _bits(m1):
+                b = order[j]; rb = b * n
+                ov_b = pc[ra + b]
+                if best is not None and ov_b > best_ov:
+                    cut += 1
+                    continue
+                m2 = m1 & ok[j]
+                for k in _bits(m2):
+                    c = order[k]; rc = c * n
+                    ov_c = ov_b + pc[ra + c] + pc[rb + c]
+                    if best is not None and ov_c > best_ov:
+                        cut += 1
+                        continue
+                    for l in _bits(m2 & ok[k]):
+                        d = order[l]
+                        if seen >= cap and best is not None:
+                            return best
+                        seen += 1
+                        ov = ov_c + pc[ra + d] + pc[rb + d] + pc[rc + d]
+                        if best is not None and ov > best_ov:
+                            continue
+                        need = remain[a] + remain[b] + remain[c] + remain[d]
+                        if best is None or ov < best_ov or \
+                                (ov == best_ov and need > best_need):
+                            best, best_ov, best_need = (a, b, c, d), ov, need
+                            if hist is not None:
+                                best_h = hist[ra + b] + hist[ra + c] + hist[ra + d] + \
+                                    hist[rb + c] + hist[rb + d] + hist[rc + d]
+                            if ov <= accept or (ov == 0 and need == top_need and not best_h):
+                                return best
+                        elif hist is not None and need == best_need:     # ov == best_ov
+                            h = hist[ra + b] + hist[ra + c] + hist[ra + d] + \
+                                hist[rb + c] + hist[rb + d] + hist[rc + d]
+                            if h < best_h:
+                                best, best_h = (a, b, c, d), h
+                                if ov == 0 and need == top_need and not h:
+                                    return best
+        return best
+    finally:
+        if count is not None:
+            count[0] += seen; count[1] += cut
+
+
+def _team_ok(x: int, y: int, mate) -> bool:
+    """고정 파트너가 있는 선수는 그 파트너와만 같은 팀"""
+    return (mate[x] < 0 or mate[x] == y) and (mate[y] < 0 or mate[y] == x)
+
+
+def pick_weighted(order, n: int, pc, pt, forb, remain, weights=WEIGHTS, count=None,
+                  cand=None, mate=None):
+    """pick_group 의 가중치판. 키 = (min_팀나누기 tw·같은팀 + ow·상대, -잔여경기합).
+    돌려주는 (a, b, c, d) 는 (a, b) vs (c, d) 가 가장 좋은 팀 나누기.
+    부분 조합 하한: 두 명이면 둘은 같은 팀이거나 상대, 세 명이면 그중 한 쌍만 같은 팀
+    → 항이 모두 0 이상이라 하한이 단조로 커지므로 best 보다 크면 잘라낸다.
+    cand 의 accept 는 가중 점수 기준.
+    pt=None : 같은 팀 · 상대 항 모두 전체 만남 pc 로 (Dart PartnerBracketScheduler 점수)
+    mate    : 선수별 고정 파트너 (-1 = 없음). 주면 최소 나누기 대신 ab|cd, ac|bd, ad|bc 순으로
+              고정 파트너가 갈리지 않는 첫 나누기의 점수 (Dart 와 같음), 그런 나누기가 없으면 건너뜀.
+              고른 나누기 ≥ 최소 나누기라 위 하한은 그대로 쓸 수 있다"""
+    m = len(order)
+    if m < 4:
+        return None
+    tw, ow = weights
+    ok = _ok_masks(order, forb)
+    cap, accept = cand or (0, -1)
+    cap = cap or m ** 4
+    top_need = sum(sorted((remain[p] for p in order), reverse=True)[:4])
+
+    def cost(x, y):                     # (같은 팀일 때, 상대일 때) 가중 중복
+        if pt is None:
+            v = pc[x * n + y]
+            return tw * v, ow * v
+        t = pt[x * n + y]
+        return tw * t, ow * (pc[x * n + y] - t)
+
+    best, best_s, best_need = None, None, 0
+    seen = cut = 0
+    try:
+        for i in range(m - 3):
+            a = order[i]
+            m1 = ok[i]
+            for j in _bits(m1):
+                b = order[j]
+                tab, oab = cost(a, b)
+                if best is not None and min(tab, oab) > best_s:
+                    cut += 1
+                    continue
+                m2 = m1 & ok[j]
+                for k in _bits(m2):
+                    c = order[k]
+                    tac, oac = cost(a, c); tbc, obc = cost(b, c)
+                    if best is not None and \
+                            min(tab + oac + obc, tac + oab + obc, tbc + oab + oac) > best_s:
+                        cut += 1
+                        continue
+                    for l in _bits(m2 & ok[k]):
+                        d = order[l]
+                        if seen >= cap and best is not None:
+                            return best
+                        seen += 1
+                        tad, oad = cost(a, d); tbd, obd = cost(b, d); tcd, ocd = cost(c, d)
+                        s1 = tab + tcd + oac + oad + obc + obd      # ab | cd
+                        s2 = tac + tbd + oab + oad + obc + ocd      # ac | bd
+                        s3 = tad + tbc + oab + oac + obd + ocd      # ad | bc
+                        if mate is None:
+                            sc, g = s1, (a, b, c, d)
+                            if s2 < sc:
+                                sc, g = s2, (a, c, b, d)
+                            if s3 < sc:
+                                sc, g = s3, (a, d, b, c)
+                        else:
+                            sc, g = next(((s, g) for s, g in
+                                          ((s1, (a, b, c, d)), (s2, (a, c, b, d)),
+                                           (s3, (a, d, b, c)))
+                                          if _team_ok(g[0], g[1], mate)
+                                          and _team_ok(g[2], g[3], mate)), (None, None))
+                            if g is None:
+                                continue
+                        if best is not None and sc > best_s:
+                            continue
+                        need = remain[a] + remain[b] + remain[c] + remain[d]
+                        if best is None or sc < best_s or \
+                                (sc == best_s and need > best_need):
+                            best, best_s, best_need = g, sc, need
+                            if sc <= accept or (sc == 0 and need == top_need):
+                                return best
+        return best
+    finally:
+        if count is not None:
+            count[0] += seen; count[1] += cut
+
+
+def pick_window(order, n: int, pc, forb, remain, window: int | None = None, count=None,
+                pt=None, weights=None, cand=None, hist=None, mate=None):
+    """pick_group 을 window 명 후보로 제한. 섞인 order 를 남은 경기 내림차순으로
+    안정 정렬해(동률은 섞인 순서 유지) 앞에서부터 자른다.
+    weights 를 주면 pick_weighted (pt, mate 는 그대로 넘김)"""
+    def pick(o):
+        if weights:
+            return pick_weighted(o, n, pc, pt, forb, remain, weights, count, cand, mate)
+        return pick_group(o, n, pc, forb, remain, count, cand, hist)
+
+    if not window or len(order) <= window:
+        return pick(order)
+    order.sort(key=lambda p: -remain[p])
+    while True:
+        best = pick(order[:window])
+        if best is not None or window >= len(order):
+            return best
+        window *= 2
+
+
+def add_group(g, n: int, pc, forb, limit: int, pt=None):
+    """g 의 모든 쌍 카운트 +1, 한도에 닿은 쌍은 금지 마스크에 반영.
+    pt 를 주면 (g[0], g[1]) · (g[2], g[3]) 를 같은 팀으로 센다"""
+    for x in range(4):
+        a = g[x]
+        for y in range(x + 1, 4):
+            b = g[y]
+            pc[a * n + b] += 1; pc[b * n + a] += 1
+            if pc[a * n + b] >= limit:
+                forb[a] |= 1 << b; forb[b] |= 1 << a
+    if pt is not None:
+        for a, b in (g[:2], g[2:]):
+            pt[a * n + b] += 1; pt[b * n + a] += 1
+
+
+def team_stats(pc, pt, n: int):
+    """같은 팀 / 상대 중복의 최댓값"""
+    team = [pt[a * n + b] for a in range(n) for b in range(a + 1, n)]
+    opp  = [pc[a * n + b] - pt[a * n + b] for a in range(n) for b in range(a + 1, n)]
+    return {"team_max": max(team, default=0), "opp_max": max(opp, default=0)}
+
+
+def pair_stats(pc, n: int, limit: int):
+    vals = [pc[a * n + b] for a in range(n) for b in range(n) if a != b]
+    return {"max": max(vals),
+            "avg": round(sum(vals) / len(vals), 2),
+            "limit": limit}
+
+
+# ── 조기 가지치기 (strict) ──────────────────────────────────
+# 슬롯 마감 규칙 len(slot) ≥ min(courts, 남은 경기) 를 풀면, 슬롯 시작 때 G 경기가
+# 남아 있으면 그 슬롯은 최소 kmin(G) = min(courts, ⌈G/2⌉) 경기를 채워야 한다.
+# 따라서 G 경기로 만들 수 있는 슬롯은 많아야 smax(G) 개 (매번 kmin 만 쓰는 경우).
+# replan 이 시작 상태부터 가망 없는 strict 단계를 시도 없이 건너뛸 때 쓴다.
+# (경기마다 검사하는 것은 n=32 에서 재시도 속도만 1/3 로 떨어뜨리고 성공 수는 같아 두지 않음)
+def slot_bounds(G: int, courts: int):
+    """kmin[0..G], smax[0..G]"""
+    kmin = [min(courts, (g + 1) // 2) for g in range(G + 1)]
+    smax = [0] * (G + 1)
+    for g in range(1, G + 1):
+        smax[g] = max(smax[g - 1], 1 + smax[g - kmin[g]])
+    return kmin, smax
+
+
+def doomed(n: int, limit: int, courts: int, remain, pc, forb) -> bool:
+    """슬롯 시작 상태의 필요 조건 검사. True 면 이 상태에서는 끝까지 채울 수 없다"""
+    G = sum(remain) // 4
+    kmin, smax = slot_bounds(G, courts)
+    active, free, top = 0, 0, 0
+    for p in range(n):
+        r = remain[p]
+        if r:
+            active |= 1 << p
+            free += 1; top = max(top, r)
+    # ① 이번 슬롯을 최소 경기 수까지 채울 선수가 남아 있나
+    if free < 4 * kmin[G]:
+        return True
+    # ② 남은 경기를 치를 슬롯이 충분한가 (선수는 슬롯당 한 경기)
+    if top > smax[G - kmin[G]] + 1:
+        return True
+    # ③ 한도 안에서 더 만날 수 있는 상대 여유 ≥ 3 × 남은 경기
+    for p in _bits(active):
+        row, cap = p * n, 0
+        for q in _bits(active & ~forb[p] & ~(1 << p)):
+            cap += min(limit - pc[row + q], remain[q])
+        if cap < 3 * remain[p]:
+            return True
+    return False
+
+
+def _fail(probe, slots):
+    if probe:
+        probe.seed(len(slots), False)
+    return None
+
+
+def build_from(players, courts: int, limit: int, rng: random.Random,
+               remain, pc, forb, strict: bool = True, window: int | None = None,
+               probe=None, pt=None, weights=None, cand=None, hist=None, mate=None):
+    """remain / pc / forb 상태에서 이어서 슬롯을 채운다 (상태는 제자리 갱신).
+    성공 시 (schedule, slots), 실패 시 None
+    probe : instrument.Probe – 조합 수를 세고 끝날 때 probe.seed(채운 슬롯 수, 성공)
+    weights: (팀, 상대) 가중치 – pick_weighted 로 고르고 그 팀 나누기를 쓴다 (pt 갱신)
+    cand   : (cap, accept) 후보 예산 – 경기마다 pick_group 에 그대로 넘긴다
+    hist   : n·n 지난 모임 벌점표 (history.PairHistory.table) – pick_group 의 세 번째 키.
+             weights 와는 같이 못 씀
+    mate   : 고정 파트너 (weights 와 함께, pick_weighted 참고). 그 쌍의 만남은 세지 않는다"""
+    n = len(players)
+    schedule, slots = [], []
+    count = probe.count if probe else None
+
+    while any(remain):
+        slot, used = [], 0
+        while len(slot) < courts:
+            order = [p for p in range(n) if remain[p] and not used >> p & 1]
+            if len(order) < 4:
+                break
+            rng.shuffle(order)
+            best = pick_window(order, n, pc, forb, remain, window, count, pt, weights,
+                               cand, hist, mate)
+            if best is None:
+                break
+
+            lst = [players[p] for p in best]
+            if weights:                     # 팀은 정해짐 – 팀 안 순서와 좌우만 섞는다
+                t1, t2 = lst[:2], lst[2:]
+                rng.shuffle(t1); rng.shuffle(t2)
+                if rng.random() < 0.5:
+                    t1, t2 = t2, t1
+                lst = t1 + t2
+            else:
+                rng.shuffle(lst)
+            slot.append((tuple(lst[:2]), tuple(lst[2:])))
+            for p in best:
+                used |= 1 << p
+                remain[p] -= 1
+            add_group(best, n, pc, forb, limit, pt)
+            if mate is not None:
+                for p in best:
+                    if mate[p] >= 0:
+                        pc[p * n + mate[p]] = 0
+
+        if strict:                          # 4명이 안 남으면 빈 슬롯 – 영원히 못 끝냄
+            if not slot or len(slot) < min(courts, sum(remain) // 4):
+                return _fail(probe, slots)
+        elif not slot:
+            return _fail(probe, slots)
+
+        slots.append(slot); schedule.extend(slot)
+
+    if probe:
+        probe.seed(len(slots), True)
+    return schedule, slots
+
+
+def build_once(n: int, courts: int, limit: int, rng: random.Random,
+               gpp: int = GPP, strict: bool = True, window: int | None = None,
+               probe=None, weights=None, cand=None, hist=None):
+    """한 번의 시드로 슬롯‑우선 스케줄 생성. 실패 시 None
+    strict=True  : 슬롯마다 min(courts, 남은경기) 만큼 채워야 성공 (o3_7~9)
+    strict=False : 슬롯에 한 경기라도 들어가면 진행 (o3_6)
+    weights      : (팀, 상대) – 주면 stats 에 team_max / opp_max 도 넣는다"""
+    players = labels(n)
+    pc      = [0] * (n * n)
+    pt      = [0] * (n * n) if weights else None
+    res = build_from(players, courts, limit, rng, [gpp] * n, pc, [0] * n, strict, window,
+                     probe=probe, pt=pt, weights=weights, cand=cand, hist=hist)
+    if res is None:
+        return None
+    stats = pair_stats(pc, n, limit)
+    if weights:
+        stats.update(team_stats(pc, pt, n))
+    return res[0], res[1], stats, players
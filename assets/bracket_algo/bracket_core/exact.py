@@ -0,0 +1,200 @@
+# bracket_core/exact.py
+# 완전 탐색(백트래킹) 솔버 – 해를 찾거나 "해 없음" 을 증명한다
+# ───────────────────────────────────────────────────────────
+# 모델은 build_once 보다 엄격하다.
+#   - 슬롯마다 정확히 min(courts, 슬롯 앞 남은 경기) 개의 서로 겹치지 않는 4인 경기
+#     (build_once 는 min(courts, 슬롯 뒤 남은 경기) 이상이면 통과 – 3,2,2 도 되지만 여기선 3,3,1 만)
+#   - 1인당 gpp 경기, 모든 쌍의 만남 ≤ limit
+# 그래서 찾은 해는 build_once 로도 유효하지만, unsat 은 이 모델에서의 증명이다.
+# courts == 1 이면 두 규칙이 같아 build_once 에서도 불가능.
+# generate_schedule 은 기본 한도 재시도가 실패한 뒤에만 부른다 (unsat 으로 재시도를 건너뛰지 않음).
+# 랜덤 재시도는 운 좋게 찾거나 포기할 뿐이라, limit 2 가 불가능한
+# (n, courts) 에도 수천 번을 헛돈다. 여기서는
+#   · 대칭 제거
+#       (1) 첫 슬롯은 (0,1,2,3), (4,5,6,7), … 로 고정 (선수 라벨 대칭)
+#       (2) 아직 한 경기도 안 뛴 선수끼리는 서로 바꿔도 같다 → 번호 순으로만 투입,
+#           그런 선수가 쉬면 나머지 신인도 같이 쉰다
+#       (3) 신인이 바닥난 뒤의 꽉 찬 슬롯들은 순서를 바꿔도 같다
+#           → 첫 경기 기준 사전순으로만 나열
+#   · 제약 전파
+#       - 슬롯을 채울 후보 인원, 남은 슬롯 수 ≥ 남은 경기
+#       - 선수별 "아직 만날 수 있는 횟수" 합 ≥ 3 × 남은 경기
+# 로 가지를 쳐서 끝까지 돌면 infeasible 을 확정한다.
+import math, sys, time
+
+from .engine import GPP, labels, limit_by_n, pair_stats
+from .engine import _bits
+
+
+class _Budget(Exception):
+    pass
+
+
+def _low(m: int) -> int:
+    return (m & -m).bit_length() - 1
+
+
+def solve_exact(n: int, courts: int | None = None, limit: int | None = None,
+                gpp: int = GPP, node_limit: int | None = None,
+                time_limit: float | None = None):
+    """(결과, 정보) 를 돌려준다.
+    결과 : build_once 와 같은 (schedule, slots, stats, players) 또는 None
+    정보 : {"status": "sat" | "unsat" | "unknown", "reason", "nodes", ...}
+           unsat 이면 reason 이 불가능 증명(계수 조건 또는 전수 탐색)"""
+    courts = courts or n // 4
+    limit  = limit or limit_by_n(n)
+    info = {"status": "unknown", "n": n, "courts": courts, "gpp": gpp,
+            "limit": limit, "nodes": 0, "reason": ""}
+
+    def unsat(reason):
+        info.update(status="unsat", reason=reason)
+        return None, info
+
+    if not 1 <= courts <= n // 4:
+        raise ValueError("코트 수는 1‑⌊N/4⌋")
+    if n * gpp % 4:
+        return unsat(f"총 출전 {n}×{gpp} 가 4의 배수가 아님")
+    if 3 * gpp > limit * (n - 1):
+        return unsat(f"1인당 필요한 만남 3×{gpp} > 만날 수 있는 최대 {limit}×{n - 1}")
+
+    total = n * gpp // 4
+    S     = math.ceil(total / courts)           # 슬롯 수
+    if gpp > S:
+        return unsat(f"1인당 {gpp}경기 > 슬롯 {S}개")
+
+    remain = [gpp] * n
+    pc     = [0] * (n * n)
+    forb   = [0] * n
+    fresh  = [(1 << n) - 1]                     # 아직 안 뛴 선수
+    games  = []                                  # (슬롯, (a,b,c,d))
+    deadline = time.monotonic() + time_limit if time_limit else None
+
+    def feasible(s, used, sat, avail_need):
+        """필요 조건 검사. False 면 이 가지에는 해가 없다"""
+        slots_left = S - s
+        needers = 0
+        for p in range(n):
+            r = remain[p]
+            if not r:
+                continue
+            needers |= 1 << p
+            if r > slots_left - ((used | sat) >> p & 1):
+                return False
+        if bin(needers & ~used & ~sat).count("1") < avail_need:
+            return False
+        for p in _bits(needers):
+            cap = 0; row = p * n
+            for q in _bits(needers & ~forb[p] & ~(1 << p)):
+                cap += min(limit - pc[row + q], remain[q])
+            if cap < 3 * remain[p]:
+                return False
+        return True
+
+    def place(g, s):
+        for x in range(4):
+            a = g[x]
+            remain[a] -= 1
+            for y in range(x + 1, 4):
+                b = g[y]
+                pc[a * n + b] += 1; pc[b * n + a] += 1
+                if pc[a * n + b] >= limit:
+                    forb[a] |= 1 << b; forb[b] |= 1 << a
+        fresh.append(fresh[-1] & ~sum(1 << p for p in g))
+        games.append((s, g))
+
+    def unplace(g):
+        games.pop(); fresh.pop()
+        for x in range(4):
+            a = g[x]
+            remain[a] += 1
+            for y in range(x + 1, 4):
+                b = g[y]
+                if pc[a * n + b] >= limit:
+                    forb[a] &= ~(1 << b); forb[b] &= ~(1 << a)
+                pc[a * n + b] -= 1; pc[b * n + a] -= 1
+
+    def picks(mask, fa):
+        """mask 후보 중 선택 가능: 신인은 fa 의 가장 낮은 번호 하나만"""
+        return (mask & ~fa) | (mask & fa & -fa)
+
+    def rec(s, k, used, sat, left, first_prev, first_cur, B):
+        info["nodes"] += 1
+        if node_limit and info["nodes"] > node_limit:
+            raise _Budget
+        if deadline and info["nodes"] & 1023 == 0 and time.monotonic() > deadline:
+            raise _Budget
+        if left == 0:
+            return True
+        need_s = min(courts, left + k)
+        if k == need_s:                          # 슬롯 마감 → 다음 슬롯
+            nb = B if B is not None else (s if fresh[-1] == 0 else None)
+            full = need_s == courts
+            return rec(s + 1, 0, 0, 0, left,
+                       first_cur if full else None, None, nb)
+        if not feasible(s, used, sat, 4 * (need_s - k)):
+            return False
+
+        avail = 0
+        for p in range(n):
+            if remain[p] and not (used | sat) >> p & 1:
+                avail |= 1 << p
+        p = _low(avail)
+        fa = fresh[-1] & avail & ~(1 << p)
+        # (3) 신인 소진 뒤의 꽉 찬 슬롯은 첫 경기 사전순
+        ordered = (k == 0 and B is not None and s - 1 > B
+                   and need_s == courts and first_prev is not None)
+
+        # ① p 가 이번 슬롯에 뛴다 (p 가 이 경기의 최소 번호)
+        #    덜 만난 · 남은 경기가 많은 상대부터 시도
+        def order(mask, *grp):
+            return sorted(_bits(mask), key=lambda q: (
+                sum(pc[x * n + q] for x in grp), -remain[q], q))
+
+        m1 = avail & ~forb[p] & ~(1 << p)
+        for b in order(picks(m1, fa), p):
+            fb = fa & ~(1 << b)
+            m2 = m1 & ~forb[b] & ~((2 << b) - 1)
+            for c in order(picks(m2, fb), p, b):
+                fc = fb & ~(1 << c)
+                m3 = m2 & ~forb[c] & ~((2 << c) - 1)
+                for d in order(picks(m3, fc), p, b, c):
+                    g = (p, b, c, d)
+                    if ordered and g < first_prev:
+                        continue
+                    place(g, s)
+                    if rec(s, k + 1, used | sum(1 << x for x in g), sat,
+                           left - 1, first_prev, first_cur or g, B):
+                        return True
+                    unplace(g)
+
+        # ② p 는 이번 슬롯 쉰다 (신인이면 남은 신인 모두 같이 쉰다)
+        rest = (1 << p) | (fa if fresh[-1] >> p & 1 else 0)
+        return rec(s, k, used, sat | rest, left, first_prev, first_cur, B)
+
+    # (1) 첫 슬롯 고정
+    first = [tuple(range(4 * i, 4 * i + 4)) for i in range(min(courts, total))]
+    for g in first:
+        place(g, 0)
+    depth = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(depth, 2 * n * (S + 1) + 200))
+    try:
+        found = rec(0, len(first), (1 << 4 * len(first)) - 1, 0,
+                    total - len(first), None, first[0], None)
+    except _Budget:
+        info["reason"] = "탐색 한도 초과"
+        return None, info
+    finally:
+        sys.setrecursionlimit(depth)
+
+    if not found:
+        return unsat(f"대칭 제거 + 제약 전파 전수 탐색 ({info['nodes']} 노드)")
+
+    players = labels(n)
+    slots = [[] for _ in range(S)]
+    for s, g in games:
+        a, b, c, d = (players[x] for x in g)
+        slots[s].append(((a, b), (c, d)))
+    slots = [sl for sl in slots if sl]
+    info["status"] = "sat"
+    return ([gm for sl in slots for gm in sl], slots,
+            pair_stats(pc, n, limit), players), info
@@ -0,0 +1,22 @@
+# bracket_core/heatmap.py
+# 플레이어 간 중복 히트맵 – numpy / pandas / matplotlib / seaborn 은 그릴 때만 import
+# ───────────────────────────────────────────────────────────
+
+
+def overlap_frame(schedule):
+    """중복 행렬을 정렬된 선수 라벨로 감싼 DataFrame (한 번에 생성)"""
+    import pandas as pd
+    from .matrix import schedule_matrix
+
+    m, ps = schedule_matrix(schedule)
+    return pd.DataFrame(m, index=ps, columns=ps)
+
+
+def show_heatmap(schedule, title: str = "플레이어 간 중복 히트맵"):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    df = overlap_frame(schedule)
+    plt.figure(figsize=(8, 6))
+    sns.heatmap(df, annot=True, cmap="YlGnBu", fmt="d", cbar=True)
+    plt.title(title); plt.tight_layout(); plt.show()
@@ -0,0 +1,164 @@
+# bracket_core/history.py
+# 모임 간 만남 기록 – 감쇠하는 쌍 · 같은 팀 횟수를 파일에 쌓아 두고 다음 대진에 벌점으로
+# ───────────────────────────────────────────────────────────
+# 대진은 매번 빈 쌍 카운트에서 시작하므로 같은 사람끼리 주마다 또 만난다.
+# PairHistory 는 선수 ID(이름) 별로 번호를 주고 capacity × capacity float32 행렬 두 개
+# (만남 · 같은 팀) 를 mmap 한 파일에 둔다. 회원 수백 명, 몇 년 치 모임도 파일 하나.
+#  - 감쇠: 모임마다 기존 값 × 0.5^(1/half_life). 전체를 곱하지 않고 공통 배율 s 만 줄이고
+#          새 값은 1/s 로 더한다 (실제 값 = 저장값 × s). 1/s 가 RENORM 을 넘으면 한 번 전체 재정규화
+#          (numpy 로 한 번에 – 이때만 import)
+#  - 기록 · 조회 모두 그날 경기의 쌍 / 그날 명단의 쌍만 건드린다 (행렬 전체를 읽지 않음)
+#  - table(names) → engine.build_from 의 hist (n·n 정수, 기록 1회 = UNIT) :
+#    pick_group 이 (이번 밤 중복, -잔여 경기) 가 같은 조합 중 벌점 합이 작은 것을 고른다.
+#    벌점을 점수에 직접 섞으면 잔여 경기 우선이 깨져 특정 기록에서 모든 시드가
+#    슬롯 채우기에 실패했다 – 세 번째 키로 두면 성공률은 그대로, 지난주 다시 만난 쌍 약 20% ↓
+# 파일: path (헤더 + 행렬 둘), path + ".ids" (JSON 번호 → ID 목록)
+import json, mmap, os, struct
+
+MAGIC    = b"BKHIST1\0"
+_HEAD    = struct.Struct("<8sIIdd")     # magic, capacity, sessions, s(배율), half_life
+HEADER   = 64
+CAPACITY = 256
+RENORM   = 1e20
+UNIT     = 4                            # table() 의 기록 1회 (반올림 해상도)
+
+
+class PairHistory:
+    """선수 ID 별 감쇠 만남 기록. with 문으로 쓰면 끝날 때 save()"""
+
+    def __init__(self, path: str, half_life: float = 8.0, capacity: int = CAPACITY):
+        self.path = path
+        self.ids  = []
+        if os.path.exists(path):
+            with open(path + ".ids", encoding="utf-8") as f:
+                self.ids = json.load(f)
+            self._open()
+        else:
+            self._create(path, capacity, 0, 1.0, half_life)
+            self._open()
+        self.pos = {p: i for i, p in enumerate(self.ids)}
+
+    # ── 파일 ────────────────────────────────────────────────
+    @staticmethod
+    def _create(path, capacity, sessions, s, half_life):
+        with open(path, "wb") as f:
+            f.write(_HEAD.pack(MAGIC, capacity, sessions, s, half_life).ljust(HEADER, b"\0"))
+            f.truncate(HEADER + 2 * 4 * capacity * capacity)
+
+    def _open(self):
+        self._f  = open(self.path, "r+b")
+        self._mm = mmap.mmap(self._f.fileno(), 0)
+        magic, self.capacity, self.sessions, self.s, self.half_life = \
+            _HEAD.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: 만남 기록 파일이 아닙니다.")
+        cc = self.capacity * self.capacity
+        body = memoryview(self._mm)[HEADER:].cast("f")
+        self.meet, self.team = body[:cc], body[cc:2 * cc]
+
+    def _close_map(self):
+        self.meet.release(); self.team.release()
+        self.meet = self.team = None
+        self._mm.close(); self._f.close()
+
+    def _grow(self, need: int):
+        """capacity 를 need 이상으로 두 배씩 – 새 파일에 행 단위로 옮겨 적는다"""
+        cap = self.capacity
+        new = cap
+        while new < need:
+            new *= 2
+        rows = [(self.meet[i * cap:(i + 1) * cap].tobytes(),
+                 self.team[i * cap:(i + 1) * cap].tobytes()) for i in range(len(self.ids))]
+        self._close_map()
+        tmp = self.path + ".tmp"
+        self._create(tmp, new, self.sessions, self.s, self.half_life)
+        with open(tmp, "r+b") as f:
+            for k, off in enumerate((HEADER, HEADER + 4 * new * new)):
+                for i, r in enumerate(rows):
+                    f.seek(off + 4 * new * i); f.write(r[k])
+        os.replace(tmp, self.path)
+        self._open()
+
+    def save(self):
+        _HEAD.pack_into(self._mm, 0, MAGIC, self.capacity, self.sessions, self.s,
+                        self.half_life)
+        self._mm.flush()
+        tmp = self.path + ".ids.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.ids, f, ensure_ascii=False)
+        os.replace(tmp, self.path + ".ids")
+
+    def close(self):
+        self.save()
+        self._close_map()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── 기록 ────────────────────────────────────────────────
+    def _index(self, p) -> int:
+        i = self.pos.get(p)
+        if i is None:
+            i = self.pos[p] = len(self.ids)
+            self.ids.append(p)
+            if i >= self.capacity:
+                self._grow(i + 1)
+        return i
+
+    def _renorm(self):
+        """저장값 전체에 s 를 곱해 배율을 1 로 – numpy 로 mmap 을 제자리에서 한 번에"""
+        import numpy as np
+        body = np.frombuffer(self._mm, np.float32, 2 * self.capacity * self.capacity, HEADER)
+        body *= np.float32(self.s)
+        del body                                # mmap 을 닫을 수 있게 버퍼 참조를 놓는다
+        self.s = 1.0
+
+    def record(self, schedule):
+        """한 모임의 대진 [(t1, t2), ..] 을 더한다 – 먼저 기존 기록을 한 모임만큼 감쇠"""
+        self.s *= 0.5 ** (1 / self.half_life)
+        if 1 / self.s > RENORM:
+            self._renorm()
+        inc, cap = 1 / self.s, self.capacity
+        meet, team = self.meet, self.team
+        for t1, t2 in schedule:
+            g = [self._index(p) for p in (*t1, *t2)]
+            if cap != self.capacity:            # _grow 로 행렬이 바뀜
+                cap, meet, team = self.capacity, self.meet, self.team
+            for x in range(4):
+                for y in range(x + 1, 4):
+                    a, b = g[x], g[y]
+                    meet[a * cap + b] += inc; meet[b * cap + a] += inc
+            for a, b in (g[:2], g[2:]):
+                team[a * cap + b] += inc; team[b * cap + a] += inc
+        self.sessions += 1
+
+    # ── 조회 ────────────────────────────────────────────────
+    def meets(self, a, b) -> float:
+        """감쇠된 만남 횟수 (모르는 ID 면 0)"""
+        i, j = self.pos.get(a), self.pos.get(b)
+        return 0.0 if i is None or j is None else self.meet[i * self.capacity + j] * self.s
+
+    def teammates(self, a, b) -> float:
+        i, j = self.pos.get(a), self.pos.get(b)
+        return 0.0 if i is None or j is None else self.team[i * self.capacity + j] * self.s
+
+    def table(self, names, unit: int = UNIT, team_weight: float = 1.0):
+        """names 순서의 n·n 정수 벌점표 (build_from / generate_schedule 의 hist).
+        값 = round(unit · (만남 + team_weight · 같은 팀))"""
+        n, cap, s = len(names), self.capacity, self.s * unit
+        idx = [self.pos.get(p) for p in names]
+        out = [0] * (n * n)
+        for a, i in enumerate(idx):
+            if i is None:
+                continue
+            row = i * cap
+            for b in range(a + 1, n):
+                j = idx[b]
+                if j is None:
+                    continue
+                v = round((self.meet[row + j] + team_weight * self.team[row + j]) * s)
+                out[a * n + b] = out[b * n + a] = v
+        return out
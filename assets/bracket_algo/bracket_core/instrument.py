@@ -0,0 +1,85 @@
+# bracket_core/instrument.py
+# 탐색 계측 – 카운터 · 진행 콜백 · 구조화된 추적
+# ───────────────────────────────────────────────────────────
+# generate_schedule(probe=Probe()) 처럼 넘기면 엔진이 그 자리에서 센다 (안 넘기면 비용 없음).
+#  - quads    : pick_group 이 끝까지 본 4명 조합 수
+#  - pruned   : 중복 하한(best_ov) 으로 잘라낸 2·3명 부분 조합 수
+#  - restarts : build_from 시도 수, successes : 그중 성공
+#  - slots    : {재시도 하나가 채운 슬롯 수: 횟수} – 몇 번째 슬롯에서 막히는지
+#  - phases   : {단계: 초} – exact / limit2 / limit3 …
+# on_progress(probe) 는 every 회 재시도마다 · 성공할 때 · 단계가 끝날 때 불린다.
+# trace=True 면 사건마다 {"t", "ev", ..} 를 events 에 쌓고 export() 로 JSON 저장.
+import json, time
+from contextlib import contextmanager
+
+
+class Probe:
+    def __init__(self, on_progress=None, every: int = 100, trace: bool = False):
+        self.count     = [0, 0]                 # [quads, pruned] – pick_group 이 직접 더함
+        self.restarts  = 0
+        self.successes = 0
+        self.slots     = {}
+        self.phases    = {}
+        self.phase     = None
+        self.on_progress, self.every = on_progress, every
+        self.events = [] if trace else None
+        self.t0 = time.perf_counter()
+
+    quads  = property(lambda self: self.count[0])
+    pruned = property(lambda self: self.count[1])
+
+    def _event(self, ev: str, **kw):
+        if self.events is not None:
+            self.events.append({"t": round(time.perf_counter() - self.t0, 6),
+                                "ev": ev, "phase": self.phase, **kw})
+
+    def seed(self, slots: int, ok: bool, **kw):
+        """build_from 한 번이 끝남: 채운 슬롯 수와 성공 여부"""
+        self.restarts += 1
+        self.slots[slots] = self.slots.get(slots, 0) + 1
+        if ok:
+            self.successes += 1
+        self._event("seed", slots=slots, ok=ok, **kw)
+        if self.on_progress and (ok or self.restarts % self.every == 0):
+            self.on_progress(self)
+
+    def merge(self, d: dict):
+        """다른 프로세스에서 센 summary() 일부(quads/pruned/restarts/successes/slots)를 더한다"""
+        self.count[0] += d["quads"]; self.count[1] += d["pruned"]
+        self.restarts += d["restarts"]; self.successes += d["successes"]
+        for k, v in d["slots"].items():
+            self.slots[int(k)] = self.slots.get(int(k), 0) + v
+        self._event("merge", restarts=d["restarts"], ok=bool(d["successes"]))
+        if self.on_progress:
+            self.on_progress(self)
+
+    @contextmanager
+    def timed(self, name: str, **kw):
+        """with probe.timed("limit2"): … – 단계 시간 누적 + 시작/끝 사건"""
+        prev, self.phase = self.phase, name
+        self._event("phase_start", **kw)
+        t = time.perf_counter()
+        try:
+            yield self
+        finally:
+            dt = time.perf_counter() - t
+            self.phases[name] = self.phases.get(name, 0.0) + dt
+            self._event("phase_end", seconds=round(dt, 6))
+            if self.on_progress:
+                self.on_progress(self)
+            self.phase = prev
+
+    def summary(self) -> dict:
+        el = time.perf_counter() - self.t0
+        return {"quads": self.quads, "pruned": self.pruned,
+                "restarts": self.restarts, "successes": self.successes,
+                "slots": dict(sorted(self.slots.items())),
+                "phases": {k: round(v, 4) for k, v in self.phases.items()},
+                "elapsed": round(el, 4),
+                "restarts_per_s": round(self.restarts / el, 1) if el else 0.0}
+
+    def export(self, path: str):
+        """{"summary": .., "events": [..]} 를 JSON 으로 저장"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"summary": self.summary(), "events": self.events or []},
+                      f, ensure_ascii=False)
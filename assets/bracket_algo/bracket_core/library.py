@@ -0,0 +1,126 @@
+# bracket_core/library.py
+# 미리 계산해 둔 대진표 저장소
+# ───────────────────────────────────────────────────────────
+# P1..Pn 라벨은 서로 바꿔도 되는 자리이므로, 한 번 찾은 대진은
+# (인원, 코트, 1인당 경기, 중복 한도) 가 같은 모든 모임에 이름만 바꿔 재사용할 수 있다.
+#  - 오프라인 배치(fill / python -m bracket_core fill)로 키마다 여러 개를 채워 두고
+#  - (max, avg, 제곱합) 중복 순으로 정렬해 상위 keep 개만 보관
+#    (avg 는 인원·경기 수가 같으면 늘 같으므로 제곱합이 실제 변별 기준)
+#  - 모임 당일에는 lookup() 으로 실제 이름을 자리에 꽂기만 한다 (miss 면 실시간 탐색)
+# 저장 형식은 JSON: {"n-courts-gpp-limit": [{"max":..,"avg":..,"sq":..,"slots":[[[[a,b],[c,d]],..],..]}, ..]}
+import json, os, random
+
+from .engine import GPP, limit_by_n
+from .search import restart_search
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "schedule_library.json")
+KEEP = 5                                # 키당 보관 개수
+
+
+def lib_key(n: int, courts: int, gpp: int, limit: int) -> str:
+    return f"{n}-{courts}-{gpp}-{limit}"
+
+
+def _to_index(slots, players):
+    """라벨 대진 → 0‑based 번호 대진"""
+    pos = {p: i for i, p in enumerate(players)}
+    return [[[[pos[p] for p in t1], [pos[p] for p in t2]] for t1, t2 in slot]
+            for slot in slots]
+
+
+def _square_sum(idx_slots):
+    cnt = {}
+    for slot in idx_slots:
+        for t1, t2 in slot:
+            g = t1 + t2
+            for x in range(4):
+                for y in range(x + 1, 4):
+                    k = (min(g[x], g[y]), max(g[x], g[y]))
+                    cnt[k] = cnt.get(k, 0) + 1
+    return sum(v * v for v in cnt.values())
+
+
+class ScheduleLibrary:
+    """(인원, 코트, 1인당 경기, 중복 한도) → 품질순 대진 목록"""
+
+    def __init__(self, path: str = DEFAULT_PATH, keep: int = KEEP):
+        self.path = path
+        self.keep = keep
+        self.data = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.data = json.load(f)
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, separators=(",", ":"))
+        os.replace(tmp, self.path)          # 쓰다 끊겨도 기존 파일은 온전
+
+    def add(self, n: int, courts: int, gpp: int, limit: int, res) -> bool:
+        """build_once 결과 (schedule, slots, stats, players) 를 보관.
+        이미 있는 대진이거나 상위 keep 개에 못 들면 False"""
+        _, slots, stats, players = res
+        idx = _to_index(slots, players)
+        entry = {"max": stats["max"], "avg": stats["avg"],
+                 "sq": _square_sum(idx), "slots": idx}
+        lst = self.data.setdefault(lib_key(n, courts, gpp, limit), [])
+        if any(e["slots"] == entry["slots"] for e in lst):
+            return False
+        lst.append(entry)
+        lst.sort(key=lambda e: (e["max"], e["avg"], e["sq"]))
+        del lst[self.keep:]
+        return entry in lst
+
+    def lookup(self, names, courts: int, limit: int, gpp: int = GPP,
+               rank: int = 0, rng: random.Random | None = None):
+        """names 를 저장된 대진의 자리에 배정. 없으면 None
+        rng 를 주면 이름↔자리 배정을 섞어 매주 같은 자리에 앉지 않게 한다"""
+        lst = self.data.get(lib_key(len(names), courts, gpp, limit))
+        if not lst or rank >= len(lst):
+            return None
+        e = lst[rank]
+        names = list(names)
+        if rng is not None:
+            rng.shuffle(names)
+        slots = [[(tuple(names[i] for i in t1), tuple(names[i] for i in t2))
+                  for t1, t2 in slot] for slot in e["slots"]]
+        schedule = [g for slot in slots for g in slot]
+        stats = {"max": e["max"], "avg": e["avg"], "limit": limit}
+        return schedule, slots, stats, list(names)
+
+    def get(self, names, courts: int, limit: int, gpp: int = GPP,
+            rng: random.Random | None = None, restarts: int = 3000):
+        """lookup → miss 면 실시간 탐색 후 결과를 저장소에도 넣는다"""
+        res = self.lookup(names, courts, limit, gpp, rng=rng)
+        if res:
+            return res
+        n = len(names)
+        found = restart_search(n, courts, limit, rng or random.Random(),
+                               restarts, gpp)
+        if not found:
+            return None
+        self.add(n, courts, gpp, limit, found)
+        return self.lookup(names, courts, limit, gpp, rng=rng)
+
+
+def fill(lib: ScheduleLibrary, ns, limit_of=limit_by_n, gpp: int = GPP,
+         tries: int = 20, restarts: int = 3000, seed: int | None = None,
+         log=print):
+    """오프라인 배치: ns 의 각 인원·가능한 코트 수마다 tries 번 탐색해 저장"""
+    rng = random.Random(seed)
+    for n in ns:
+        limit = limit_of(n)
+        for courts in range(1, n // 4 + 1):
+            got = 0
+            for _ in range(tries):
+                res = restart_search(n, courts, limit, rng, restarts, gpp)
+                if res and lib.add(n, courts, gpp, limit, res):
+                    got += 1
+            best = lib.data.get(lib_key(n, courts, gpp, limit), [])
+            log(f"{n:2}명 {courts}코트 (한도 {limit}): +{got}, "
+                f"보관 {len(best)}" +
+                (f", 최상 max {best[0]['max']} / avg {best[0]['avg']}" if best else ""))
+        lib.save()
+
@@ -0,0 +1,149 @@
+# bracket_core/local_search.py
+# 완성된 대진을 시간 예산 안에서 조금씩 고치는 anytime 개선기
+# ───────────────────────────────────────────────────────────
+# 전체 재생성(max_attempts) 은 진 시도의 작업을 모두 버린다. 여기서는
+# 어떤 생성기의 결과든 받아 두 가지 이동만 반복한다.
+#   (1) 같은 슬롯의 두 경기 사이 선수 맞바꾸기 → 슬롯 내 중복 출전 · 1인당 경기 수 불변
+#   (2) 한 경기 안 팀 바꾸기 (ab|cd → ac|bd, ad|cb) → 만남 수 불변, 파트너 중복만 바뀜
+# 목표 (사전순) : (최대 중복, 만남 제곱합, 파트너 제곱합)
+#   만남 총합은 경기 수로 정해지므로 제곱합이 줄수록 한 번이라도 만난 쌍이 늘어
+#   count_meeting_overlap 의 평균도 같이 내려간다.
+# 나빠지지 않는 이동은 받아들이고(평지 이동), 최선이 갱신될 때마다 결과를 흘려보낸다.
+import random, time
+
+
+class _State:
+    """번호 대진 + 쌍 카운트(만남 pc, 파트너 pt) + 만남 횟수 분포"""
+
+    def __init__(self, games, n: int):
+        self.n  = n                         # games: [[a,b,c,d], ..]  팀 = (a,b) | (c,d)
+        self.pc = [0] * (n * n)
+        self.pt = [0] * (n * n)
+        self.hist = [n * (n - 1) // 2, 0]   # hist[c] = c 번 만난 쌍 수
+        self.sq = self.psq = 0
+        for g in games:
+            self._game(g, 1)
+
+    def _meet(self, a, b, d):
+        i = a * self.n + b
+        c = self.pc[i]
+        if c + d >= len(self.hist):
+            self.hist.append(0)
+        self.hist[c] -= 1; self.hist[c + d] += 1
+        self.sq += 2 * c * d + 1
+        self.pc[i] = self.pc[b * self.n + a] = c + d
+
+    def _partner(self, a, b, d):
+        i = a * self.n + b
+        c = self.pt[i]
+        self.psq += 2 * c * d + 1
+        self.pt[i] = self.pt[b * self.n + a] = c + d
+
+    def _game(self, g, d):
+        for x in range(4):
+            for y in range(x + 1, 4):
+                self._meet(g[x], g[y], d)
+        self._partner(g[0], g[1], d); self._partner(g[2], g[3], d)
+
+    def key(self):
+        m = len(self.hist) - 1
+        while m and not self.hist[m]:
+            m -= 1
+        return m, self.sq, self.psq
+
+    # (1) A[i] ↔ B[j]
+    def swap_players(self, A, i, B, j):
+        p, q = A[i], B[j]
+        for k in range(4):
+            if k != i:
+                self._meet(p, A[k], -1); self._meet(q, A[k], 1)
+            if k != j:
+                self._meet(q, B[k], -1); self._meet(p, B[k], 1)
+        a2, b2 = A[i ^ 1], B[j ^ 1]
+        self._partner(p, a2, -1); self._partner(q, a2, 1)
+        self._partner(q, b2, -1); self._partner(p, b2, 1)
+        A[i], B[j] = q, p
+
+    # (2) G[1] ↔ G[k]  (k = 2, 3)
+    def swap_team(self, G, k):
+        self._partner(G[0], G[1], -1); self._partner(G[2], G[3], -1)
+        G[1], G[k] = G[k], G[1]
+        self._partner(G[0], G[1], 1); self._partner(G[2], G[3], 1)
+
+
+def _stats(st: _State, moves: int, t0: float):
+    m, sq, psq = st.key()
+    met = st.hist[1:]
+    pairs = sum(met)
+    return {"max": m,
+            "avg": round(sum(c * h for c, h in enumerate(met, 1)) / pairs, 2) if pairs else 0,
+            "sq": sq, "partner_sq": psq, "moves": moves,
+            "elapsed": round(time.monotonic() - t0, 3)}
+
+
+def improve_iter(slots, budget: float = 1.0, rng: random.Random | None = None,
+                 max_moves: int | None = None):
+    """slots(라벨 대진) 를 budget 초 동안 개선.
+    최선이 갱신될 때마다 (slots, stats) 를 내보낸다 (첫 값은 입력 그대로)."""
+    rng = rng or random.Random()
+    players = list(dict.fromkeys(p for s in slots for t1, t2 in s for p in t1 + t2))
+    pos = {p: i for i, p in enumerate(players)}
+    shape = [len(s) for s in slots]
+    games = [[pos[p] for p in t1 + t2] for s in slots for t1, t2 in s]
+    st = _State(games, len(players))
+    # 이동 후보: 경기가 2개 이상인 슬롯 (선수 교환), 모든 경기 (팀 교환)
+    multi, at = [], 0
+    for k in shape:
+        if k > 1:
+            multi.append((at, k))
+        at += k
+
+    def snapshot():
+        out, at = [], 0
+        for k in shape:
+            out.append([(tuple(players[x] for x in g[:2]), tuple(players[x] for x in g[2:]))
+                        for g in games[at:at + k]])
+            at += k
+        return out
+
+    t0 = time.monotonic()
+    deadline = t0 + budget
+    best, moves = st.key(), 0
+    yield snapshot(), _stats(st, moves, t0)
+    if not games:
+        return
+
+    while (max_moves is None or moves < max_moves) and \
+            (moves & 255 or time.monotonic() < deadline):
+        moves += 1
+        cur = st.key()
+        if multi and rng.random() < 0.8:
+            at, k = rng.choice(multi)
+            a, b = rng.sample(range(at, at + k), 2)
+            A, B = games[a], games[b]
+            i, j = rng.randrange(4), rng.randrange(4)
+            st.swap_players(A, i, B, j)
+            if st.key() > cur:
+                st.swap_players(A, i, B, j)            # 되돌리기 (자기 역원)
+                continue
+        else:
+            G = games[rng.randrange(len(games))]
+            k = rng.choice((2, 3))
+            st.swap_team(G, k)
+            if st.key() > cur:
+                st.swap_team(G, k)
+                continue
+        if st.key() < best:
+            best = st.key()
+            yield snapshot(), _stats(st, moves, t0)
+
+
+def improve(slots, budget: float = 1.0, rng: random.Random | None = None,
+            on_improve=None, max_moves: int | None = None):
+    """improve_iter 를 끝까지 돌려 최선 (slots, stats) 를 돌려준다.
+    on_improve(slots, stats) 는 최선이 바뀔 때마다 호출"""
+    out = None
+    for out in improve_iter(slots, budget, rng, max_moves):
+        if on_improve:
+            on_improve(*out)
+    return out
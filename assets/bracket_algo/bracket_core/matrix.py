@@ -0,0 +1,44 @@
+# bracket_core/matrix.py
+# 배열 기반 중복 행렬 – 통계 · 히트맵 공용
+# ───────────────────────────────────────────────────────────
+# 대진 → (경기 수 × 4) 선수 번호 배열 → 경기 안 6쌍을 한 번의 bincount 로 n×n 행렬.
+# 중첩 dict 을 쌓고 DataFrame 에 칸마다 .loc 로 써 넣던 방식(O(n²) 스칼라 쓰기)을 대신한다.
+# 통계(max / avg / 분포 / 선수별 합)와 히트맵 모두 이 행렬에서 꺼낸다.
+import numpy as np
+
+_I, _J = np.triu_indices(4, 1)          # 한 경기 안 6쌍의 열 위치
+
+
+def index_array(schedule, players=None):
+    """대진 → ((경기 수 × 4) int 배열, 선수 목록). 선수 목록 기본값은 정렬된 라벨"""
+    if players is None:
+        players = sorted({p for t1, t2 in schedule for p in t1 + t2})
+    pos = {p: i for i, p in enumerate(players)}
+    arr = np.fromiter((pos[p] for t1, t2 in schedule for p in t1 + t2),
+                      dtype=np.intp, count=4 * len(schedule))
+    return arr.reshape(-1, 4), players
+
+
+def overlap_matrix(arr, n: int):
+    """(경기 수 × 4) 번호 배열 → 대칭 n×n 만남 횟수 행렬 (대각 0)"""
+    a, b = arr[:, _I].ravel(), arr[:, _J].ravel()
+    m = np.bincount(a * n + b, minlength=n * n).reshape(n, n)
+    return m + m.T
+
+
+def schedule_matrix(schedule, players=None):
+    """대진 → (행렬, 선수 목록)"""
+    arr, players = index_array(schedule, players)
+    return overlap_matrix(arr, len(players)), players
+
+
+def matrix_stats(m):
+    """max / avg(한 번이라도 만난 쌍 기준) / total_pairs + 제곱합 · 횟수 분포 · 선수별 합"""
+    up  = m[np.triu_indices(len(m), 1)]
+    met = up[up > 0]
+    return {"max": int(up.max()) if up.size else 0,
+            "avg": round(float(met.mean()), 2) if met.size else 0.0,
+            "total_pairs": int(met.size),
+            "sq": int((up * up).sum()),
+            "hist": np.bincount(up).tolist(),
+            "per_player": m.sum(axis=1).tolist()}
@@ -0,0 +1,106 @@
+# bracket_core/overlap_index.py
+# 4명 그룹의 중복 점수를 증분으로 유지하는 색인
+# ───────────────────────────────────────────────────────────
+# 기존 코드는 슬롯마다 sorted(all_combinations, key=calculate_overlap_score)
+# 로 C(n,4) 개(32명이면 35,960개)를 전부 다시 채점했다.
+# 여기서는 점수별 버킷(정렬된 번호 목록)에 그룹 번호를 넣어 두고, 경기가 추가되면
+# 그 경기의 쌍을 포함하는 그룹만 한 칸 위 버킷으로 옮긴다.
+# ordered() 는 sorted(...) 와 같은 순서(점수 오름차순, 동점은 원래 순서)로
+# 필요한 만큼만 꺼내 준다.
+from itertools import combinations
+from collections import defaultdict
+
+
+def _key(a, b):
+    return (a, b) if a < b else (b, a)
+
+
+class OverlapIndex:
+    """groups 의 중복 점수 색인.
+    square=False : 점수 = Σ 쌍 카운트        (calculate_overlap_score)
+    square=True  : 점수 = Σ 쌍 카운트 ** 2   (stable_low_overlap)"""
+
+    def __init__(self, groups, square: bool = False):
+        self.groups  = groups
+        self.square  = square
+        self.score   = [0] * len(groups)
+        self.dead    = bytearray(len(groups))
+        self._cnt    = defaultdict(int)              # 쌍 → 카운트
+        self._pairs  = defaultdict(list)             # 쌍 → 그룹 번호들
+        self._people = defaultdict(list)             # 선수 → 그룹 번호들
+        for i, g in enumerate(groups):
+            for a, b in combinations(g, 2):
+                self._pairs[_key(a, b)].append(i)
+            for p in g:
+                self._people[p].append(i)
+
+        self._bucket  = {0: list(range(len(groups)))}    # 점수 → 정렬된 그룹 번호
+        self._live    = defaultdict(int, {0: len(groups)})
+        self._pending = defaultdict(int)             # 그룹 번호 → 미반영 점수 증가분
+
+    # ── 갱신 ────────────────────────────────────────────────
+    def bump(self, group):
+        """group 이 한 경기 치렀다 – 관련 쌍 카운트 +1.
+        점수 반영은 다음 ordered() 호출 때 (슬롯 도중 순서는 고정)"""
+        for a, b in combinations(group, 2):
+            k = _key(a, b)
+            c = self._cnt[k]; self._cnt[k] = c + 1
+            d = 2 * c + 1 if self.square else 1
+            for i in self._pairs[k]:
+                self._pending[i] += d
+
+    def kill(self, i: int):
+        """그룹 i 를 영구 제외 (다시는 조건을 만족할 수 없을 때)"""
+        if not self.dead[i]:
+            self.dead[i] = 1
+            self._live[self.score[i]] -= 1
+
+    def kill_player(self, p):
+        """p 가 경기를 다 채웠다 – p 가 든 그룹 전부 제외"""
+        for i in self._people[p]:
+            self.kill(i)
+
+    def kill_pair(self, a, b):
+        """a‑b 가 중복 한도에 닿았다 – 둘이 함께 든 그룹 전부 제외"""
+        for i in self._pairs[_key(a, b)]:
+            self.kill(i)
+
+    def _flush(self):
+        score, dead = self.score, self.dead
+        moved = defaultdict(list)                    # 새 점수 → 옮겨 올 그룹 번호
+        for i, d in self._pending.items():
+            old = score[i]; new = old + d
+            score[i] = new
+            if dead[i]:
+                continue
+            self._live[old] -= 1; self._live[new] += 1
+            moved[new].append(i)
+        self._pending.clear()
+
+        # 받는 버킷은 정렬 병합(두 런 → 선형), 옮겨 간·죽은 항목이
+        # 절반을 넘은 버킷만 걸러 낸다
+        for s, add in moved.items():
+            add.sort()
+            h = self._bucket.get(s)
+            self._bucket[s] = sorted(h + add) if h else add
+        for s, h in list(self._bucket.items()):
+            if len(h) <= 2 * self._live[s] + 32:
+                continue
+            h = [i for i in h if score[i] == s and not dead[i]]
+            if h:
+                self._bucket[s] = h
+            else:
+                del self._bucket[s]; self._live.pop(s, None)
+
+    # ── 조회 ────────────────────────────────────────────────
+    def ordered(self):
+        """sorted(groups, key=점수) 와 같은 순서로 살아 있는 그룹을 lazily 순회"""
+        if self._pending:
+            self._flush()
+        score, dead, groups = self.score, self.dead, self.groups
+        for s in sorted(self._bucket):
+            if self._live[s] <= 0:
+                continue
+            for i in self._bucket[s]:
+                if score[i] == s and not dead[i]:
+                    yield groups[i]
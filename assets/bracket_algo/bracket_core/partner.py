@@ -0,0 +1,134 @@
+# bracket_core/partner.py
+# 고정 파트너 대진 – frontend PartnerBracketScheduler.generate 의 파이썬 판
+# ───────────────────────────────────────────────────────────
+# 같은 인자 · 같은 규칙을 engine 의 평탄 쌍 테이블 · build_from / pick_weighted 위에서 돌리고
+# 재시도를 프로세스 풀로 나눈다.
+# 오프라인으로 고정 파트너 대진을 미리 계산하거나, 앱이 실제로 몇 번 재시도해야
+# 하는지(info["restarts_used"]) 재는 용도.
+#  - 고정 파트너 쌍은 항상 같은 팀, 그 쌍의 만남은 세지 않는다
+#  - 4명 고르기: 섞인 후보의 조합 순서대로 "첫 번째로 맞는 팀 나누기"
+#    (g0 와 g1 / g2 / g3 순, 고정 파트너가 갈리지 않는 것) 의 점수
+#    Σ 같은팀 2·teamWeight·만남 + Σ 상대 oppWeight·만남 이 최소, 동률이면 남은 경기 합 큰 쪽.
+#    (Dart 는 같은 팀 쌍을 양방향으로 두 번 더하므로 2·teamWeight) 점수 0 을 만나면 즉시 채택
+#    → pick_weighted(weights=(2·tw, ow), pt=None, mate, cand=(0, 0)): pt 없이 두 항 모두
+#      전체 만남, mate 로 첫 나누기, accept 0 으로 점수 0 즉시 채택. 부분 조합 하한으로 잘라도
+#      고르는 조합은 같다
+#  - 슬롯은 min(코트, 남은 경기) 만큼 채워야 성공 (build_once strict 와 같음)
+#  - optimize=True 면 restart 회 중 (maxDup, avgDup) 최소, maxDup ≤ lowerBound 면 조기 종료
+#    avgDup 는 한 번이라도 만난 쌍의 평균
+#  - 한도는 없다 (build_from 에 gpp + 1 – 한 쌍이 gpp 번 넘게 만날 수 없음)
+# 난수열은 Dart 와 달라 같은 seed 라도 대진은 다르다 (규칙 · 분포가 같음).
+import os, random
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .engine import GPP, build_from
+
+_found = None                           # 워커 공유: 조기 종료 조건을 만족한 가장 앞 순번
+
+
+def _init_worker(found):
+    global _found
+    _found = found
+
+
+def _build_once(n: int, courts: int, gpp: int, mate, tw: int, ow: int,
+                rng: random.Random):
+    """Dart _buildOnce. 성공 시 (slots, maxDup, avgDup), 실패 시 None.
+    slots = [[((a, b), (c, d)), ..], ..] (선수 번호)"""
+    pc = [0] * (n * n)                  # 고정 파트너 쌍은 0 으로 둔다 (build_from 이 지움)
+    res = build_from(list(range(n)), courts, gpp + 1, rng, [gpp] * n, pc, [0] * n,
+                     weights=(2 * tw, ow), cand=(0, 0), mate=mate)
+    if res is None:
+        return None
+    met = [v for v in pc if v]
+    return res[1], max(met, default=0), (sum(met) / len(met) if met else 0.0)
+
+
+def _chunk(args, seeds, start, optimize, lower_bound):
+    """seeds[i] = 순번 start+i. → (조기 종료 항목 | None, 구간 최선 | None),
+    항목 = ((maxDup, avgDup, 순번), 순번, 결과)"""
+    best = None
+    for i, seed in enumerate(seeds):
+        idx = start + i
+        if _found is not None and idx > _found.value:
+            break
+        res = _build_once(*args, random.Random(seed))
+        if res is None:
+            continue
+        key = (res[1], res[2], idx)
+        if best is None or key < best[0]:
+            best = key, idx, res
+        if not optimize or res[1] <= lower_bound:
+            if _found is not None:
+                with _found.get_lock():
+                    _found.value = min(_found.value, idx)
+            return (key, idx, res), best
+    return None, best
+
+
+def generate_partner(players, fixed_pairs=(), optimize: bool = True,
+                     games_per: int = GPP, team_weight: int = 10, opp_weight: int = 1,
+                     restart: int = 8000, lower_bound: int = 2, seed: int | None = None,
+                     workers: int = 1, chunk: int = 64):
+    """PartnerBracketScheduler.generate 와 같은 인자 (+ workers, chunk).
+    players     : 선수 이름 목록 (4‑32명, 유일)
+    fixed_pairs : [[이름, 이름], ..]
+    → (경기 목록, 정보). 경기 = {"id", "ord", "playerA", "playerC", "playerB", "playerD"}
+    (MatchModel 과 같은 키: A·C 가 한 팀, B·D 가 한 팀, ord 는 1부터 시작하는 슬롯 번호)
+    정보 = maxDup / avgDup / restarts_used (결과를 얻기까지 필요했던 재시도 수).
+    workers>1 (0 = CPU 수) 이어도 seed 가 같으면 순차와 같은 결과"""
+    names = list(players)
+    n = len(names)
+    if not 4 <= n <= 32:
+        raise ValueError("인원수는 4~32 명만 지원합니다.")
+    courts = n // 4
+    pos = {p: i for i, p in enumerate(names)}
+    mate = [-1] * n
+    for pair in fixed_pairs:
+        if len(pair) != 2:
+            raise ValueError(f"fixed_pairs 형식 오류: {pair}")
+        for p in pair:
+            if p not in pos:
+                raise ValueError(f"고정 파트너 {p} 가 참가 명단에 없습니다.")
+        a, b = pos[pair[0]], pos[pair[1]]
+        mate[a], mate[b] = b, a
+
+    rng   = random.Random(seed)
+    seeds = [rng.randrange(1 << 30) for _ in range(restart)]
+    args  = (n, courts, games_per, mate, team_weight, opp_weight)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1:
+        hit, best = _parallel(args, seeds, optimize, lower_bound, workers, chunk)
+    else:
+        hit, best = _chunk(args, seeds, 0, optimize, lower_bound)
+    if best is None:
+        raise RuntimeError("조건을 만족하는 대진표를 찾지 못했습니다.")
+
+    _, _, (slots, max_dup, avg_dup) = hit or best
+    matches = []
+    for ord_, slot in enumerate(slots, 1):
+        for (a, c), (b, d) in slot:
+            matches.append({"id": len(matches) + 1, "ord": ord_,
+                            "playerA": names[a], "playerC": names[c],
+                            "playerB": names[b], "playerD": names[d]})
+    return matches, {"maxDup": max_dup, "avgDup": round(avg_dup, 3),
+                     "restarts_used": hit[1] + 1 if hit else restart}
+
+
+def _parallel(args, seeds, optimize, lower_bound, workers, chunk):
+    """구간별 결과를 모아 순차와 같은 답을 고른다: 조기 종료 항목은 순번이 가장 앞의 것,
+    최선은 (maxDup, avgDup, 순번) 최소"""
+    found = mp.Value("q", len(seeds))
+    hit, best = None, None
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(found,)) as ex:
+        futs = [ex.submit(_chunk, args, seeds[i:i + chunk], i, optimize, lower_bound)
+                for i in range(0, len(seeds), chunk)]
+        for f in as_completed(futs):
+            h, b = f.result()
+            if h is not None and (hit is None or h[1] < hit[1]):
+                hit = h
+            if b is not None and (best is None or b[0] < best[0]):
+                best = b
+    return hit, best
@@ -0,0 +1,118 @@
+# bracket_core/portfolio.py
+# 시간 예산 포트폴리오 – 한도 2 / 한도 3 / 빈 코트 허용 탐색을 동시에 돌린다
+# ───────────────────────────────────────────────────────────
+# generate_schedule 은 기본 한도로 restarts 번을 다 쓴 뒤에야 한도 3 으로 넘어가므로
+# 최악 지연이 "두 번의 재시도 루프 전체" 다. 여기서는 변형마다 워커를 따로 두고
+# 마감(budget 초)까지 각자 재시도한다.
+#  - 순위: (한도, 빈 코트 허용 여부, 최대 중복) 이 작은 것. 가장 엄격한 변형이 찾으면 즉시 끝
+#  - 마감이 되면 그때까지 찾은 것 중 최선을 돌려준다 → 최악 지연 ≈ budget
+#  - workers 가 변형 수보다 많으면 남는 워커는 앞(엄격한) 변형부터 더 붙인다
+#  - workers=1 이면 한 프로세스에서 변형을 번갈아 한 번씩 시도
+# 결과는 시간에 따라 달라지므로 seed 를 고정해도 재현되지 않는다 (재현이 필요하면
+# generate_schedule).
+import os, random, time
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .engine import GPP, build_once, limit_by_n
+from .search import LARGE, WINDOW
+
+_won = None                             # 워커 공유: 지금까지 성공한 가장 엄격한 변형 번호
+
+
+def _init_worker(won):
+    global _won
+    _won = won
+
+
+def variants_for(n: int):
+    """기본 변형 목록 [(한도, strict), ..] – 엄격한 것부터"""
+    return [(lim, True) for lim in sorted({limit_by_n(n), 3})] + [(3, False)]
+
+
+def _rank(v, res):
+    lim, strict = v
+    return lim, not strict, res[2]["max"]
+
+
+def _race(n, courts, gpp, variants, k, seed, deadline, window):
+    """마감까지 variants[k] 로 재시도 → (번호, 결과 | None, 시도 수).
+    같거나 더 엄격한 변형이 이미 성공했으면 그만둔다"""
+    lim, strict = variants[k]
+    rng, tries = random.Random(seed), 0
+    while time.time() < deadline and _won.value > k:
+        tries += 1
+        res = build_once(n, courts, lim, random.Random(rng.randrange(1 << 30)), gpp,
+                         strict, window)
+        if res:
+            with _won.get_lock():
+                _won.value = min(_won.value, k)
+            return k, res, tries
+    return k, None, tries
+
+
+def portfolio(n: int, courts: int | None = None, budget: float = 2.0,
+              workers: int = 0, seed: int | None = None, gpp: int = GPP,
+              variants=None):
+    """budget 초 안에 변형들을 경주시켜 가장 엄격한 결과를 돌려준다 → (결과, 정보).
+    결과는 build_once 와 같은 (schedule, slots, stats, players).
+    정보 = 이긴 변형의 limit / strict, 걸린 시간, 변형별 시도 수.
+    마감까지 아무것도 못 찾으면 RuntimeError"""
+    if n < 4:
+        raise ValueError("인원 수는 4명 이상이어야 합니다.")
+    courts = courts or n // 4
+    if not 1 <= courts <= n // 4:
+        raise ValueError("코트 수는 1‑⌊N/4⌋")
+    variants = sorted(variants or variants_for(n), key=lambda v: (v[0], not v[1]))
+    workers  = workers or os.cpu_count() or 1
+    window   = WINDOW if n > LARGE else None
+    rng      = random.Random(seed)
+    t0       = time.time()
+    deadline = t0 + budget
+
+    if workers == 1:
+        best, tries = _interleave(n, courts, gpp, variants, rng, deadline, window)
+    else:
+        best, tries = _parallel(n, courts, gpp, variants, rng, deadline, window, workers)
+    if best is None:
+        raise RuntimeError(f"{n}명으로 {budget}초 안에 대진표를 얻지 못했습니다.\n"
+                           "- 예산을 늘리거나\n- 코트 수를 조정해 보세요.")
+    (lim, strict), res = best
+    return res, {"limit": lim, "strict": strict,
+                 "elapsed": round(time.time() - t0, 3),
+                 "attempts": {f"{l}{'' if s else '-loose'}": tries.get((l, s), 0)
+                              for l, s in variants}}
+
+
+def _interleave(n, courts, gpp, variants, rng, deadline, window):
+    """한 프로세스에서 변형마다 한 번씩 번갈아. 이미 찾은 변형보다 느슨한 것은 뺀다"""
+    seeds = {v: random.Random(rng.randrange(1 << 30)) for v in variants}
+    tries = dict.fromkeys(variants, 0)
+    best, live = None, list(variants)
+    while live and time.time() < deadline:
+        for v in list(live):
+            tries[v] += 1
+            res = build_once(n, courts, v[0], random.Random(seeds[v].randrange(1 << 30)),
+                             gpp, v[1], window)
+            if res and (best is None or _rank(v, res) < _rank(*best)):
+                best = v, res
+                live = live[:live.index(v)]     # 더 엄격한 변형만 계속
+                break
+    return best, tries
+
+
+def _parallel(n, courts, gpp, variants, rng, deadline, window, workers):
+    won   = mp.Value("i", len(variants))
+    tries = dict.fromkeys(variants, 0)
+    best  = None
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(won,)) as ex:
+        futs = [ex.submit(_race, n, courts, gpp, variants, i % len(variants),
+                          rng.randrange(1 << 30), deadline, window)
+                for i in range(max(workers, len(variants)))]
+        for f in as_completed(futs):
+            k, res, t = f.result()
+            v = variants[k]
+            tries[v] += t
+            if res and (best is None or _rank(v, res) < _rank(*best)):
+                best = v, res
+    return best, tries
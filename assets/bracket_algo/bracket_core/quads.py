@@ -0,0 +1,137 @@
+# bracket_core/quads.py
+# 4명 조합 공간 – 목록을 만들지 않고 번호로 다룬다
+# ───────────────────────────────────────────────────────────
+# 기존 코드는 list(combinations(players, 4)) 를 만든 뒤 random.shuffle 했다
+# (32명이면 35,960개 튜플을 매번 할당 · 섞음). 여기서는 조합을 번호 0..C(n,4)-1 로 두고
+#  - 번호 → 조합 : 조합수 체계 역순위(unrank). itertools.combinations 와 같은 사전식 순서
+#  - 무작위 순서 : 번호 공간 위의 Feistel 순열(키 4개) + cycle‑walking.
+#                  비복원 추출이고, 같은 뷰를 다시 돌면 같은 순서 (섞은 목록과 같음)
+#  - 부분 공간   : 선수 비트마스크(bit i = items[i]) 안의 조합만 – 그 선수들의 QuadSpace.
+#                  LiveQuads 는 경기를 다 채운 선수를 빼 가며 남은 선수들의 조합만 뽑는다
+# 메모리는 C(n,4) 와 상관없다 (키 · 길이 n 누적표 4개만).
+import random
+from bisect import bisect_right
+from itertools import accumulate, combinations
+from math import comb
+
+
+class QuadSpace:
+    """items 에서 4명 고르는 조합의 지연 시퀀스. combinations(items, 4) 와 같은 순서 ·
+    같은 튜플을 len / [i] / 순회로 돌려준다"""
+
+    def __init__(self, items):
+        self.items = list(items)
+        n = len(self.items)
+        self._len = comb(n, 4)
+        # _s[k][x] = Σ_{y<x} C(n-1-y, k) : k 명이 남았을 때 x 앞에서 시작하는 조합 수
+        self._s = [list(accumulate((comb(n - 1 - y, k) for y in range(n)), initial=0))
+                   for k in range(4)]
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return combinations(self.items, 4)
+
+    def __getitem__(self, r: int):
+        a, b, c, d = self.unrank(r)
+        it = self.items
+        return it[a], it[b], it[c], it[d]
+
+    def unrank(self, r: int):
+        """사전식 순위 r → 위치 4‑튜플 (오름차순). 자리마다 누적표에서 이분 탐색"""
+        if not 0 <= r < self._len:
+            raise IndexError(r)
+        s3, s2, s1, s0 = self._s[3], self._s[2], self._s[1], self._s[0]
+        a = bisect_right(s3, r) - 1;              r += s2[a + 1] - s3[a]
+        b = bisect_right(s2, r) - 1;              r += s1[b + 1] - s2[b]
+        c = bisect_right(s1, r) - 1;              r += s0[c + 1] - s1[c]
+        return a, b, c, bisect_right(s0, r) - 1
+
+    def rank(self, pos) -> int:
+        """unrank 의 역 – 위치 4‑튜플(오름차순) → 순위"""
+        r, x = 0, 0
+        for k, p in zip((3, 2, 1, 0), pos):
+            r += self._s[k][p] - self._s[k][x]
+            x = p + 1
+        return r
+
+    def shuffled(self, rng=None):
+        """무작위 순서 뷰 (비복원). rng 는 random.Random 또는 random 모듈"""
+        return Shuffled(self, rng or random)
+
+    def sample(self, k: int, rng=None):
+        """서로 다른 조합 k 개"""
+        view = self.shuffled(rng)
+        return [view[i] for i in range(min(k, len(view)))]
+
+    def within(self, mask: int):
+        """mask 의 선수(bit i = items[i])만으로 된 조합 공간"""
+        return QuadSpace(p for i, p in enumerate(self.items) if mask >> i & 1)
+
+
+class Shuffled:
+    """QuadSpace 의 무작위 순열 뷰 – i 번째 = space[π(i)].
+    π 는 size 이상 가장 작은 2^bits 위의 Feistel 망 (두 쪽 폭이 다르면 라운드마다 바뀜) 을
+    size 안에 들 때까지 거듭 적용한 것"""
+
+    def __init__(self, space: QuadSpace, rng):
+        self.space = space
+        self.size  = len(space)
+        bits = max(2, (self.size - 1).bit_length())
+        self._w    = (bits - bits // 2, bits // 2)      # (윗쪽, 아랫쪽) 폭
+        self._keys = [rng.getrandbits(32) for _ in range(4)]
+
+    def _enc(self, x: int) -> int:
+        hi, lo = self._w
+        a, b = x >> lo, x & ((1 << lo) - 1)
+        for k in self._keys:
+            t = ((b ^ k) * 0x45D9F3B) & 0xFFFFFFFF
+            a, b = b, a ^ ((t ^ t >> 16) & ((1 << hi) - 1))
+            hi, lo = lo, hi
+        return a << lo | b
+
+    def index(self, i: int) -> int:
+        """i 번째 자리의 조합 순위 π(i)"""
+        if not 0 <= i < self.size:
+            raise IndexError(i)
+        x = self._enc(i)
+        while x >= self.size:                   # 2^bits < 2·size 라 평균 2번 안쪽
+            x = self._enc(x)
+        return x
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i: int):
+        return self.space[self.index(i)]
+
+    def __iter__(self):
+        space, index = self.space, self.index
+        for i in range(self.size):
+            yield space[index(i)]
+
+
+class LiveQuads:
+    """남은 선수들의 조합만 무작위로 순회. drop(p) 로 선수를 빼면 다음 조합부터
+    남은 선수들의 부분 공간을 새로 섞어 이어 간다 (빠진 선수가 든 조합은 아예 보지 않음).
+    한 마스크 안에서는 비복원, 마스크가 바뀌면 앞서 본 조합이 다시 나올 수 있다"""
+
+    def __init__(self, space: QuadSpace, rng=None):
+        self.space = space
+        self.rng   = rng or random
+        self.mask  = (1 << len(space.items)) - 1
+        self._pos  = {p: i for i, p in enumerate(space.items)}
+
+    def drop(self, p):
+        self.mask &= ~(1 << self._pos[p])
+
+    def __iter__(self):
+        while True:
+            mask = self.mask
+            for g in self.space.within(mask).shuffled(self.rng):
+                yield g
+                if self.mask != mask:
+                    break
+            else:
+                return
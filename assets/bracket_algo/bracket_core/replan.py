@@ -0,0 +1,138 @@
+# bracket_core/replan.py
+# 진행 중 명단 변경(지각 · 조퇴) → 남은 슬롯만 다시 짜기
+# ───────────────────────────────────────────────────────────
+# 이미 치른 경기는 그대로 두고, 그 경기들로 쌓인 쌍 카운트를 초기 상태로
+# build_from 을 이어 돌린다.
+#  - 떠난 선수: 남은 경기에서 빠지고, 그 선수와의 만남 기록은 더 이상 상관없음
+#  - 새로 온 선수: 0경기에서 출발 (목표 gpp 경기)
+#  - 남은 출전 합이 4의 배수가 아니거나 한 선수의 남은 경기가 전체 남은 경기 수보다 많으면
+#    1경기씩 더 준다 (아무도 약속보다 덜 뛰지 않게). 받는 선수는 가장 적게 뛴 선수,
+#    같으면 아직 만날 여유(Σ max(0, limit − 만남))가 큰 선수 – 한도에 찬 쌍에 얹지 않게
+#  - 늦게 온 선수는 남은 경기가 많아 슬롯이 그만큼 더 필요하다. 코트를 다 채우면
+#    나머지 선수가 먼저 끝나 버리므로, 슬롯 수 ⌈경기/슬롯당⌉ 가 최대 남은 경기 이상이
+#    되는 가장 큰 슬롯당 경기 수(≤ 코트)로 줄여 고르게 편다
+#  - 시도 순서: 한도 limit 꽉 찬 슬롯 → 한도 limit 빈 코트 허용 → limit+1 … 4 → 한도 없음.
+#    budget 초 안에서 단계마다 시간을 나눠 쓴다. 시작 상태부터 필요 조건(doomed)에
+#    걸리는 strict 단계는 시도 없이 건너뛰고 그 몫을 다음 단계로 넘긴다
+#  - 그래도 못 찾으면 _layout (출전 합 4의 배수, 최대 ≤ 경기 수면 항상 되는 배치) 으로 –
+#    명단이 바뀌었다는 이유로 예외가 나는 일은 없다
+import math, random, time
+
+from .engine import GPP, build_from, doomed, limit_by_n, pair_stats
+from .search import LARGE, WINDOW
+from .slots import pack_slots
+
+
+def replan(played, roster, courts: int | None = None, limit: int | None = None,
+           gpp: int = GPP, seed: int | None = None, budget: float = 0.5,
+           pair_cnt=None):
+    """played : 이미 치른 슬롯 대진 [[(t1, t2), ..], ..] (라벨)
+    roster  : 지금 남아 있는 선수 라벨 목록 (새로 온 선수 포함)
+    pair_cnt: {a: {b: 횟수}} 를 주면 played 대신 이 만남 기록을 쓴다
+    → (남은 slots, 정보). 정보 = 밤 전체 기준 max/avg, 선수별 총 경기, 쓴 한도 등"""
+    n = len(roster)
+    if n < 4:
+        raise ValueError("남은 인원이 4명보다 적습니다.")
+    courts = courts or n // 4
+    if not 1 <= courts <= n // 4:
+        raise ValueError("코트 수는 1‑⌊N/4⌋")
+    limit = limit or limit_by_n(n)
+    pos = {p: i for i, p in enumerate(roster)}
+
+    # ① 지금까지의 상태 (남은 선수끼리만)
+    done = [0] * n
+    pc0  = [0] * (n * n)
+    for slot in played:
+        for t1, t2 in slot:
+            g = [pos[p] for p in t1 + t2 if p in pos]
+            for a in g:
+                done[a] += 1
+            if pair_cnt is None:
+                for x in range(len(g)):
+                    for y in range(x + 1, len(g)):
+                        pc0[g[x] * n + g[y]] += 1; pc0[g[y] * n + g[x]] += 1
+    if pair_cnt is not None:
+        for a, row in pair_cnt.items():
+            for b, c in row.items():
+                if a in pos and b in pos and a != b:
+                    pc0[pos[a] * n + pos[b]] = c
+
+    # ② 남은 출전 수 – 4의 배수, 누구도 남은 경기 수보다 많이 남지 않게
+    rng = random.Random(seed)
+    remain0 = [max(0, gpp - d) for d in done]
+    room = [sum(max(0, limit - pc0[p * n + q]) for q in range(n) if q != p) for p in range(n)]
+    tie  = [rng.random() for _ in range(n)]
+    while sum(remain0) % 4 or max(remain0) > sum(remain0) // 4:
+        cap = (sum(remain0) + 1) // 4           # 더 받아도 경기 수를 넘지 않는 선수만
+        cand = [p for p in range(n) if remain0[p] < cap] or range(n)
+        p = min(cand, key=lambda p: (done[p] + remain0[p], -room[p], tie[p]))
+        remain0[p] += 1
+
+    info = {"limit": limit, "strict": True, "attempts": 0}
+    if not any(remain0):
+        return [], _night(info, done, remain0, pc0, n, roster, limit)
+
+    games = sum(remain0) // 4
+    per   = next((k for k in range(courts, 0, -1)
+                  if math.ceil(games / k) >= max(remain0)), 1)   # 슬롯당 경기
+    info["per_slot"] = per
+
+    # ③ 단계별 재시도 (마지막은 한도 없음 = 남은 경기 수만큼 더 만나도 됨)
+    levels = [(lim, strict) for lim in range(limit, max(limit, 4) + 1) for strict in (True, False)]
+    levels.append((max(pc0) + games, False))
+    t0 = time.monotonic()
+    for k, (lim, strict) in enumerate(levels):
+        forb0 = [0] * n
+        for a in range(n):
+            for b in range(n):
+                if a != b and pc0[a * n + b] >= lim:
+                    forb0[a] |= 1 << b
+        if strict and doomed(n, lim, per, remain0, pc0, forb0):
+            info["skipped"] = info.get("skipped", 0) + 1
+            continue
+        now = time.monotonic()
+        until = now + (t0 + budget - now) / (len(levels) - k)
+        while True:
+            info["attempts"] += 1
+            pc = pc0[:]
+            res = build_from(roster, per, lim, random.Random(rng.randrange(1 << 30)),
+                             remain0[:], pc, forb0[:], strict,
+                             WINDOW if n > LARGE else None)
+            if res:
+                info.update(limit=lim, strict=strict)
+                return res[1], _night(info, done, remain0, pc, n, roster, lim)
+            if time.monotonic() > until:
+                break
+
+    pc = pc0[:]
+    slots = _layout(roster, remain0, per, pc, rng)
+    st = pair_stats(pc, n, limit)
+    info.update(limit=max(limit, st["max"]), strict=False, layout=True)
+    return slots, _night(info, done, remain0, pc, n, roster, info["limit"])
+
+
+def _layout(roster, remain, per, pc, rng):
+    """마지막 수단: 출전을 많이 남은 선수부터 한 줄로 늘어놓고 경기 G 개에 번갈아 나눈다
+    (i 번째 → 경기 i mod G). 한 선수의 출전은 연속이고 G 개 이하라 같은 경기에 두 번 안 든다.
+    만남 한도는 보지 않는다. pc 제자리 갱신"""
+    n = len(roster)
+    order = sorted(range(n), key=lambda p: (-remain[p], rng.random()))
+    seq = [p for p in order for _ in range(remain[p])]
+    G = len(seq) // 4
+    games = [seq[g::G] for g in range(G)]
+    schedule = []
+    for g in games:
+        rng.shuffle(g)
+        for x in range(4):
+            for y in range(x + 1, 4):
+                pc[g[x] * n + g[y]] += 1; pc[g[y] * n + g[x]] += 1
+        schedule.append((tuple(roster[p] for p in g[:2]), tuple(roster[p] for p in g[2:])))
+    return pack_slots(schedule, per)
+
+
+def _night(info, done, remain, pc, n, roster, limit):
+    """밤 전체(치른 경기 + 새 계획) 기준 통계"""
+    st = pair_stats(pc, n, limit) if n > 1 else {"max": 0, "avg": 0, "limit": limit}
+    info.update(max=st["max"], avg=st["avg"],
+                games={p: done[i] + remain[i] for i, p in enumerate(roster)})
+    return info
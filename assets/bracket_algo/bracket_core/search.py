@@ -0,0 +1,170 @@
+# bracket_core/search.py
+# 재시도 + 한도 완화로 완전 스케줄 찾기 (순차 / 프로세스 풀 병렬)
+# ───────────────────────────────────────────────────────────
+import os, random
+import multiprocessing as mp
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .engine import CAND, GPP, build_once, limit_by_n
+from .designs import design_schedule
+from .exact import solve_exact
+from .instrument import Probe
+
+_found = None                           # 워커 공유: 지금까지 성공한 최소 시드 순번
+LARGE  = 32                             # 이보다 많으면 후보 창(window) 모드
+WINDOW = 16
+
+
+def _init_worker(found):
+    global _found
+    _found = found
+
+
+def _restart_chunk(n: int, courts: int, limit: int, gpp: int, seeds, start: int,
+                   window: int | None = None, counted: bool = False, weights=None,
+                   cand=None, hist=None):
+    """seeds[i] 는 전체 순번 start+i. 이 구간에서 처음 성공한 (순번, 결과) 또는 None,
+    counted=True 면 (그것, 이 구간 계측 summary)"""
+    probe, hit = Probe() if counted else None, None
+    for i, seed in enumerate(seeds):
+        idx = start + i
+        if idx > _found.value:            # 더 앞선 순번이 이미 성공 → 중단
+            break
+        res = build_once(n, courts, limit, random.Random(seed), gpp, window=window,
+                         probe=probe, weights=weights, cand=cand, hist=hist)
+        if res:
+            with _found.get_lock():
+                if idx < _found.value:
+                    _found.value = idx
+            hit = idx, res
+            break
+    return (hit, probe.summary()) if counted else hit
+
+
+def _parallel_restarts(n: int, courts: int, limit: int, gpp: int, seeds,
+                       workers: int, chunk: int = 8, window: int | None = None,
+                       probe: Probe | None = None, weights=None, cand=None,
+                       hist=None):
+    """순차 재시도와 같은 결과(가장 앞 순번의 성공 시드)를 병렬로 찾는다.
+    probe 에는 구간마다 워커가 센 값을 합친다 (취소된 구간은 빠짐)"""
+    found = mp.Value("q", len(seeds))
+    best  = None
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(found,)) as ex:
+        futs = {ex.submit(_restart_chunk, n, courts, limit, gpp,
+                          seeds[i:i + chunk], i, window, probe is not None, weights,
+                          cand, hist): i
+                for i in range(0, len(seeds), chunk)}
+        for f in as_completed(futs):
+            if f.cancelled():
+                continue
+            hit = f.result()
+            if probe is not None:
+                hit, counts = hit
+                probe.merge(counts)
+            if hit is None:
+                continue
+            if best is None or hit[0] < best[0]:
+                best = hit
+                # 이 순번 뒤쪽 구간은 아직 시작 전이면 취소
+                for g, start in futs.items():
+                    if start > best[0]:
+                        g.cancel()
+    return best[1] if best else None
+
+
+def restart_search(n: int, courts: int, limit: int, rng: random.Random,
+                   restarts: int = 3000, gpp: int = GPP, workers: int = 1,
+                   window: int | None = None, probe: Probe | None = None,
+                   weights=None, cand=None, hist=None):
+    """rng 에서 시드 restarts 개를 뽑아 build_once 재시도.
+    처음(시드 순번 기준) 성공한 결과 또는 None"""
+    seeds = [rng.randrange(1 << 30) for _ in range(restarts)]
+    if workers > 1:
+        return _parallel_restarts(n, courts, limit, gpp, seeds, workers, window=window,
+                                  probe=probe, weights=weights, cand=cand, hist=hist)
+    for s in seeds:
+        res = build_once(n, courts, limit, random.Random(s), gpp, window=window,
+                         probe=probe, weights=weights, cand=cand, hist=hist)
+        if res:
+            return res
+    return None
+
+
+def generate_schedule(n: int, courts: int | None = None,
+                      restart_base: int = 3000, workers: int = 1,
+                      seed: int | None = None, gpp: int = GPP,
+                      exact: float | None = None, probe: Probe | None = None,
+                      weights=None, design: bool = True, cand=None, hist=None):
+    """기본 한도(limit_by_n)로 재시도 → 실패하면 한도 3으로 완화.
+    courts 기본값은 ⌊n/4⌋. workers>1 이면 프로세스 풀 병렬(0/None = CPU 수).
+    seed 를 고정하면 workers 와 무관하게 같은 결과를 돌려준다.
+    LARGE(32)명 초과는 후보 창 WINDOW 모드로 돌린다 (한도·경기 수 보장은 같음).
+    exact(초) 를 주면 기본 한도 재시도가 실패한 뒤 solve_exact 로 한 번 더 본다:
+    해가 있으면 그대로, 불가능 · 시간 초과면 완화. (솔버의 슬롯 규칙은 build_once 보다
+    엄격하고 재시도가 쉽게 푸는 입력에도 시간을 다 쓰기도 해서 재시도 앞에 두지 않는다)
+    probe(instrument.Probe) 를 주면 조합 · 재시도 수와 단계별 시간을 센다
+    (단계 이름: design, limit2, exact, limit3 …).
+    weights=(팀, 상대) 를 주면 같은 팀 중복을 따로 세어 가중 최소로 고르고 나눈다
+    (engine.WEIGHTS = 10 : 1, 완전 탐색 단계는 건너뜀).
+    design=True 면 맨 먼저 designs 카탈로그(순환 · 횡단 설계)를 본다 – 있으면 탐색 없이
+    바로 (seed 로 라벨만 섞음), weights 를 주면 건너뜀.
+    cand 는 후보 예산 – engine.CAND 의 이름("fast", "faster") 또는 (cap, accept).
+    조합을 덜 보는 대신 중복이 조금 늘 수 있다 (한도는 그대로 지킴), 완전 탐색 단계는 건너뜀.
+    hist 는 지난 모임 만남 벌점표 (history.PairHistory.table, 라벨 P1..Pn 순) – 최근에 자주
+    만난 쌍을 뒤로 미룬다. 설계 · 완전 탐색 단계는 건너뛰고 weights 와는 같이 못 씀."""
+    if n < 4:
+        raise ValueError("인원 수는 4명 이상이어야 합니다.")
+    courts = courts or n // 4
+    if not 1 <= courts <= n // 4:
+        raise ValueError("코트 수는 1‑⌊N/4⌋")
+    if n * gpp % 4:
+        raise ValueError(f"총 출전 {n}×{gpp} 가 4의 배수가 아닙니다.")
+    if weights and hist:
+        raise ValueError("weights 와 hist 는 함께 쓸 수 없습니다.")
+
+    base_limit = limit_by_n(n)
+    rng_outer  = random.Random(seed)
+    restarts   = restart_base + int((min(n, LARGE) - 8) * 200) if n > 8 else restart_base
+    workers    = workers or os.cpu_count() or 1
+    window     = WINDOW if n > LARGE else None
+    cand       = CAND[cand] if isinstance(cand, str) else cand
+
+    timed  = probe.timed if probe else lambda name: nullcontext()
+
+    # (D) 조합 설계 카탈로그
+    if design and not weights and not hist:
+        with timed("design"):
+            res = design_schedule(n, courts, gpp, random.Random(seed))
+        if res:
+            return res
+
+    # (A) base_limit 으로 재시도
+    with timed(f"limit{base_limit}"):
+        res = restart_search(n, courts, base_limit, rng_outer, restarts, gpp,
+                             workers, window, probe, weights, cand, hist)
+    if res:
+        return res
+
+    # (E) 완전 탐색 – 재시도가 놓친 기본 한도 해를 마지막으로 찾아 본다
+    if exact and not weights and not cand and not hist:
+        with timed("exact"):
+            res, _ = solve_exact(n, courts, base_limit, gpp, time_limit=exact)
+        if res:
+            return res
+
+    # (B) 8명↑ & base_limit==2 -> 한도 3으로 완화
+    if base_limit == 2:
+        with timed("limit3"):
+            res = restart_search(n, courts, 3, rng_outer, restarts, gpp, workers, window,
+                                 probe, weights, cand, hist)
+        if res:
+            return res
+
+    raise RuntimeError(
+        f"{n}명으로 주어진 조건(중복·동시출전)을 {restarts}회 재시도했으나 "
+        f"충족하는 대진표를 얻지 못했습니다.\n"
+        "- 재시도 횟수를 늘리거나\n"
+        "- 중복 허용 한도를 높여 보세요."
+    )
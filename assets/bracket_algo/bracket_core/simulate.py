@@ -0,0 +1,169 @@
+# bracket_core/simulate.py
+# 화면 없는 이산 사건 시뮬레이터 – 실제 모임 시간 · 코트 유휴 · 선수 대기 추정
+# ───────────────────────────────────────────────────────────
+# GUI 의 simulate_slot / simulate_next_batch 는 root.after 고정 타이머(4‑5초)로
+# 대진을 다시 보여 줄 뿐이다. 여기서는 경기 시간을 분포에서 뽑아
+# "경기 종료" 사건만 힙으로 처리하므로 한 모임이 수십 µs, 몬테카를로 수천 회가 1초 안팎.
+#   mode="slot"  : simulate_slot 과 같음 – 슬롯의 모든 경기가 끝나야 다음 슬롯 시작
+#   mode="batch" : simulate_next_batch 와 같음 – 남은 경기 중 앞에서부터 겹치지 않게
+#                  코트 수만큼 골라 함께 시작, 모두 끝나면 다음 묶음
+#   mode="async" : dispatch.Dispatcher – 코트가 비는 즉시 네 명이 모두 쉬고 있는
+#                  가장 앞 경기를 올린다 (교대 시간은 코트마다)
+# 시간 단위는 분.
+import heapq, math, random
+
+from .dispatch import Dispatcher
+from .slots import greedy_slots
+
+
+# ── 경기 시간 분포 (rng → 분) ──────────────────────────────────
+def fixed(minutes: float):
+    return lambda rng: minutes
+
+
+def uniform(lo: float, hi: float):
+    return lambda rng: rng.uniform(lo, hi)
+
+
+def lognormal(mean: float, sd: float):
+    """평균 · 표준편차로 지정하는 로그정규 (짧은 경기는 드물고 긴 꼬리)"""
+    s2 = math.log(1 + (sd / mean) ** 2)
+    mu, sigma = math.log(mean) - s2 / 2, math.sqrt(s2)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+DEFAULT_DURATION = lognormal(12.0, 3.0)     # 21점 복식 한 게임
+CHANGEOVER = 1.0                            # 묶음(async 는 코트) 교대 시간
+
+
+def _batches(slots, courts: int, mode: str):
+    """시작 묶음 생성기. batch 모드는 남은 경기에서 앞에서부터 다시 채운다"""
+    if mode == "slot":
+        yield from slots
+        return
+    if mode != "batch":
+        raise ValueError(f"알 수 없는 mode: {mode}")
+    pool = [g for s in slots for g in s]
+    while pool:
+        batch, used, rest = [], set(), []
+        for g in pool:
+            ps = set(g[0] + g[1])
+            if len(batch) < courts and not used & ps:
+                batch.append(g); used |= ps
+            else:
+                rest.append(g)
+        pool = rest
+        yield batch
+
+
+def simulate(slots, courts: int | None = None, duration=DEFAULT_DURATION,
+             rng: random.Random | None = None, mode: str = "slot",
+             changeover: float = CHANGEOVER, trace: bool = False):
+    """한 번의 모임을 재생.
+    length        : 마지막 경기가 끝난 시각
+    utilisation   : 코트 사용 시간 합 / (코트 수 × length)
+    wait          : {선수: 마지막 경기를 마칠 때까지 코트 밖에 있던 시간}
+    timeline      : trace=True 면 [(코트, 시작, 끝, 경기), ..]"""
+    rng = rng or random.Random()
+    courts = courts or max(len(s) for s in slots)
+    if mode == "async":
+        return _simulate_async([g for s in slots for g in s], courts, duration,
+                               rng, changeover, trace)
+    play, last = {}, {}
+    busy, timeline = 0.0, []
+    heap, seq, t, end = [], 0, 0.0, 0.0
+
+    for batch in _batches(slots, courts, mode):
+        for c, g in enumerate(batch):
+            d = duration(rng)
+            heapq.heappush(heap, (t + d, seq, d, g)); seq += 1
+            busy += d
+            if trace:
+                timeline.append((c, t, t + d, g))
+        while heap:                          # 묶음의 경기 종료 사건을 시각 순으로
+            end, _, d, g = heapq.heappop(heap)
+            for p in g[0] + g[1]:
+                play[p] = play.get(p, 0.0) + d
+                last[p] = end
+        t = end + changeover
+
+    out = {"length": end,
+           "utilisation": busy / (courts * end) if end else 0.0,
+           "wait": {p: last[p] - play[p] for p in last}}
+    if trace:
+        out["timeline"] = timeline
+    return out
+
+
+def _simulate_async(games, courts, duration, rng, changeover, trace):
+    disp = Dispatcher(games, courts)
+    play, last = {}, {}
+    busy, end, seq = 0.0, 0.0, 0
+    heap = []                               # (시각, 순번, 경기 번호 | -1-코트, 경기 시간)
+
+    def launch(t):
+        nonlocal busy, seq
+        for _, g in disp.start(t):
+            d = duration(rng)
+            heapq.heappush(heap, (t + d, seq, g, d)); seq += 1
+            busy += d
+
+    launch(0.0)
+    while heap:
+        t, _, g, d = heapq.heappop(heap)
+        if g < 0:                           # 교대 끝 → 코트 반납
+            disp.free_court(-1 - g)
+        else:
+            end = t
+            c = disp.finish(g, t, release_court=not changeover)
+            for p in disp.games[g]:
+                play[p] = play.get(p, 0.0) + d
+                last[p] = t
+            if changeover:
+                heapq.heappush(heap, (t + changeover, seq, -1 - c, 0.0)); seq += 1
+        launch(t)
+
+    out = {"length": end,
+           "utilisation": busy / (courts * end) if end else 0.0,
+           "wait": {p: last[p] - play[p] for p in last}}
+    if trace:
+        out["timeline"] = [(c, s, e, games[g]) for c, tl in enumerate(disp.timeline)
+                           for s, e, g in tl]
+    return out
+
+
+def _pct(xs, q: float):
+    return xs[min(len(xs) - 1, int(q * len(xs)))]
+
+
+def monte_carlo(slots, courts: int | None = None, runs: int = 1000,
+                duration=DEFAULT_DURATION, seed: int | None = None,
+                mode: str = "slot", changeover: float = CHANGEOVER):
+    """simulate 를 runs 번 반복한 요약
+    length      : 모임 길이 mean / p50 / p90 / max
+    utilisation : 코트 사용률 평균
+    wait_mean   : 선수 평균 대기 (모든 선수 · 모든 회 평균)
+    wait_max    : 회마다 가장 오래 기다린 선수의 대기, 그 평균"""
+    rng = random.Random(seed)
+    lengths, util, wmean, wmax = [], 0.0, 0.0, 0.0
+    for _ in range(runs):
+        r = simulate(slots, courts, duration, rng, mode, changeover)
+        lengths.append(r["length"]); util += r["utilisation"]
+        w = r["wait"].values()
+        wmean += sum(w) / len(w); wmax += max(w)
+    lengths.sort()
+    return {"runs": runs, "mode": mode,
+            "length": {"mean": round(sum(lengths) / runs, 2),
+                       "p50": round(_pct(lengths, 0.5), 2),
+                       "p90": round(_pct(lengths, 0.9), 2),
+                       "max": round(lengths[-1], 2)},
+            "utilisation": round(util / runs, 3),
+            "wait_mean": round(wmean / runs, 2),
+            "wait_max": round(wmax / runs, 2)}
+
+
+def compare(schedules: dict, courts: int, runs: int = 1000, **kw):
+    """{이름: 평탄한 대진} → {이름: monte_carlo 요약}, 예상 모임 길이 짧은 순"""
+    res = {name: monte_carlo(greedy_slots(games, courts), courts, runs, **kw)
+           for name, games in schedules.items()}
+    return dict(sorted(res.items(), key=lambda kv: kv[1]["length"]["mean"]))
@@ -0,0 +1,117 @@
+# bracket_core/slots.py
+# 평탄한 경기 목록 → 동시 진행 슬롯
+# ───────────────────────────────────────────────────────────
+
+
+def greedy_slots(schedule, courts: int):
+    """경기 순서대로 슬롯을 채우다 선수가 겹치거나 코트가 차면 새 슬롯
+    경기 순서를 그대로 지켜야 할 때. 슬롯 수를 줄이려면 pack_slots"""
+    time_slots, slot, used = [], [], set()
+    for gm in schedule:
+        gset = set(gm[0] + gm[1])
+        if (used & gset) or len(slot) >= courts:
+            time_slots.append(slot); slot, used = [], set()
+        slot.append(gm); used |= gset
+    if slot:
+        time_slots.append(slot)
+    return time_slots
+
+
+# ── 최소 슬롯 배치 ─────────────────────────────────────────
+# 경기 = 정점, 선수가 겹치는 경기 쌍 = 간선, 슬롯 = 크기 ≤ courts 인 독립 집합.
+# 슬롯 수 최소화는 용량 있는 그래프 색칠이다.
+#  ① 하한 LB = max(⌈경기 수 / courts⌉, 한 선수의 경기 수)
+#  ② 휴리스틱 두 가지 중 좋은 것
+#     - 앞에서부터 채우기: 남은 경기를 순서대로 훑어 겹치지 않는 것을 courts 개까지
+#       (greedy_slots 는 첫 충돌에서 슬롯을 닫지만 이쪽은 건너뛰고 계속 본다)
+#     - DSATUR: 놓을 수 없는 슬롯이 가장 많은 경기부터, 들어갈 수 있는 첫 슬롯에
+#  ③ 정확 보정: k = 현재 최선 − 1 부터 LB 까지, 슬롯 k 개에 넣는 DFS
+#     (충돌 많은 경기부터, 빈 슬롯은 하나만 새로 열어 대칭 제거) 를 nodes 안에서
+# 결과 슬롯은 가장 앞 경기 순번 순, 슬롯 안은 원래 순서 – 밤의 흐름을 되도록 유지한다.
+def _masks(schedule):
+    pos = {}
+    for t1, t2 in schedule:
+        for p in t1 + t2:
+            pos.setdefault(p, len(pos))
+    return [sum(1 << pos[p] for p in t1 + t2) for t1, t2 in schedule], len(pos)
+
+
+def _front_fill(masks, courts):
+    left, parts = list(range(len(masks))), []
+    while left:
+        part, used, rest = [], 0, []
+        for g in left:
+            if len(part) < courts and not used & masks[g]:
+                part.append(g); used |= masks[g]
+            else:
+                rest.append(g)
+        parts.append(part); left = rest
+    return parts
+
+
+def _dsatur(masks, conf, courts):
+    G = len(masks)
+    slot_of, parts, used = [-1] * G, [], []
+    blocked = [0] * G                   # 경기 g 가 못 들어가는 슬롯 비트
+    for _ in range(G):
+        g = max((h for h in range(G) if slot_of[h] < 0),
+                key=lambda h: (bin(blocked[h]).count("1"), len(conf[h]), -h))
+        s = next((s for s in range(len(parts))
+                  if not blocked[g] >> s & 1 and len(parts[s]) < courts), len(parts))
+        if s == len(parts):
+            parts.append([]); used.append(0)
+        parts[s].append(g); used[s] |= masks[g]; slot_of[g] = s
+        for h in conf[g]:
+            blocked[h] |= 1 << s
+    return parts
+
+
+def _exact(masks, conf, courts, k, nodes):
+    """슬롯 k 개로 나누기 → parts 또는 None (불가능 · 노드 초과)"""
+    G = len(masks)
+    order = sorted(range(G), key=lambda g: (-len(conf[g]), g))
+    used, size, parts = [0] * k, [0] * k, [[] for _ in range(k)]
+    budget = [nodes]
+
+    def dfs(i, opened):
+        if i == G:
+            return True
+        budget[0] -= 1
+        if budget[0] < 0 or G - i > sum(courts - z for z in size):
+            return False
+        g = order[i]
+        for s in range(min(opened + 1, k)):
+            if size[s] < courts and not used[s] & masks[g]:
+                used[s] |= masks[g]; size[s] += 1; parts[s].append(g)
+                if dfs(i + 1, max(opened, s + 1)):
+                    return True
+                used[s] ^= masks[g]; size[s] -= 1; parts[s].pop()
+        return False
+
+    return [p[:] for p in parts] if dfs(0, 0) else None
+
+
+def pack_slots(schedule, courts: int, nodes: int = 20000):
+    """평탄한 경기 목록 → 슬롯 수가 가장 적은 [[경기, ..], ..] (greedy_slots 와 같은 모양).
+    nodes: 정확 보정 DFS 한 번의 노드 예산 (0 이면 휴리스틱만)"""
+    if not schedule:
+        return []
+    masks, n = _masks(schedule)
+    G = len(masks)
+    conf = [[h for h in range(G) if h != g and masks[g] & masks[h]] for g in range(G)]
+    per = [0] * n
+    for m in masks:
+        for p in range(n):
+            per[p] += m >> p & 1
+    lb = max(-(-G // courts), max(per))
+
+    best = min(_front_fill(masks, courts), _dsatur(masks, conf, courts), key=len)
+    k = len(best) - 1
+    while nodes and k >= lb:
+        parts = _exact(masks, conf, courts, k, nodes)
+        if parts is None:
+            break
+        best, k = parts, k - 1
+
+    best = sorted((sorted(p) for p in best if p), key=lambda p: p[0])
+    return [[schedule[g] for g in p] for p in best]
@@ -0,0 +1,29 @@
+# bracket_core/stats.py
+# 완성된 대진표의 중복 통계 – 계산은 matrix.py 의 배열 행렬 (numpy 는 부를 때만 import)
+# ───────────────────────────────────────────────────────────
+from collections import defaultdict
+
+
+def pair_counts(schedule):
+    """대진표 → {a: {b: 함께 뛴 횟수}} (대칭)"""
+    meeting_count = defaultdict(lambda: defaultdict(int))
+    for team1, team2 in schedule:
+        group = list(team1 + team2)
+        for i in range(len(group)):
+            for j in range(i + 1, len(group)):
+                a, b = group[i], group[j]
+                meeting_count[a][b] += 1
+                meeting_count[b][a] += 1
+    return meeting_count
+
+
+def overlap_stats(schedule):
+    """count_meeting_overlap + sq / hist / per_player (matrix_stats 참고)"""
+    from .matrix import matrix_stats, schedule_matrix
+    return matrix_stats(schedule_matrix(schedule)[0])
+
+
+def count_meeting_overlap(schedule):
+    """한 번이라도 만난 쌍 기준 최대/평균 중복 횟수"""
+    st = overlap_stats(schedule)
+    return {"max": st["max"], "avg": st["avg"], "total_pairs": st["total_pairs"]}
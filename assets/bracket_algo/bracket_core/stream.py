@@ -0,0 +1,100 @@
+# bracket_core/stream.py
+# 슬롯 단위 스트리밍 생성 – 첫 슬롯이 정해지는 즉시 코트에 올린다
+# ───────────────────────────────────────────────────────────
+# build_once 는 마지막 슬롯에서 막히면 앞서 짠 슬롯까지 모두 버리고 처음부터 다시 한다.
+# 여기서는 한 슬롯씩 확정해 내보낸다.
+#  - 확정 조건(lookahead): 현재 상태에서 끝까지 가는 완성안이 하나 이상 있어야 한다.
+#    완성안을 하나 찾으면 그 첫 슬롯을 내보내고 나머지는 "예비 계획" 으로 쥐고 있으므로,
+#    이미 내보낸 슬롯 뒤에서 막히는 일은 없다.
+#  - 다음 슬롯부터는 지금까지 쌓인 상태에서 tries 번 새로 완성해 보고, 예비 계획보다
+#    (최대 중복, 제곱합) 이 좋은 완성안이 있으면 그쪽으로 갈아탄다.
+#  - 첫 슬롯은 기다리지 않는다. 카탈로그 설계(designs)가 있으면 그 대진이 곧 예비 계획.
+#    없으면 빈 상태에서는 어떤 첫 슬롯이든 라벨만 바꾸면 같으므로(모든 쌍 0회) 섞은 선수를
+#    코트 수만큼 4명씩 바로 내보낸다 – build_once 의 첫 슬롯도 늘 꽉 차므로 완성 가능성은 같다.
+#    완성안은 첫 슬롯을 치르는 동안(다음 슬롯을 달라고 할 때) 찾는다.
+#    그때 한도를 다 풀어도 못 찾으면 replan 의 마지막 수단으로 – 내보낸 뒤 막히지 않는다
+import random
+
+from .designs import design_schedule
+from .engine import GPP, add_group, build_from, labels, limit_by_n
+from .search import LARGE, WINDOW
+
+
+def _score(pc):
+    return max(pc), sum(x * x for x in pc)
+
+
+def _forb(n, lim, pc):
+    return [sum(1 << q for q in range(n) if q != p and pc[p * n + q] >= lim) for p in range(n)]
+
+
+def stream_schedule(n: int, courts: int | None = None, limit: int | None = None,
+                    seed: int | None = None, gpp: int = GPP, tries: int = 8,
+                    restarts: int = 3000, design: bool = True):
+    """확정된 슬롯 [(t1, t2), ..] 을 하나씩 내보내는 생성기.
+    첫 슬롯은 탐색 없이 바로 (설계가 있으면 설계의 첫 슬롯).
+    둘째 슬롯부터의 완성안은 기본 한도로 restarts 번 → 한도 3 → replan 의 한도 없는 배치"""
+    if n < 4:
+        raise ValueError("인원 수는 4명 이상이어야 합니다.")
+    courts = courts or n // 4
+    if not 1 <= courts <= n // 4:
+        raise ValueError("코트 수는 1‑⌊N/4⌋")
+    if n * gpp % 4:
+        raise ValueError(f"총 출전 {n}×{gpp} 가 4의 배수가 아닙니다.")
+    limits = [limit] if limit else sorted({limit_by_n(n), 3})
+    window = WINDOW if n > LARGE else None
+    players = labels(n)
+    pos = {p: i for i, p in enumerate(players)}
+    rng = random.Random(seed)
+
+    def complete(lim, remain, pc, forb):
+        r, p2, f2 = remain[:], pc[:], forb[:]
+        res = build_from(players, courts, lim, random.Random(rng.randrange(1 << 30)),
+                         r, p2, f2, True, window)
+        return (_score(p2), res[1]) if res else None
+
+    # ① 첫 슬롯 – 설계 대진 또는 섞은 선수를 그대로
+    remain, pc, forb = [gpp] * n, [0] * (n * n), [0] * n
+    lim = limits[0]
+    res = design_schedule(n, courts, gpp, random.Random(rng.randrange(1 << 30))) \
+        if design else None
+    if res and res[2]["max"] <= lim:
+        plan = ((res[2]["max"], 0), res[1])
+    else:
+        order = players[:]; rng.shuffle(order)
+        plan = (None, [[(tuple(order[i:i + 2]), tuple(order[i + 2:i + 4]))
+                        for i in range(0, 4 * min(courts, n * gpp // 4), 4)]])
+    played = []
+
+    # ② 슬롯 확정 → 내보내기 → 남은 상태에서 (첫 완성안 또는) 더 나은 완성안 탐색
+    while True:
+        slot = plan[1][0]
+        for t1, t2 in slot:
+            g = tuple(pos[p] for p in t1 + t2)
+            for p in g:
+                remain[p] -= 1
+            add_group(g, n, pc, forb, lim)
+        plan = (plan[0], plan[1][1:])
+        played.append(slot)
+        yield slot
+        if not any(remain):
+            return
+        if not plan[1]:                     # 첫 슬롯 뒤 – 한도를 단계적으로
+            for lim in limits:
+                forb = _forb(n, lim, pc)
+                plan = next((p for p in (complete(lim, remain, pc, forb)
+                                         for _ in range(restarts)) if p), None)
+                if plan:
+                    break
+            if not plan:
+                from .replan import replan
+                rest, info = replan(played, players, courts, limits[-1], gpp,
+                                    rng.randrange(1 << 30))
+                lim = info["limit"]
+                forb = _forb(n, lim, pc)
+                plan = ((info["max"], 0), rest)
+                continue
+        for _ in range(tries):
+            alt = complete(lim, remain, pc, forb)
+            if alt and alt[0] < plan[0]:
+                plan = alt
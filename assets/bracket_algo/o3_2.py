@@ -8,9 +8,10 @@ from tkinter import messagebox
 import random, math
 from itertools import combinations
 from collections import defaultdict
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from bracket_core.heatmap import overlap_frame
+from bracket_core.stats import count_meeting_overlap
 
 # ──────────────────────────────────────────
 # 1. 슬롯‑우선 배드민턴 대진표 알고리즘
@@ -86,36 +87,11 @@ def generate_slot_first_schedule(num_players,
 # ──────────────────────────────────────────
 # 2. 통계 & 히트맵 유틸
 # ──────────────────────────────────────────
-def count_meeting_overlap(schedule):
-    meet = defaultdict(lambda: defaultdict(int))
-    for t1, t2 in schedule:
-        group = list(t1+t2)
-        for i in range(len(group)):
-            for j in range(i+1,len(group)):
-                a,b = group[i], group[j]
-                meet[a][b]+=1; meet[b][a]+=1
-    vals=[v for d in meet.values() for v in d.values()]
-    return {"max": max(vals), "avg": round(sum(vals)/len(vals),2),
-            "total_pairs": len(vals)}
-
 def show_heatmap(schedule):
     if not schedule:
         messagebox.showinfo("알림","먼저 대진표를 생성하세요.")
         return
-    meet = defaultdict(lambda: defaultdict(int))
-    players=set()
-    for t1,t2 in schedule:
-        group=list(t1+t2)
-        players.update(group)
-        for i in range(len(group)):
-            for j in range(i+1,len(group)):
-                a,b=group[i],group[j]
-                meet[a][b]+=1; meet[b][a]+=1
-    players=sorted(players)
-    df=pd.DataFrame(0,index=players,columns=players)
-    for a in players:
-        for b in players:
-            if a!=b: df.loc[a,b]=meet[a][b]
+    df=overlap_frame(schedule)
     plt.figure(figsize=(8,6))
     sns.heatmap(df,annot=True,cmap="YlGnBu",fmt="d",cbar=True)
     plt.title("플레이어 간 중복 매칭 히트맵")
@@ -5,9 +5,10 @@ from itertools import combinations
 from collections import defaultdict
 import tkinter as tk
 from tkinter import messagebox
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from bracket_core.heatmap import overlap_frame
+from bracket_core.slots import pack_slots
 
 # ──────────────────────────────────────────────────────────
 # 1. '1인당 4게임' 완전 스케줄러
@@ -61,13 +62,8 @@ def generate_complete_schedule(num_players: int,
             remain_games[p] -= 1
 
     # 슬롯 재구성
-    time_slots, slot, used = [], [], set()
-    for gm in schedule:
-        gset = set(gm[0] + gm[1])
-        if (used & gset) or len(slot) >= max_parallel:
-            time_slots.append(slot); slot, used = [], set()
-        slot.append(gm); used |= gset
-    if slot: time_slots.append(slot)
+    time_slots = pack_slots(schedule, max_parallel)
+    schedule = [g for s in time_slots for g in s]   # 경기 목록도 슬롯 진행 순서로
 
     # 통계
     vals = [v for d in pair_cnt.values() for v in d.values()]
@@ -83,18 +79,7 @@ def show_heatmap(schedule):
     if not schedule:
         messagebox.showinfo("알림","먼저 대진표를 생성하세요.")
         return
-    pair = defaultdict(lambda: defaultdict(int))
-    all_p=set()
-    for t1,t2 in schedule:
-        g=list(t1+t2); all_p.update(g)
-        for i in range(4):
-            for j in range(i+1,4):
-                a,b=g[i],g[j]; pair[a][b]+=1; pair[b][a]+=1
-    all_p=sorted(all_p)
-    df=pd.DataFrame(0,index=all_p,columns=all_p)
-    for a in all_p:
-        for b in all_p:
-            if a!=b: df.loc[a,b]=pair[a][b]
+    df=overlap_frame(schedule)
     plt.figure(figsize=(8,6))
     sns.heatmap(df,annot=True,cmap='YlGnBu',fmt='d',cbar=True)
     plt.title("플레이어 간 중복 히트맵"); plt.tight_layout(); plt.show()
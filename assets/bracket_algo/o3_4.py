@@ -6,9 +6,10 @@ from itertools import combinations
 from collections import defaultdict
 import tkinter as tk
 from tkinter import messagebox
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from bracket_core.heatmap import overlap_frame
+from bracket_core.slots import pack_slots
 
 # ──────────────────────────────────────────────
 # 1. 1인당 4경기 + ‘최대 2회’ 강제 스케줄러
@@ -81,13 +82,8 @@ def generate_schedule_strict(num_players: int,
 
     # 슬롯 구성
     max_parallel = max(1, num_players // 4)
-    slots, slot, used = [], [], set()
-    for gm in schedule:
-        gset = set(gm[0] + gm[1])
-        if (used & gset) or len(slot) >= max_parallel:
-            slots.append(slot); slot, used = [], set()
-        slot.append(gm); used |= gset
-    if slot: slots.append(slot)
+    slots = pack_slots(schedule, max_parallel)
+    schedule = [g for s in slots for g in s]   # 경기 목록도 슬롯 진행 순서로
 
     # 통계
     vals = [v for d in pair_cnt.values() for v in d.values()]
@@ -101,18 +97,7 @@ def generate_schedule_strict(num_players: int,
 def show_heatmap(schedule):
     if not schedule:
         messagebox.showinfo("알림","먼저 대진표를 생성하세요."); return
-    pair = defaultdict(lambda: defaultdict(int))
-    ps=set()
-    for t1,t2 in schedule:
-        g=list(t1+t2); ps.update(g)
-        for i in range(4):
-            for j in range(i+1,4):
-                a,b=g[i],g[j]; pair[a][b]+=1; pair[b][a]+=1
-    ps=sorted(ps)
-    df=pd.DataFrame(0,index=ps,columns=ps)
-    for a in ps:
-        for b in ps:
-            if a!=b: df.loc[a,b]=pair[a][b]
+    df=overlap_frame(schedule)
     plt.figure(figsize=(8,6))
     sns.heatmap(df,annot=True,cmap='YlGnBu',fmt='d',cbar=True)
     plt.title("플레이어 간 중복 히트맵"); plt.tight_layout(); plt.show()
@@ -6,9 +6,10 @@ from itertools import combinations
 from collections import defaultdict
 import tkinter as tk
 from tkinter import messagebox
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from bracket_core.heatmap import overlap_frame
+from bracket_core.slots import pack_slots
 
 # ────────────────────────────── 1) 한 번 시도해 스케줄 만들기
 def _try_schedule(n, games_per, pair_limit, rng):
@@ -73,13 +74,8 @@ def make_schedule(n, games_per=4, max_retry=3000):
 
     # 슬롯 묶기
     max_parallel = max(1, n//4)
-    slots, slot, used = [], [], set()
-    for g in schedule:
-        gset=set(g[0]+g[1])
-        if (used & gset) or len(slot)>=max_parallel:
-            slots.append(slot); slot, used = [], set()
-        slot.append(g); used |= gset
-    if slot: slots.append(slot)
+    slots = pack_slots(schedule, max_parallel)
+    schedule = [g for s in slots for g in s]   # 경기 목록도 슬롯 진행 순서로
 
     vals=[v for d in pair_cnt.values() for v in d.values()]
     stats={"max":max(vals),"avg":round(sum(vals)/len(vals),2),"limit":used_limit}
@@ -90,18 +86,7 @@ def make_schedule(n, games_per=4, max_retry=3000):
 def show_heatmap(schedule):
     if not schedule:
         messagebox.showinfo("알림","먼저 대진표를 생성하세요."); return
-    pair=defaultdict(lambda:defaultdict(int))
-    ps=set()
-    for t1,t2 in schedule:
-        g=list(t1+t2); ps.update(g)
-        for i in range(4):
-            for j in range(i+1,4):
-                a,b=g[i],g[j]; pair[a][b]+=1; pair[b][a]+=1
-    ps=sorted(ps)
-    df=pd.DataFrame(0,index=ps,columns=ps)
-    for a in ps:
-        for b in ps:
-            if a!=b: df.loc[a,b]=pair[a][b]
+    df=overlap_frame(schedule)
     plt.figure(figsize=(8,6))
     sns.heatmap(df,annot=True,cmap='YlGnBu',fmt='d',cbar=True)
     plt.title("플레이어 간 중복 히트맵"); plt.tight_layout(); plt.show()
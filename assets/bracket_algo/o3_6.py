@@ -1,12 +1,11 @@
 # ── pip install matplotlib seaborn pandas ─────────────────────────
 import random, math
-from itertools import combinations
-from collections import defaultdict
+from bracket_core.engine import build_once
 import tkinter as tk
 from tkinter import messagebox
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from bracket_core.heatmap import overlap_frame
 # ───────────────────────────────────────────────────────────────────
 GAMES_PER_PLAYER = 4                 # 1인당 반드시 4경기
 
@@ -17,61 +16,9 @@ def limit_of(n: int) -> int:
 # ───────────────────────────────────────────────────────────────────
 # 1. 슬롯‑우선 스케줄을 *한 번* 만들어 본다
 def _build_once(n: int, pair_limit: int, rng: random.Random):
-    max_parallel = max(1, n // 4)
-    players      = [f"P{i+1}" for i in range(n)]
-    remain       = {p: GAMES_PER_PLAYER for p in players}
-    pair_cnt     = defaultdict(lambda: defaultdict(int))
-    schedule, slots = [], []
-
-    while any(remain[p] > 0 for p in players):
-        used, slot = set(), []
-
-        # 슬롯 안에서 최대한 채운다
-        while len(slot) < max_parallel:
-            cands = [p for p in players if remain[p] > 0 and p not in used]
-            if len(cands) < 4:
-                break
-
-            # 후보 4명 조합 중 “중복 점수 + 잔여 경기” 기준 최적
-            best, best_key = None, None
-            rng.shuffle(cands)
-            for g in combinations(cands, 4):
-                if any(pair_cnt[a][b] >= pair_limit
-                       for a, b in combinations(g, 2)):
-                    continue
-                overlap = sum(pair_cnt[a][b] for a, b in combinations(g, 2))
-                needsum = -sum(remain[p] for p in g)          # 많을수록 우선
-                key     = (overlap, needsum)
-                if best_key is None or key < best_key:
-                    best, best_key = g, key
-            if best is None:
-                break
-
-            # 팀 2 : 2 분배
-            lst = list(best); rng.shuffle(lst)
-            slot.append((tuple(lst[:2]), tuple(lst[2:])))
-            used.update(best)
-
-            # 상태 업데이트
-            for a, b in combinations(best, 2):
-                pair_cnt[a][b] += 1; pair_cnt[b][a] += 1
-            for p in best:
-                remain[p] -= 1
-
-        if not slot:           # 한 팀도 못 넣었다 → 실패
-            return None
-
-        slots.append(slot)
-        schedule.extend(slot)
-
-    # 통계
-    vals = [v for d in pair_cnt.values() for v in d.values()]
-    stats = {
-        "max": max(vals),
-        "avg": round(sum(vals) / len(vals), 2),
-        "limit": pair_limit,
-    }
-    return schedule, slots, stats, players
+    # 정수·비트마스크 엔진(bracket_core.engine)으로 위임 – 결과는 기존과 동일
+    return build_once(n, max(1, n // 4), pair_limit, rng,
+                      GAMES_PER_PLAYER, strict=False)
 
 # ───────────────────────────────────────────────────────────────────
 # 2. 인원‑규칙을 적용해 “완전한” 스케줄 찾기
@@ -102,16 +49,7 @@ def generate_schedule(n: int, max_retry: int = 3000):
 def heatmap(schedule):
     if not schedule:
         messagebox.showinfo("알림", "먼저 대진표를 생성하세요."); return
-    pair = defaultdict(lambda: defaultdict(int)); ps = set()
-    for t1,t2 in schedule:
-        g = list(t1+t2); ps.update(g)
-        for a, b in combinations(g, 2):
-            pair[a][b] += 1; pair[b][a] += 1
-    ps = sorted(ps)
-    df = pd.DataFrame(0, index=ps, columns=ps)
-    for a in ps:
-        for b in ps:
-            if a != b: df.loc[a, b] = pair[a][b]
+    df = overlap_frame(schedule)
     plt.figure(figsize=(8, 6))
     sns.heatmap(df, annot=True, cmap="YlGnBu", fmt="d", cbar=True)
     plt.title("플레이어 간 중복 히트맵"); plt.tight_layout(); plt.show()
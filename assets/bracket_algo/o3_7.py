@@ -2,11 +2,11 @@
 # pip install matplotlib seaborn pandas
 # ─────────────────────────────────────────────────────────
 import random, math
-from itertools import combinations
-from collections import defaultdict
+from bracket_core.engine import build_once
 import tkinter as tk
 from tkinter import messagebox
-import pandas as pd, matplotlib.pyplot as plt, seaborn as sns
+import matplotlib.pyplot as plt, seaborn as sns
+from bracket_core.heatmap import overlap_frame
 
 GPP = 4   # games per player
 
@@ -15,47 +15,8 @@ def limit_of(n:int)->int:       # 인원수별 기본 중복 한도
 
 # ────────────────── 1) 슬롯‑우선 스케줄 한 번 생성
 def _build_once(n:int, limit:int, rng:random.Random):
-    players=[f"P{i+1}" for i in range(n)]
-    remain={p:GPP for p in players}
-    pair=defaultdict(lambda:defaultdict(int))
-    schedule=[]; slots=[]
-    max_par=n//4
-
-    while any(remain[p]>0 for p in players):
-        used=set(); slot=[]
-        while len(slot)<max_par:
-            cands=[p for p in players if remain[p]>0 and p not in used]
-            if len(cands)<4: break          # 더 채울 수 없음
-            best=None; best_key=None
-            rng.shuffle(cands)
-            for g in combinations(cands,4):
-                if any(pair[a][b]>=limit for a,b in combinations(g,2)):
-                    continue
-                overlap=sum(pair[a][b] for a,b in combinations(g,2))
-                needs=-sum(remain[p] for p in g)   # 남은 경기 많은 쪽 우선
-                key=(overlap,needs)
-                if best_key is None or key<best_key:
-                    best,best_key=g,key
-            if best is None: break          # 이번 슬롯 더 못 채움
-            lst=list(best); rng.shuffle(lst)
-            slot.append((tuple(lst[:2]),tuple(lst[2:])))
-            used|=set(best)
-            for p in best: remain[p]-=1
-            for a,b in combinations(best,2):
-                pair[a][b]+=1; pair[b][a]+=1
-
-        # ── 동시 출전 보장 검사 ──
-        remain_games=sum(remain.values())
-        games_left=remain_games//4
-        must_fill=max_par if games_left>=max_par else games_left
-        if len(slot)<must_fill:           # 규정만큼 못 채웠으면 실패
-            return None
-
-        slots.append(slot); schedule.extend(slot)
-
-    vals=[v for d in pair.values() for v in d.values()]
-    stats={"max":max(vals),"avg":round(sum(vals)/len(vals),2),"limit":limit}
-    return schedule,slots,stats,players
+    # 정수·비트마스크 엔진(bracket_core.engine)으로 위임 – 결과는 기존과 동일
+    return build_once(n, n//4, limit, rng, GPP)
 
 # ────────────────── 2) 완전 스케줄 찾기(재시도 + 한도 완화)
 def generate_schedule(n:int,maxRetry:int=3000):
@@ -75,14 +36,7 @@ def generate_schedule(n:int,maxRetry:int=3000):
 # ────────────────── 3) 히트맵
 def heatmap(schedule):
     if not schedule: messagebox.showinfo("알림","먼저 대진표를 생성");return
-    pc=defaultdict(lambda:defaultdict(int)); ps=set()
-    for t1,t2 in schedule:
-        g=list(t1+t2); ps|=set(g)
-        for a,b in combinations(g,2): pc[a][b]+=1; pc[b][a]+=1
-    ps=sorted(ps); df=pd.DataFrame(0,index=ps,columns=ps)
-    for a in ps:
-        for b in ps:
-            if a!=b: df.loc[a,b]=pc[a][b]
+    df=overlap_frame(schedule)
     plt.figure(figsize=(8,6))
     sns.heatmap(df,annot=True,cmap="YlGnBu",fmt="d",cbar=True)
     plt.tight_layout(); plt.show()
@@ -1,11 +1,11 @@
 # badminton_gui_court_param.py
 # pip install matplotlib seaborn pandas
 import random
-from itertools import combinations
-from collections import defaultdict
+from bracket_core.engine import build_once
 import tkinter as tk
 from tkinter import messagebox
-import pandas as pd, matplotlib.pyplot as plt, seaborn as sns
+import matplotlib.pyplot as plt, seaborn as sns
+from bracket_core.heatmap import overlap_frame
 
 GPP = 4  # games per player
 
@@ -15,46 +15,8 @@ def limit_by_n(n):            # 기본 중복 한도
 # ────────────────────────────────────────────────
 def _build_once(n, courts, limit, rng):
     """주어진 ‘코트 수(courts)’ 로 한 번 스케줄 생성. 실패 시 None"""
-    pl = [f"P{i+1}" for i in range(n)]
-    remain = {p: GPP for p in pl}
-    pair   = defaultdict(lambda: defaultdict(int))
-    schedule, slots = [], []
-
-    while any(remain[p] > 0 for p in pl):
-        used, slot = set(), []
-        while len(slot) < courts:
-            cand = [p for p in pl if remain[p] > 0 and p not in used]
-            if len(cand) < 4: break
-
-            best, best_key = None, None
-            rng.shuffle(cand)
-            for g in combinations(cand, 4):
-                if any(pair[a][b] >= limit for a, b in combinations(g, 2)):
-                    continue
-                overlap = sum(pair[a][b] for a, b in combinations(g, 2))
-                need    = -sum(remain[p] for p in g)
-                key     = (overlap, need)
-                if best_key is None or key < best_key:
-                    best, best_key = g, key
-            if best is None: break
-
-            lst=list(best); rng.shuffle(lst)
-            slot.append((tuple(lst[:2]), tuple(lst[2:])))
-            used |= set(best)
-            for a, b in combinations(best, 2):
-                pair[a][b] += 1; pair[b][a] += 1
-            for p in best: remain[p] -= 1
-
-        # 슬롯이 채워져야 하는 최소 경기 수 = min(courts, 남은_경기/4)
-        need_games = min(courts, sum(remain.values()) // 4)
-        if len(slot) < need_games:          # 못 채움 → 실패
-            return None
-
-        slots.append(slot); schedule += slot
-
-    vals=[v for d in pair.values() for v in d.values()]
-    stats={"max":max(vals),"avg":round(sum(vals)/len(vals),2),"limit":limit}
-    return schedule, slots, stats, pl
+    # 정수·비트마스크 엔진(bracket_core.engine)으로 위임
+    return build_once(n, courts, limit, rng, GPP)
 
 def generate_schedule(n, courts, restart=3000):
     if not 4 <= n <= 32:     raise ValueError("인원 4‑32")
@@ -78,14 +40,7 @@ def generate_schedule(n, courts, restart=3000):
 # ────────────────────────────────────────────────
 def heatmap(sched):
     if not sched: messagebox.showinfo("알림","대진표 먼저"); return
-    pc=defaultdict(lambda:defaultdict(int)); ps=set()
-    for t1,t2 in sched:
-        g=list(t1+t2); ps|=set(g)
-        for a,b in combinations(g,2): pc[a][b]+=1; pc[b][a]+=1
-    ps=sorted(ps); df=pd.DataFrame(0,index=ps,columns=ps)
-    for a in ps:
-        for b in ps:
-            if a!=b: df.loc[a,b]=pc[a][b]
+    df=overlap_frame(sched)
     plt.figure(figsize=(8,6))
     sns.heatmap(df,annot=True,cmap="YlGnBu",fmt="d",cbar=True)
     plt.tight_layout(); plt.show()
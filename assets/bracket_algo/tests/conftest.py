@@ -0,0 +1,5 @@
+# tests/conftest.py
+# bracket_core 를 설치 없이 import – 어느 디렉터리에서 pytest 를 돌려도
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
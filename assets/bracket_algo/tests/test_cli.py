@@ -0,0 +1,42 @@
+# tests/test_cli.py
+import json
+
+import pytest
+
+from bracket_core.cli import main
+
+
+def _run(capsys, *argv):
+    main(list(argv))
+    return capsys.readouterr().out
+
+
+def test_generate_json_shape(capsys):
+    out = json.loads(_run(capsys, "generate", "-n", "10", "--seed", "1"))
+    assert set(out) == {"players", "stats", "slots"}
+    assert out["players"] == [f"P{i+1}" for i in range(10)]
+    assert {"max", "avg", "limit"} <= set(out["stats"])
+    for s in out["slots"]:
+        assert 1 <= len(s) <= 2
+        for t1, t2 in s:
+            assert len(t1) == len(t2) == 2
+    assert out == json.loads(_run(capsys, "generate", "-n", "10", "--seed", "1"))
+
+
+def test_generate_names(capsys):
+    names = "가,나,다,라,마,바,사,아"
+    out = json.loads(_run(capsys, "generate", "--names", names, "--seed", "2"))
+    assert out["players"] == names.split(",")
+    assert {p for s in out["slots"] for g in s for t in g for p in t} == set(names.split(","))
+
+
+def test_stream_json_lines(capsys):
+    lines = _run(capsys, "generate", "-n", "12", "--seed", "0", "--stream").splitlines()
+    rows = [json.loads(l) for l in lines]
+    assert [r["slot"] for r in rows] == list(range(1, len(rows) + 1))
+    assert sum(len(r["games"]) for r in rows) == 12
+
+
+def test_history_rejected_with_library(capsys, tmp_path):
+    with pytest.raises(SystemExit):
+        main(["generate", "-n", "8", "--history", str(tmp_path / "h"), "--library", str(tmp_path / "l")])
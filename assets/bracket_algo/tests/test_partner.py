@@ -0,0 +1,26 @@
+# tests/test_partner.py
+from collections import Counter
+
+from bracket_core import generate_partner
+
+
+def test_fixed_pairs_and_seed():
+    names = [f"N{i}" for i in range(12)]
+    fixed = [["N0", "N1"], ["N2", "N3"]]
+    matches, info = generate_partner(names, fixed, restart=400, seed=5)
+    assert (matches, info) == generate_partner(names, fixed, restart=400, seed=5)
+    assert (matches, info) == generate_partner(names, fixed, restart=400, seed=5, workers=2)
+
+    games = Counter()
+    for m in matches:
+        ps = [m["playerA"], m["playerC"], m["playerB"], m["playerD"]]
+        assert len(set(ps)) == 4
+        games.update(ps)
+        for a, b in fixed:              # 고정 파트너는 같이 나오면 같은 팀
+            if a in ps and b in ps:
+                assert {a, b} in ({m["playerA"], m["playerC"]}, {m["playerB"], m["playerD"]})
+    assert set(games.values()) == {4} and len(games) == 12
+    for o in {m["ord"] for m in matches}:
+        ps = [p for m in matches if m["ord"] == o
+              for p in (m["playerA"], m["playerC"], m["playerB"], m["playerD"])]
+        assert len(ps) == len(set(ps))
@@ -0,0 +1,35 @@
+# tests/test_replan.py
+from collections import Counter
+
+import pytest
+
+from bracket_core import generate_schedule, replan
+
+
+def _check(played, slots, roster, info, courts):
+    games = Counter(p for s in played for t1, t2 in s for p in t1 + t2 if p in roster)
+    for s in slots:
+        ps = [p for t1, t2 in s for p in t1 + t2]
+        assert len(s) <= courts and len(ps) == len(set(ps)) and set(ps) <= set(roster)
+        games.update(ps)
+    assert all(games[p] >= 4 for p in roster)
+    assert info["games"] == {p: games[p] for p in roster}
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_drop_out_8_to_7_after_two_slots(seed):
+    _, slots, _, players = generate_schedule(8, seed=seed)
+    played = slots[:2]
+    roster = [p for p in players if p != players[seed % 8]]
+    new, info = replan(played, roster, 1, seed=seed, budget=0.05)
+    _check(played, new, roster, info, 1)
+
+
+def test_late_arrival():
+    _, slots, _, players = generate_schedule(12, seed=3)
+    played = slots[:2]
+    roster = players + ["새선수"]
+    new, info = replan(played, roster, 3, seed=3)
+    _check(played, new, roster, info, 3)
+    assert info["games"]["새선수"] >= 4
+    assert info["max"] <= info["limit"]
@@ -0,0 +1,34 @@
+# tests/test_stream.py
+import time
+from collections import Counter
+
+from bracket_core import generate_schedule, stream_schedule
+
+
+def _check(slots, n):
+    games = Counter()
+    for s in slots:
+        ps = [p for t1, t2 in s for p in t1 + t2]
+        assert len(ps) == len(set(ps))
+        games.update(ps)
+    assert len(games) == n and set(games.values()) == {4}
+
+
+def test_first_slot_beats_full_generate():
+    t0 = time.perf_counter()
+    gen = stream_schedule(30, seed=0)
+    first = next(gen)
+    t_first = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    generate_schedule(30, seed=0, design=False)
+    t_full = time.perf_counter() - t0
+
+    assert len(first) == 30 // 4
+    assert t_first < t_full
+    _check([first] + list(gen), 30)
+
+
+def test_stream_complete_and_valid():
+    for n in (8, 9, 13, 16, 24):
+        _check(list(stream_schedule(n, seed=1)), n)